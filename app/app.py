@@ -3,13 +3,26 @@ import logging
 from flask import Flask
 
 from app.main.config.app_config import app_config
+from app.main.config.assets_config import configure_assets
+from app.main.config.background_tasks_config import configure_background_tasks
 from app.main.config.cors_config import configure_cors
 from app.main.config.error_handlers_config import configure_error_handlers
-from app.main.config.jinja_config import configure_jinja
+from app.main.config.fast_path_config import configure_fast_path
+from app.main.config.health_config import configure_health
+from app.main.config.invitation_outbox_config import configure_invitation_outbox
+from app.main.config.jinja_config import configure_jinja, warm_up_templates
 from app.main.config.limiter_config import configure_limiter
-from app.main.config.logging_config import configure_logging
+from app.main.config.logging_config import (
+    configure_logging_from_app_config,
+    configure_request_logging,
+)
+from app.main.config.metrics_config import configure_metrics
+from app.main.config.page_cache_config import configure_page_cache
+from app.main.config.profiling_config import configure_profiling
+from app.main.config.proxy_config import configure_proxy
 from app.main.config.routes_config import configure_routes
 from app.main.config.sentry_config import configure_sentry
+from app.main.config.session_config import configure_session
 from app.main.services.auth0_service import Auth0_Service
 from app.main.services.github_service import GithubService
 
@@ -17,17 +30,23 @@ logger = logging.getLogger(__name__)
 
 
 def create_app(
-    github_service=GithubService(app_config.github.token), is_rate_limit_enabled=True
+    github_service=None,
+    is_rate_limit_enabled=True,
+    is_background_tasks_enabled=True,
 ) -> Flask:
-    configure_logging(app_config.logging_level)
+    configure_logging_from_app_config()
 
     logger.info("Starting app...")
 
     app = Flask(__name__, static_folder="static", static_url_path="/assets")
 
     app.secret_key = app_config.flask.app_secret_key
+    configure_session(app)
 
-    app.github_service = github_service
+    configure_proxy(app, app_config.rate_limit.trusted_proxy_count)
+
+    # Built here rather than as the default argument, so importing this module stays cheap
+    app.github_service = github_service or GithubService(app_config.github.token)
     app.auth0_service = Auth0_Service(
         app,
         app_config.auth0.client_id,
@@ -35,13 +54,34 @@ def create_app(
         app_config.auth0.domain,
     )
 
+    configure_invitation_outbox(app)
+    configure_health(app)
     configure_routes(app)
+    fast_path = configure_fast_path(app)
+    configure_metrics(app)
+    if app_config.logging.format == "json":
+        configure_request_logging(app)
     configure_error_handlers(app)
-    configure_sentry(app_config.sentry.dsn_key, app_config.sentry.environment)
+    configure_sentry(
+        app_config.sentry.dsn_key,
+        app_config.sentry.environment,
+        fast_path,
+        app_config.sentry.traces_sample_rate,
+        app_config.sentry.route_traces_sample_rates,
+    )
     configure_limiter(app, is_rate_limit_enabled)
     configure_jinja(app)
+    configure_assets(app)
+    configure_page_cache(app)
+    if app_config.jinja.warm_up_templates:
+        warm_up_templates(app)
     configure_cors(app)
 
+    if is_background_tasks_enabled:
+        configure_background_tasks(app)
+
+    configure_profiling(app)
+
     logger.info("Running app...")
 
     return app
@@ -0,0 +1,16 @@
+import os
+
+from app.main.config.app_config import app_config
+from app.main.config.logging_config import configure_logging
+from app.main.services.asset_service import build_assets
+
+
+# Asset build entry point - run while building the `Dockerfile` to fingerprint and precompress
+# `app/static` into `app/static/dist`, which `asset_url()` then links to
+def run_build_assets():
+    configure_logging(app_config.logging_level)
+    build_assets(os.path.join(os.path.dirname(__file__), "static"))
+
+
+if __name__ == "__main__":
+    run_build_assets()
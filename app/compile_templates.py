@@ -0,0 +1,20 @@
+from flask import Flask
+
+from app.main.config.app_config import app_config
+from app.main.config.jinja_config import configure_jinja, warm_up_templates
+from app.main.config.logging_config import configure_logging
+
+
+# Template compilation entry point - run while building the `Dockerfile` to fill the Jinja
+# bytecode cache at `JINJA_BYTECODE_CACHE_DIR` so workers load compiled templates from it
+def compile_templates():
+    configure_logging(app_config.logging_level)
+    if not app_config.jinja.bytecode_cache_directory:
+        raise SystemExit("JINJA_BYTECODE_CACHE_DIR must be set to compile templates")
+    app = Flask("app")
+    configure_jinja(app)
+    warm_up_templates(app)
+
+
+if __name__ == "__main__":
+    compile_templates()
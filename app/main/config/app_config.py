@@ -18,11 +18,45 @@ def __get_env_var_as_boolean(name: str) -> bool | None:
     return False
 
 
+def __get_env_var_as_int(name: str, default: int) -> int:
+    value = __get_env_var(name)
+
+    if value is None or not value.strip().isdigit():
+        return default
+
+    return int(value)
+
+
+def __get_env_var_as_float(name: str, default: float) -> float:
+    value = __get_env_var(name)
+
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def __get_env_var_as_rates(name: str, defaults: dict[str, float]) -> dict[str, float]:
+    """``defaults`` updated from ``name=rate`` pairs separated by commas."""
+    rates = dict(defaults)
+    for pair in (__get_env_var(name) or "").split(","):
+        endpoint, _, rate = pair.partition("=")
+        try:
+            rates[endpoint.strip()] = float(rate)
+        except ValueError:
+            continue
+    return rates
+
+
 app_config = SimpleNamespace(
     auth0=SimpleNamespace(
         domain=__get_env_var("AUTH0_DOMAIN"),
         client_id=__get_env_var("AUTH0_CLIENT_ID"),
         client_secret=__get_env_var("AUTH0_CLIENT_SECRET"),
+        metadata_ttl_seconds=__get_env_var_as_int("AUTH0_METADATA_TTL_SECONDS", 3600),
+        metadata_max_stale_seconds=__get_env_var_as_int(
+            "AUTH0_METADATA_MAX_STALE_SECONDS", 86400
+        ),
     ),
     flask=SimpleNamespace(
         app_secret_key=__get_env_var("APP_SECRET_KEY"),
@@ -30,6 +64,23 @@ app_config = SimpleNamespace(
     github=SimpleNamespace(
         send_email_invites_is_enabled=__get_env_var_as_boolean("SEND_EMAIL_INVITES"),
         token=__get_env_var("ADMIN_GITHUB_TOKEN"),
+        # Point at a stand-in such as `python -m benchmarks.fake_github` for load tests
+        api_base_url=(__get_env_var("GITHUB_API_BASE_URL") or "https://api.github.com").rstrip("/"),
+        invite_max_workers=__get_env_var_as_int("GITHUB_INVITE_MAX_WORKERS", 3),
+        # Budgets for the whole token, shared by every worker and pod that uses
+        # the same RATE_LIMIT_STORAGE_URI; with memory:// each worker has its own
+        rate_limit=SimpleNamespace(
+            requests_per_minute=__get_env_var_as_int(
+                "GITHUB_REQUESTS_PER_MINUTE", 80
+            ),
+            daily_invitation_limit=__get_env_var_as_int(
+                "GITHUB_DAILY_INVITATION_LIMIT", 500
+            ),
+            max_wait_seconds=__get_env_var_as_int("GITHUB_RATE_LIMIT_MAX_WAIT", 5),
+            low_quota_threshold=__get_env_var_as_int(
+                "GITHUB_LOW_QUOTA_THRESHOLD", 10
+            ),
+        ),
         allowed_email_domains=[
             "digital.justice.gov.uk",
             "justice.gov.uk",
@@ -42,6 +93,7 @@ app_config = SimpleNamespace(
             "sentencingcouncil.gov.uk",
             "yjb.gov.uk",
         ],
+        digital_justice_email_domains=["digital.justice.gov.uk"],
         organisations=[
             SimpleNamespace(
                 name="ministryofjustice",
@@ -59,10 +111,124 @@ app_config = SimpleNamespace(
                 display_text="Ministry of Justice Test Organisation",
             ),
         ],
+        organisation_flags_set=any(
+            __get_env_var(name) is not None
+            for name in ("MOJ_ORG_ENABLED", "MOJ_AS_ORG_ENABLED", "MOJ_TEST_ORG_ENABLED")
+        ),
+        organisations_file=__get_env_var("GITHUB_ORGANISATIONS_FILE"),
+        organisations_reload_seconds=__get_env_var_as_int(
+            "GITHUB_ORGANISATIONS_RELOAD_SECONDS", 10
+        ),
+    ),
+    gunicorn=SimpleNamespace(
+        bind=__get_env_var("GUNICORN_BIND") or "0.0.0.0:4567",
+        worker_class=__get_env_var("GUNICORN_WORKER_CLASS") or "gthread",
+        workers=__get_env_var_as_int("GUNICORN_WORKERS", 0),
+        threads=__get_env_var_as_int("GUNICORN_THREADS", 4),
+        worker_connections=__get_env_var_as_int("GUNICORN_WORKER_CONNECTIONS", 100),
+        preload_app=__get_env_var("GUNICORN_PRELOAD_APP") is None
+        or __get_env_var_as_boolean("GUNICORN_PRELOAD_APP"),
+        max_requests=__get_env_var_as_int("GUNICORN_MAX_REQUESTS", 1000),
+        max_requests_jitter=__get_env_var_as_int("GUNICORN_MAX_REQUESTS_JITTER", 100),
+        timeout=__get_env_var_as_int("GUNICORN_TIMEOUT", 30),
+        graceful_timeout=__get_env_var_as_int("GUNICORN_GRACEFUL_TIMEOUT", 30),
+        keepalive=__get_env_var_as_int("GUNICORN_KEEPALIVE", 5),
+    ),
+    health=SimpleNamespace(
+        readiness_refresh_seconds=__get_env_var_as_int("READINESS_REFRESH_SECONDS", 30),
+        min_github_requests_remaining=__get_env_var_as_int(
+            "READINESS_MIN_GITHUB_REQUESTS_REMAINING", 100
+        ),
+    ),
+    http=SimpleNamespace(
+        pool_connections=__get_env_var_as_int("HTTP_POOL_CONNECTIONS", 4),
+        pool_maxsize=__get_env_var_as_int("HTTP_POOL_MAXSIZE", 10),
+        max_retries=__get_env_var_as_int("HTTP_MAX_RETRIES", 3),
+        backoff_factor=__get_env_var_as_float("HTTP_BACKOFF_FACTOR", 0.2),
+        backoff_jitter=__get_env_var_as_float("HTTP_BACKOFF_JITTER", 0.2),
+        backoff_max=__get_env_var_as_float("HTTP_BACKOFF_MAX", 5),
+        prewarm_connections=__get_env_var_as_boolean("HTTP_PREWARM_CONNECTIONS"),
+        timeouts=SimpleNamespace(
+            github_invite=(
+                __get_env_var_as_float("HTTP_CONNECT_TIMEOUT", 3.05),
+                __get_env_var_as_float("GITHUB_INVITE_READ_TIMEOUT", 10),
+            ),
+            auth0_metadata=(
+                __get_env_var_as_float("HTTP_CONNECT_TIMEOUT", 3.05),
+                __get_env_var_as_float("AUTH0_METADATA_READ_TIMEOUT", 5),
+            ),
+            auth0_token=(
+                __get_env_var_as_float("HTTP_CONNECT_TIMEOUT", 3.05),
+                __get_env_var_as_float("AUTH0_TOKEN_READ_TIMEOUT", 10),
+            ),
+            readiness_check=(
+                __get_env_var_as_float("HTTP_CONNECT_TIMEOUT", 3.05),
+                __get_env_var_as_float("READINESS_CHECK_READ_TIMEOUT", 5),
+            ),
+            prewarm=(
+                __get_env_var_as_float("HTTP_CONNECT_TIMEOUT", 3.05),
+                __get_env_var_as_float("HTTP_PREWARM_READ_TIMEOUT", 2),
+            ),
+        ),
+    ),
+    invitation_outbox=SimpleNamespace(
+        enabled=__get_env_var_as_boolean("INVITATION_OUTBOX_ENABLED"),
+        database_path=__get_env_var("INVITATION_OUTBOX_DATABASE_PATH"),
+        run_worker_in_process=__get_env_var_as_boolean(
+            "INVITATION_OUTBOX_IN_PROCESS_WORKER"
+        ),
+        max_attempts=__get_env_var_as_int("INVITATION_OUTBOX_MAX_ATTEMPTS", 5),
+        backoff_seconds=__get_env_var_as_int("INVITATION_OUTBOX_BACKOFF_SECONDS", 5),
+        max_backoff_seconds=__get_env_var_as_int(
+            "INVITATION_OUTBOX_MAX_BACKOFF_SECONDS", 300
+        ),
+        poll_interval_seconds=__get_env_var_as_int(
+            "INVITATION_OUTBOX_POLL_INTERVAL_SECONDS", 1
+        ),
+    ),
+    jinja=SimpleNamespace(
+        bytecode_cache_directory=__get_env_var("JINJA_BYTECODE_CACHE_DIR"),
+        warm_up_templates=__get_env_var_as_boolean("JINJA_WARM_UP_TEMPLATES"),
+    ),
+    logging=SimpleNamespace(
+        # "text" for people, "json" for the log platform
+        format=(__get_env_var("LOG_FORMAT") or "text").lower(),
+        queue_size=__get_env_var_as_int("LOG_QUEUE_SIZE", 10000),
+        # Sampling only thins out the JSON logs; text logs keep every record
+        sample_every=__get_env_var_as_int(
+            "LOG_SAMPLE_EVERY",
+            100 if (__get_env_var("LOG_FORMAT") or "text").lower() == "json" else 1,
+        ),
     ),
     logging_level=__get_env_var("LOGGING_LEVEL"),
+    page_cache=SimpleNamespace(
+        enabled=__get_env_var("PAGE_CACHE_ENABLED") is None
+        or __get_env_var_as_boolean("PAGE_CACHE_ENABLED"),
+    ),
     phase_banner_text=__get_env_var("PHASE_BANNER_TEXT"),
+    profiling=SimpleNamespace(
+        # Off unless a share of requests is sampled or a token is set
+        sample_rate=__get_env_var_as_float("PROFILING_SAMPLE_RATE", 0.0),
+        token=__get_env_var("PROFILING_TOKEN"),
+        directory=__get_env_var("PROFILING_DIR") or "/tmp/join-github-profiles",
+        max_bytes=__get_env_var_as_int("PROFILING_MAX_MB", 50) * 1024 * 1024,
+    ),
+    rate_limit=SimpleNamespace(
+        storage_uri=__get_env_var("RATE_LIMIT_STORAGE_URI") or "memory://",
+        trusted_proxy_count=__get_env_var_as_int("RATE_LIMIT_TRUSTED_PROXIES", 0),
+    ),
+    session=SimpleNamespace(
+        store_uri=__get_env_var("SESSION_STORE_URI"),
+        ttl_seconds=__get_env_var_as_int("SESSION_TTL_SECONDS", 3600),
+    ),
     sentry=SimpleNamespace(
-        dsn_key=__get_env_var("SENTRY_DSN_KEY"), environment=__get_env_var("SENTRY_ENV")
+        dsn_key=__get_env_var("SENTRY_DSN_KEY"),
+        environment=__get_env_var("SENTRY_ENV"),
+        traces_sample_rate=__get_env_var_as_float("SENTRY_TRACES_SAMPLE_RATE", 0.1),
+        # Endpoints traced at their own rate; the rare, critical steps of joining are always traced
+        route_traces_sample_rates=__get_env_var_as_rates(
+            "SENTRY_ROUTE_TRACES_SAMPLE_RATES",
+            {"join_route.send_invitation": 1.0, "auth_routes.callback": 1.0},
+        ),
     ),
 )
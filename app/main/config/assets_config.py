@@ -0,0 +1,38 @@
+from functools import partial
+
+from flask import Flask, Response
+
+from app.main.services.asset_service import (
+    asset_url,
+    load_manifest,
+    precompressed_variants,
+)
+
+# Needed to render the first page; preloading them saves a round trip
+# after the stylesheets are parsed
+PRELOADED_ASSETS = [
+    ("stylesheets/govuk-frontend-5.1.0.min.css", "style"),
+    ("stylesheets/moj-frontend.min.css", "style"),
+    ("fonts/light-94a07e06a1-v2.woff2", "font"),
+    ("fonts/bold-b542beb274-v2.woff2", "font"),
+]
+
+
+def configure_assets(app: Flask) -> None:
+    """Use the fingerprinted assets from ``python -m app.build_assets`` when they
+    have been built, and fall back to the plain ``/assets`` files when not."""
+    app.asset_manifest = load_manifest(app.static_folder)
+    app.asset_variants = precompressed_variants(app.static_folder, app.asset_manifest)
+    app.jinja_env.globals["asset_url"] = partial(asset_url, app.asset_manifest)
+
+    preload_links = ", ".join(
+        f'<{asset_url(app.asset_manifest, path)}>; rel=preload; as={destination}'
+        + ("; crossorigin" if destination == "font" else "")
+        for path, destination in PRELOADED_ASSETS
+    )
+
+    @app.after_request
+    def add_preload_links(response: Response) -> Response:
+        if response.mimetype == "text/html":
+            response.headers.add("Link", preload_links)
+        return response
@@ -0,0 +1,29 @@
+import logging
+
+from flask import Flask
+
+from app.main.config.app_config import app_config
+from app.main.services.http_client import prewarm_connections
+
+logger = logging.getLogger(__name__)
+
+
+def configure_background_tasks(app: Flask) -> None:
+    """Start the threads and connections a process serving ``app`` needs.
+
+    Threads and sockets do not survive a fork, so under gunicorn this runs in
+    each worker from the ``post_worker_init`` hook rather than in
+    ``create_app``, which may run once in the master when the app is preloaded.
+    """
+    if app.invitation_outbox_worker is not None:
+        app.invitation_outbox_worker.start()
+
+    if app_config.auth0.domain:
+        app.auth0_service.prefetch_server_metadata()
+
+    app.readiness.start()
+
+    if app_config.http.prewarm_connections:
+        prewarm_connections(
+            [app_config.github.api_base_url, f"https://{app_config.auth0.domain}"]
+        )
@@ -1,6 +1,18 @@
 from flask import Flask
-from flask_cors import CORS
+from flask_cors.core import get_cors_options, parse_resources
+from flask_cors.extension import make_after_request_function
+
+from app.main.middleware.fast_path import skip_on_fast_path
 
 
 def configure_cors(app: Flask) -> None:
-    CORS(app, resources={r"/*": {"origins": "*", "send_wildcard": "False"}})
+    # Built the way CORS(app) builds its header hook, so the hook can be
+    # wrapped before it is registered: fast-path responses do without it.
+    # Error responses also pass through after_request hooks, so CORS does not
+    # need to wrap the error handlers
+    options = get_cors_options(app, {"resources": {r"/*": {"origins": "*", "send_wildcard": "False"}}})
+    resources = [
+        (pattern, get_cors_options(app, options, resource_options))
+        for pattern, resource_options in parse_resources(options["resources"])
+    ]
+    app.after_request(skip_on_fast_path(make_after_request_function(resources)))
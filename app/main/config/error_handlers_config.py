@@ -1,9 +1,12 @@
 from flask import Flask
 
 from app.main.middleware.error_handler import (
+    InvitationsDeferred,
     client_error,
+    invitations_deferred,
     page_not_found,
     server_forbidden,
+    too_many_requests,
     unknown_server_error,
 )
 
@@ -12,4 +15,6 @@ def configure_error_handlers(app: Flask) -> None:
     app.register_error_handler(400, client_error)
     app.register_error_handler(403, server_forbidden)
     app.register_error_handler(404, page_not_found)
+    app.register_error_handler(429, too_many_requests)
+    app.register_error_handler(InvitationsDeferred, invitations_deferred)
     app.register_error_handler(500, unknown_server_error)
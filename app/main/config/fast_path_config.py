@@ -0,0 +1,19 @@
+from flask import Flask
+
+from app.main.middleware.fast_path import FastPath, FastPathSessionInterface
+
+# Blueprints and endpoints served without the session, CORS headers, rate
+# limiting or tracing. Keyed like RATE_LIMIT_POLICIES.
+FAST_PATH_ROUTES = (
+    "static",
+    "assets_route",
+    "robot_route",
+    "health_route",
+    "metrics_route",
+)
+
+
+def configure_fast_path(app: Flask) -> FastPath:
+    app.fast_path = FastPath(app, FAST_PATH_ROUTES)
+    app.session_interface = FastPathSessionInterface(app.session_interface, app.fast_path)
+    return app.fast_path
@@ -0,0 +1,119 @@
+"""Gunicorn server profile, used with ``gunicorn --config python:app.main.config.gunicorn_config``.
+
+Worker and thread counts are sized from the CPUs available to the container
+unless ``GUNICORN_WORKERS`` is set:
+
+- ``sync``: ``2 * cpus + 1`` single-threaded workers
+- ``gthread``: ``cpus + 1`` workers of ``GUNICORN_THREADS`` threads, so a
+  slow GitHub or Auth0 call only holds one thread
+- ``gevent``: ``cpus + 1`` workers of ``GUNICORN_WORKER_CONNECTIONS``
+  greenlets, falling back to ``gthread`` when gevent is not installed
+
+With ``GUNICORN_PRELOAD_APP`` (the default) the app is created once in the
+master and the heap is frozen before forking so workers share it
+copy-on-write.
+
+Prometheus metrics are shared between workers through mmap files in
+``PROMETHEUS_MULTIPROC_DIR``, set in the ``Dockerfile``. The directory is
+created and emptied when gunicorn loads this file, which is before it imports
+the app, even with ``preload_app``.
+"""
+import gc
+import importlib.util
+import logging
+import math
+import os
+
+from prometheus_client import multiprocess
+
+from app.main.config.app_config import app_config
+
+logger = logging.getLogger(__name__)
+
+WORKER_CLASSES = ("sync", "gthread", "gevent")
+
+
+def available_cpus() -> int:
+    """CPUs this process may use, honouring a cgroup v2 CPU quota."""
+    try:
+        with open("/sys/fs/cgroup/cpu.max", encoding="utf-8") as cpu_max:
+            quota, period = cpu_max.read().split()
+        if quota != "max":
+            return max(1, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# Parameters are named apart from the module-level settings gunicorn reads
+def select_worker_class(requested_class: str) -> str:
+    if requested_class not in WORKER_CLASSES:
+        logger.warning("Unknown gunicorn worker class [ %s ], using gthread", requested_class)
+        return "gthread"
+    if requested_class == "gevent" and importlib.util.find_spec("gevent") is None:
+        logger.warning("gevent is not installed, using gthread workers")
+        return "gthread"
+    return requested_class
+
+
+def size_workers(selected_class: str, cpus: int, requested_workers: int, requested_threads: int) -> tuple[int, int]:
+    """Return ``(workers, threads)``; a ``requested_workers`` of 0 sizes from ``cpus``."""
+    if selected_class == "sync":
+        return requested_workers or 2 * cpus + 1, 1
+    return requested_workers or cpus + 1, requested_threads if selected_class == "gthread" else 1
+
+
+worker_class = select_worker_class(app_config.gunicorn.worker_class)
+workers, threads = size_workers(
+    worker_class,
+    available_cpus(),
+    app_config.gunicorn.workers,
+    app_config.gunicorn.threads,
+)
+worker_connections = app_config.gunicorn.worker_connections
+bind = app_config.gunicorn.bind
+# gevent must patch the standard library before the app is imported, which a
+# preload in the master would do first
+preload_app = app_config.gunicorn.preload_app and worker_class != "gevent"
+max_requests = app_config.gunicorn.max_requests
+max_requests_jitter = app_config.gunicorn.max_requests_jitter
+timeout = app_config.gunicorn.timeout
+graceful_timeout = app_config.gunicorn.graceful_timeout
+keepalive = app_config.gunicorn.keepalive
+# The worker heartbeat file is written constantly; keep it off the overlay filesystem
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def prepare_metrics_directory(path: str | None) -> None:
+    if not path:
+        return
+    os.makedirs(path, exist_ok=True)
+    # Samples left by an earlier server would be added to this one's
+    for name in os.listdir(path):
+        if name.endswith(".db"):
+            os.remove(os.path.join(path, name))
+
+
+# on_starting would be too late: a preloaded app is imported before it runs
+prepare_metrics_directory(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def child_exit(_server, worker) -> None:
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(worker.pid)
+
+
+def pre_fork(_server, _worker) -> None:
+    # Move everything allocated so far out of the collector's reach, so
+    # collections in the worker do not touch, and copy, the shared pages
+    gc.freeze()
+
+
+def post_worker_init(worker) -> None:
+    # Imported per worker, as loading this file must not import the app
+    from app.main.config.background_tasks_config import configure_background_tasks  # pylint: disable=import-outside-toplevel
+
+    configure_background_tasks(worker.wsgi)
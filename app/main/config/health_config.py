@@ -0,0 +1,37 @@
+from flask import Flask
+
+from app.main.config.app_config import app_config
+from app.main.services.metrics_service import github_requests_remaining
+from app.main.services.readiness_service import (
+    DependencyDegraded,
+    DependencyNotReady,
+    ReadinessService,
+)
+
+
+def check_oidc_metadata(auth0_service) -> str:
+    metadata = auth0_service.load_server_metadata()
+    if not metadata.get("authorization_endpoint"):
+        raise DependencyNotReady("OIDC metadata has no authorization endpoint")
+    return metadata.get("issuer", "loaded")
+
+
+def check_github(github_service, min_requests_remaining: int) -> str:
+    remaining = github_service.get_rate_limit_remaining()
+    github_requests_remaining().set(remaining)
+    # Every replica shares the token, so a low budget must not fail readiness
+    if remaining < min_requests_remaining:
+        raise DependencyDegraded(f"{remaining} GitHub requests remaining")
+    return f"{remaining} GitHub requests remaining"
+
+
+def configure_health(app: Flask) -> None:
+    app.readiness = ReadinessService(
+        {
+            "oidc_metadata": lambda: check_oidc_metadata(app.auth0_service),
+            "github": lambda: check_github(
+                app.github_service, app_config.health.min_github_requests_remaining
+            ),
+        },
+        app_config.health.readiness_refresh_seconds,
+    )
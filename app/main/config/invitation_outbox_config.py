@@ -0,0 +1,38 @@
+from flask import Flask
+
+from app.main.config.app_config import app_config
+from app.main.services.invitation_outbox_service import (
+    InvitationOutbox,
+    InvitationOutboxWorker,
+)
+
+
+def build_invitation_outbox() -> InvitationOutbox:
+    # A path under /tmp would lose queued invitations whenever the pod restarts
+    if not app_config.invitation_outbox.database_path:
+        raise ValueError(
+            "INVITATION_OUTBOX_DATABASE_PATH must be set, on a persistent volume, when the invitation outbox is enabled"
+        )
+    return InvitationOutbox(
+        app_config.invitation_outbox.database_path,
+        max_attempts=app_config.invitation_outbox.max_attempts,
+        backoff_seconds=app_config.invitation_outbox.backoff_seconds,
+        max_backoff_seconds=app_config.invitation_outbox.max_backoff_seconds,
+    )
+
+
+def configure_invitation_outbox(app: Flask) -> None:
+    app.invitation_outbox = None
+    app.invitation_outbox_worker = None
+
+    if not app_config.invitation_outbox.enabled:
+        return
+
+    app.invitation_outbox = build_invitation_outbox()
+
+    if app_config.invitation_outbox.run_worker_in_process:
+        app.invitation_outbox_worker = InvitationOutboxWorker(
+            app.invitation_outbox,
+            app.github_service,
+            app_config.invitation_outbox.poll_interval_seconds,
+        )
@@ -1,14 +1,76 @@
-from flask import Flask
-from flask_limiter import Limiter
+from urllib.parse import urlparse
+
+from flask import Flask, request
+from flask_limiter import Limiter, RequestLimit
 from flask_limiter.util import get_remote_address
+from limits.errors import ConfigurationError
+
+from app.main.config.app_config import app_config
+from app.main.config.fast_path_config import FAST_PATH_ROUTES
+# Registers the sqlite:// storage scheme with limits
+from app.main.services import rate_limit_storage  # noqa: F401  # pylint: disable=unused-import
+from app.main.services.metrics_service import RATE_LIMIT_REJECTIONS
+
+EXEMPT = None
+RATE_LIMIT_STRATEGY = "sliding-window-counter"
+# Storage schemes that only implement the sliding window counter strategy
+SLIDING_WINDOW_COUNTER_ONLY_SCHEMES = {"sketch"}
+
+# Keyed on a blueprint name, or on an endpoint for a single route. Routes
+# without a policy get the default limits. Fast-path routes are always exempt.
+RATE_LIMIT_POLICIES = {
+    "join_route.invitation_status": EXEMPT,
+    "join_route.send_invitation": "3 per minute;10 per hour",
+    "auth_routes.callback": "5 per minute;20 per hour",
+}
+
 
+def configure_limiter(
+    app: Flask,
+    is_rate_limit_enabled: bool = True,
+    storage_options: dict | None = None,
+    strategy: str = RATE_LIMIT_STRATEGY,
+) -> Limiter:
+    """Rate limit every route, storing the counters at ``RATE_LIMIT_STORAGE_URI``.
 
-def configure_limiter(app: Flask, is_rate_limit_enabled: bool = True) -> None:
-    Limiter(
+    ``memory://`` keeps separate counters in each gunicorn worker,
+    ``sqlite:////path/to/file.db`` shares them between the workers on a pod
+    and ``redis://host:port`` shares them between pods. ``sketch://`` keeps
+    constant-memory counters in each worker and only works with the
+    sliding-window-counter strategy.
+    """
+    storage_scheme = urlparse(app_config.rate_limit.storage_uri).scheme
+    if storage_scheme in SLIDING_WINDOW_COUNTER_ONLY_SCHEMES and strategy != "sliding-window-counter":
+        raise ConfigurationError(
+            f"{storage_scheme}:// rate limit storage only supports the sliding-window-counter strategy, not {strategy}"
+        )
+    limiter = Limiter(
         get_remote_address,
         app=app,
         default_limits=["10 per minute", "2 per second"],
-        storage_uri="memory://",
-        strategy="moving-window",
+        storage_uri=app_config.rate_limit.storage_uri,
+        storage_options=storage_options or {},
+        strategy=strategy,
         enabled=is_rate_limit_enabled,
+        on_breach=record_rate_limit_rejection,
     )
+    # Route decorators only hold a weak reference to the limiter
+    app.limiter = limiter
+    apply_rate_limit_policies(app, limiter)
+    return limiter
+
+
+def record_rate_limit_rejection(_request_limit: RequestLimit) -> None:
+    RATE_LIMIT_REJECTIONS.labels(request.endpoint or "unmatched").inc()
+
+
+def apply_rate_limit_policies(app: Flask, limiter: Limiter) -> None:
+    policies = {name: EXEMPT for name in FAST_PATH_ROUTES} | RATE_LIMIT_POLICIES
+    for name, limits in policies.items():
+        if name in app.view_functions:
+            decorate = limiter.exempt if limits is EXEMPT else limiter.limit(limits)
+            app.view_functions[name] = decorate(app.view_functions[name])
+        elif limits is EXEMPT:
+            limiter.exempt(app.blueprints[name])
+        else:
+            limiter.limit(limits)(app.blueprints[name])
@@ -1,10 +1,62 @@
+import atexit
 import logging
+import os
 
+from flask import Flask
 
-def configure_logging(logging_level: str) -> None:
-    logging.basicConfig(
-        format="{asctime:s} | {levelname:>8s} | {filename:s}:{lineno:d} | {message:s}",
-        datefmt="%Y-%m-%dT%H:%M:%S",
-        style="{",
-        level=logging_level.upper() if logging_level else "INFO",
+from app.main.config.app_config import app_config
+from app.main.middleware.structured_logging import (
+    JsonFormatter,
+    LogPipeline,
+    log_request,
+)
+
+TEXT_FORMATTER = logging.Formatter(
+    "{asctime:s} | {levelname:>8s} | {filename:s}:{lineno:d} | {message:s}",
+    datefmt="%Y-%m-%dT%H:%M:%S",
+    style="{",
+)
+
+
+def configure_logging(
+    logging_level: str,
+    log_format: str = "text",
+    sample_every: int = 1,
+    queue_size: int = 10000,
+) -> None:
+    """Send every log record through a queue to a listener thread writing to
+    stdout, as text or, with a ``log_format`` of ``json``, one JSON object per
+    line. Like ``logging.basicConfig``, does nothing if the root logger
+    already has handlers.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    pipeline = LogPipeline(
+        JsonFormatter() if log_format == "json" else TEXT_FORMATTER,
+        sample_every,
+        queue_size,
     )
+    root.addHandler(pipeline.handler)
+    root.setLevel(logging_level.upper() if logging_level else "INFO")
+    pipeline.start()
+    # Gunicorn forks workers from a master that has already created the app
+    os.register_at_fork(after_in_child=pipeline.restart_after_fork)
+    atexit.register(pipeline.stop)
+
+
+def configure_logging_from_app_config() -> None:
+    configure_logging(
+        app_config.logging_level,
+        app_config.logging.format,
+        app_config.logging.sample_every,
+        app_config.logging.queue_size,
+    )
+
+
+def configure_request_logging(app: Flask) -> None:
+    """Log each request with its route, status and duration.
+
+    Must run after ``configure_fast_path`` and ``configure_metrics``.
+    """
+    app.after_request(log_request)
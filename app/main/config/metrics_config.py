@@ -0,0 +1,45 @@
+import time
+
+from flask import Flask, Response, request
+
+from app.main.services.metrics_service import REQUEST_LATENCY
+
+REQUEST_STARTED_ENVIRON_KEY = "join_github.request_started"
+# Anything else is counted as "other" so odd methods cannot add label values
+HTTP_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+
+
+class RequestTimer:  # pylint: disable=too-few-public-methods
+    """WSGI middleware noting when each request arrived."""
+
+    def __init__(self, wsgi_app) -> None:
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ: dict, start_response):
+        environ[REQUEST_STARTED_ENVIRON_KEY] = time.perf_counter()
+        return self.wsgi_app(environ, start_response)
+
+
+def configure_metrics(app: Flask) -> None:
+    """Time every request by endpoint.
+
+    Must run before ``configure_limiter`` and ``configure_page_cache``, so the
+    latency is recorded after their response hooks have run.
+    """
+    app.wsgi_app = RequestTimer(app.wsgi_app)
+    # Resolving labels takes a lock and validates them; reuse each labelled histogram
+    histograms = {}
+
+    @app.after_request
+    def record_request_latency(response: Response) -> Response:
+        current_request = request._get_current_object()  # pylint: disable=protected-access
+        started = current_request.environ.get(REQUEST_STARTED_ENVIRON_KEY)
+        if started is None:
+            return response
+        method = current_request.method
+        key = (current_request.endpoint, method if method in HTTP_METHODS else "other", response.status_code)
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = REQUEST_LATENCY.labels(key[0] or "unmatched", key[1], key[2])
+        histogram.observe(time.perf_counter() - started)
+        return response
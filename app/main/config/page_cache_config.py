@@ -0,0 +1,15 @@
+import hashlib
+import json
+
+from flask import Flask
+
+from app.main.config.app_config import app_config
+from app.main.middleware.page_cache import PageCache
+
+
+def configure_page_cache(app: Flask) -> None:
+    # Everything session-independent pages render that is set at startup
+    version = hashlib.sha256(
+        json.dumps([app_config.phase_banner_text, app.asset_manifest], sort_keys=True).encode()
+    ).hexdigest()[:16]
+    app.page_cache = PageCache(version, app_config.page_cache.enabled)
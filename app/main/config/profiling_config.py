@@ -0,0 +1,23 @@
+from flask import Flask
+
+from app.main.config.app_config import app_config
+from app.main.middleware.request_profiler import RequestProfiler
+
+
+def configure_profiling(app: Flask) -> None:
+    """Profile a share of requests, or those sending the profiling token.
+
+    Leaves the app untouched when neither is configured. Must run last, so
+    the profile covers every other middleware.
+    """
+    profiling = app_config.profiling
+    if profiling.sample_rate <= 0 and not profiling.token:
+        return
+    app.wsgi_app = RequestProfiler(
+        app.wsgi_app,
+        app.url_map,
+        profiling.directory,
+        profiling.sample_rate,
+        profiling.token,
+        profiling.max_bytes,
+    )
@@ -0,0 +1,13 @@
+from flask import Flask
+from werkzeug.middleware.proxy_fix import ProxyFix
+
+
+def configure_proxy(app: Flask, trusted_proxy_count: int) -> None:
+    """Take the client address from ``X-Forwarded-For`` when running behind
+    ``trusted_proxy_count`` proxies, such as the cluster ingress.
+
+    Only the entries added by the trusted proxies are used, so a client cannot
+    choose its own rate limit key by sending the header itself.
+    """
+    if trusted_proxy_count > 0:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=trusted_proxy_count)
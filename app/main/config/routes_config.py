@@ -1,8 +1,11 @@
 from flask import Flask
 
+from app.main.routes.assets import assets_route
 from app.main.routes.auth import auth_route
+from app.main.routes.health import health_route
 from app.main.routes.join import join_route
 from app.main.routes.main import main
+from app.main.routes.metrics import metrics_route
 from app.main.routes.robots import robot_route
 
 
@@ -11,3 +14,6 @@ def configure_routes(app: Flask) -> None:
     app.register_blueprint(join_route, url_prefix="/join")
     app.register_blueprint(main)
     app.register_blueprint(robot_route)
+    app.register_blueprint(assets_route)
+    app.register_blueprint(health_route)
+    app.register_blueprint(metrics_route)
@@ -1,12 +1,40 @@
 import logging
+from functools import partial
 
 import sentry_sdk
 from sentry_sdk.integrations.flask import FlaskIntegration
 
+from app.main.middleware.fast_path import FastPath
+
 logger = logging.getLogger(__name__)
 
+TRACES_SAMPLE_RATE = 0.1
+
+
+def traces_sampler(
+    sampling_context: dict,
+    fast_path: FastPath,
+    traces_sample_rate: float = TRACES_SAMPLE_RATE,
+    route_traces_sample_rates: dict[str, float] | None = None,
+) -> float:
+    environ = sampling_context.get("wsgi_environ")
+    if environ is None:
+        return traces_sample_rate
+    # Assets, robots.txt, the probes and missing pages are requested constantly; tracing them would use up the quota
+    if fast_path.is_fast_path(environ):
+        return 0
+    if route_traces_sample_rates:
+        return route_traces_sample_rates.get(fast_path.endpoint(environ), traces_sample_rate)
+    return traces_sample_rate
+
 
-def configure_sentry(dsn_key: str, environment: str) -> None:
+def configure_sentry(
+    dsn_key: str,
+    environment: str,
+    fast_path: FastPath,
+    traces_sample_rate: float = TRACES_SAMPLE_RATE,
+    route_traces_sample_rates: dict[str, float] | None = None,
+) -> None:
     if not dsn_key:
         logger.warning("Missing Sentry DSN Key")
 
@@ -20,7 +48,12 @@ def configure_sentry(dsn_key: str, environment: str) -> None:
             environment=environment,
             integrations=[FlaskIntegration()],
             enable_tracing=True,
-            traces_sample_rate=0.1,
+            traces_sampler=partial(
+                traces_sampler,
+                fast_path=fast_path,
+                traces_sample_rate=traces_sample_rate,
+                route_traces_sample_rates=route_traces_sample_rates,
+            ),
         )
         logger.info("Sentry configured successfully")
     else:
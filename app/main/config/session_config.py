@@ -0,0 +1,20 @@
+import logging
+
+from flask import Flask
+
+from app.main.config.app_config import app_config
+from app.main.middleware.server_side_session import ServerSideSessionInterface
+from app.main.services.session_store import session_store_from_uri
+
+logger = logging.getLogger(__name__)
+
+
+def configure_session(app: Flask) -> None:
+    if not app_config.session.store_uri:
+        return
+
+    app.session_interface = ServerSideSessionInterface(
+        session_store_from_uri(app_config.session.store_uri),
+        app_config.session.ttl_seconds,
+    )
+    logger.info("Storing sessions server-side")
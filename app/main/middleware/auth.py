@@ -13,7 +13,7 @@ def requires_auth(function_f):
     @wraps(function_f)
     def decorated(*args, **kwargs):
         logger.debug("requires_auth()")
-        if "user" not in session:
+        if "verified_email" not in session:
             return redirect("/")
         return function_f(*args, **kwargs)
 
@@ -1,30 +1,49 @@
 import logging
 
 from flask import render_template
+from werkzeug.exceptions import TooManyRequests
+
+from app.main.middleware.page_cache import render_cached_template
 
 logger = logging.getLogger(__name__)
 
 
+class InvitationsDeferred(TooManyRequests):
+    """GitHub's invitation rate limit, rather than ours, stopped the request."""
+
+    description = "GitHub invitations are being rate limited."
+
+
 def client_error(err: Exception):
     logger.info("There was an error with the client request %s", err)
     return render_template("pages/errors/400.html", error_message=str(err)), 400
 
 
 def page_not_found(err: Exception):
-    logger.info("A request was made to a page that doesn't exist %s", err)
-    return render_template("pages/errors/404.html"), 404
+    logger.info("A request was made to a page that doesn't exist %s", err, extra={"sample_key": "not_found"})
+    return render_cached_template("pages/errors/404.html"), 404
 
 
 def server_forbidden(err: Exception):
     logger.info("server_forbidden(): %s", err)
-    return render_template("pages/errors/403.html"), 403
+    return render_cached_template("pages/errors/403.html"), 403
+
+
+def too_many_requests(err: Exception):
+    logger.info("Too many requests: %s", err, extra={"sample_key": "rate_limited"})
+    return render_cached_template("pages/errors/429.html"), 429
+
+
+def invitations_deferred(err: Exception):
+    logger.info("Invitations deferred: %s", err)
+    return render_cached_template("pages/errors/429-invitations-deferred.html"), 429
 
 
 def unknown_server_error(err: Exception):
     logger.info("An unknown server error occurred: %s", err)
-    return render_template("pages/errors/500.html"), 500
+    return render_cached_template("pages/errors/500.html"), 500
 
 
 def gateway_timeout(err: Exception):
     logger.info("A gateway timeout error occurred: %s", err)
-    return render_template("pages/errors/504.html"), 504
+    return render_cached_template("pages/errors/504.html"), 504
@@ -0,0 +1,74 @@
+from functools import wraps
+
+from flask import Flask, Request, Response, current_app
+from flask import request as current_request
+from flask.sessions import SessionInterface, SessionMixin
+from werkzeug.exceptions import HTTPException, NotFound
+
+FAST_PATH_ENVIRON_KEY = "join_github.fast_path"
+ENDPOINT_ENVIRON_KEY = "join_github.endpoint"
+
+
+class FastPath:
+    """Decides whether a request is for a fast-path route: one that does not
+    use the session, CORS, rate limiting or tracing.
+
+    Routes are declared by blueprint or endpoint name. Requests matching no
+    route are fast-path too, so scans for missing pages stay cheap. The
+    decision is made once per request, before routing, and kept in the WSGI
+    environ.
+    """
+
+    def __init__(self, app: Flask, routes: tuple[str, ...]) -> None:
+        self.app = app
+        self.routes = frozenset(routes)
+
+    def is_fast_path(self, environ: dict) -> bool:
+        is_fast_path = environ.get(FAST_PATH_ENVIRON_KEY)
+        if is_fast_path is None:
+            is_fast_path = self.__match(environ)
+            environ[FAST_PATH_ENVIRON_KEY] = is_fast_path
+        return is_fast_path
+
+    def endpoint(self, environ: dict) -> str | None:
+        """The endpoint the request is routed to, if any, from the same match."""
+        self.is_fast_path(environ)
+        return environ.get(ENDPOINT_ENVIRON_KEY)
+
+    def __match(self, environ: dict) -> bool:
+        try:
+            rule, _ = self.app.url_map.bind_to_environ(environ).match(return_rule=True)
+        except NotFound:
+            return True
+        except HTTPException:
+            return False
+        environ[ENDPOINT_ENVIRON_KEY] = rule.endpoint
+        blueprint, _, _ = rule.endpoint.rpartition(".")
+        return rule.endpoint in self.routes or blueprint in self.routes
+
+
+class FastPathSessionInterface(SessionInterface):
+    """Gives fast-path requests a read-only empty session, so their session
+    cookie is neither decoded nor set again."""
+
+    def __init__(self, wrapped: SessionInterface, fast_path: FastPath) -> None:
+        self.wrapped = wrapped
+        self.fast_path = fast_path
+
+    def open_session(self, app: Flask, request: Request) -> SessionMixin | None:
+        if self.fast_path.is_fast_path(request.environ):
+            return None
+        return self.wrapped.open_session(app, request)
+
+    def save_session(self, app: Flask, session: SessionMixin, response: Response) -> None:
+        self.wrapped.save_session(app, session, response)
+
+
+def skip_on_fast_path(after_request):
+    @wraps(after_request)
+    def decorated(response: Response) -> Response:
+        if current_app.fast_path.is_fast_path(current_request.environ):
+            return response
+        return after_request(response)
+
+    return decorated
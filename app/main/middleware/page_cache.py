@@ -0,0 +1,116 @@
+import hashlib
+import logging
+from dataclasses import dataclass
+from functools import wraps
+
+from flask import (
+    Response,
+    current_app,
+    make_response,
+    render_template,
+    request,
+    session,
+)
+
+logger = logging.getLogger(__name__)
+
+# Headers that belong to a single response rather than to the page
+UNCACHED_HEADERS = ("Set-Cookie", "Date", "Content-Length", "ETag")
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    body: bytes
+    status: int
+    headers: list[tuple[str, str]]
+    etag: str
+
+
+class PageCache:
+    """Rendered pages for routes declared session-independent with ``cached_page``.
+
+    Entries are keyed on the endpoint or template and on ``version``, a digest
+    of the startup configuration the pages render, so the cache holds one
+    entry per route whatever is requested.
+    """
+
+    def __init__(self, version: str, enabled: bool = True) -> None:
+        self.version = version
+        self.enabled = enabled
+        self.pages: dict[tuple[str, str], CachedPage] = {}
+
+    def get(self, key: str) -> CachedPage | None:
+        return self.pages.get((self.version, key))
+
+    def store(self, key: str, response: Response) -> CachedPage:
+        response.direct_passthrough = False
+        body = response.get_data()
+        page = CachedPage(
+            body=body,
+            status=response.status_code,
+            headers=[
+                (name, value)
+                for name, value in response.headers.items()
+                if name not in UNCACHED_HEADERS
+            ],
+            etag=hashlib.sha256(body).hexdigest()[:32],
+        )
+        # Concurrent misses render the same page, so the last store wins harmlessly
+        self.pages[(self.version, key)] = page
+        return page
+
+
+def is_cacheable_request() -> bool:
+    # Pending flash messages are rendered into, and popped by, the next page
+    return (
+        current_app.page_cache.enabled
+        and request.method in ("GET", "HEAD")
+        and "_flashes" not in session
+    )
+
+
+def is_session_independent(response: Response) -> bool:
+    return not (session.accessed or session.modified or "Set-Cookie" in response.headers)
+
+
+def cached_page(view):
+    """Serve the view's response from ``app.page_cache``, with an ETag.
+
+    Only for views whose output is the same for every visitor. A response is
+    not stored if rendering read or wrote the session or set a cookie.
+    """
+
+    @wraps(view)
+    def decorated(*args, **kwargs):
+        if not is_cacheable_request():
+            return view(*args, **kwargs)
+
+        page = current_app.page_cache.get(request.endpoint)
+        if page is None:
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200 or not is_session_independent(response):
+                return response
+            page = current_app.page_cache.store(request.endpoint, response)
+            logger.debug("Cached page for [ %s ]", request.endpoint)
+
+        response = Response(page.body, page.status, page.headers)
+        response.set_etag(page.etag)
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+
+    return decorated
+
+
+def render_cached_template(template_name: str) -> str:
+    """``render_template`` for templates that render the same for every
+    visitor, such as the error pages, cached like ``cached_page``."""
+    if not is_cacheable_request():
+        return render_template(template_name)
+
+    page = current_app.page_cache.get(template_name)
+    if page is None:
+        response = make_response(render_template(template_name))
+        if not is_session_independent(response):
+            return response.get_data(as_text=True)
+        page = current_app.page_cache.store(template_name, response)
+    return page.body.decode("utf-8")
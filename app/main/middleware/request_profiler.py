@@ -0,0 +1,136 @@
+import cProfile
+import hmac
+import itertools
+import logging
+import os
+import random
+import re
+import threading
+import time
+
+from werkzeug.exceptions import HTTPException
+from werkzeug.routing import Map
+from werkzeug.wsgi import ClosingIterator
+
+logger = logging.getLogger(__name__)
+
+PROFILE_TOKEN_HEADER = "HTTP_X_PROFILE_TOKEN"
+PROFILE_SUFFIX = ".prof"
+UNSAFE_FILENAME_CHARACTERS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def prune_profiles(directory: str, max_bytes: int) -> None:
+    """Delete the oldest profiles until those left fit in ``max_bytes``."""
+    profiles = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(PROFILE_SUFFIX):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                profiles.append((stat.st_mtime_ns, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in profiles)
+    for _, size, path in sorted(profiles):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+class RequestProfiler:  # pylint: disable=too-many-instance-attributes
+    """WSGI middleware running cProfile over a share of requests, and over
+    any request sending the profiling token in ``X-Profile-Token``.
+
+    Each profile is written in the pstats format to ``directory`` once the
+    response has been sent. It is named after the route, how long the request
+    took and how many other requests this worker handled meanwhile. The
+    oldest are deleted to keep the directory under ``max_bytes``.
+
+    A profile covers the whole worker process, not just the request. From
+    Python 3.12, cProfile is built on ``sys.monitoring``, which sees every
+    thread, so with gthread workers it takes in other requests' work too.
+    gevent greenlets share a thread, so they are included on any version.
+    Treat a profile whose name shows concurrent requests as a profile of the
+    worker, not the route. Only one profile runs in a process at a time.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        wsgi_app,
+        url_map: Map,
+        directory: str,
+        sample_rate: float = 0,
+        token: str | None = None,
+        max_bytes: int = 50 * 1024 * 1024,
+    ) -> None:
+        self.wsgi_app = wsgi_app
+        self.url_map = url_map
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.token = token.encode() if token else None
+        self.max_bytes = max_bytes
+        self.sequence = itertools.count()
+        self.__lock = threading.Lock()
+        self.__in_flight = 0
+        self.__arrived = 0
+
+    def is_profiled(self, environ: dict) -> bool:
+        if self.sample_rate and random.random() < self.sample_rate:
+            return True
+        header = environ.get(PROFILE_TOKEN_HEADER)
+        return bool(header and self.token and hmac.compare_digest(header.encode(), self.token))
+
+    def __call__(self, environ: dict, start_response):
+        with self.__lock:
+            in_flight = self.__in_flight
+            self.__in_flight += 1
+            self.__arrived += 1
+            arrived = self.__arrived
+        try:
+            if not self.is_profiled(environ):
+                return self.wsgi_app(environ, start_response)
+            return self.__profile(environ, start_response, in_flight, arrived)
+        finally:
+            with self.__lock:
+                self.__in_flight -= 1
+
+    def __profile(self, environ: dict, start_response, in_flight: int, arrived: int):
+        profile = cProfile.Profile()
+        started = time.perf_counter()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another request in this process is being profiled; sys.monitoring allows one profiler
+            return self.wsgi_app(environ, start_response)
+        try:
+            response = self.wsgi_app(environ, start_response)
+        finally:
+            profile.disable()
+            duration = time.perf_counter() - started
+            # Requests already running when this one arrived, and those that arrived while it ran
+            concurrent = in_flight + self.__arrived - arrived
+        return ClosingIterator(response, lambda: self.save(profile, environ, duration, concurrent))
+
+    def route(self, environ: dict) -> str:
+        try:
+            endpoint, _ = self.url_map.bind_to_environ(environ).match()
+        except HTTPException:
+            return "unmatched"
+        return endpoint
+
+    def save(self, profile: cProfile.Profile, environ: dict, duration: float, concurrent: int = 0) -> None:
+        route = UNSAFE_FILENAME_CHARACTERS.sub("_", self.route(environ))
+        name = (
+            f"{time.strftime('%Y%m%dT%H%M%S')}-{route}-{duration * 1000:.0f}ms-{concurrent}concurrent"
+            f"-{os.getpid()}-{next(self.sequence)}{PROFILE_SUFFIX}"
+        )
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            profile.dump_stats(os.path.join(self.directory, name))
+            prune_profiles(self.directory, self.max_bytes)
+        except OSError as error:
+            logger.warning("Could not save the profile of a request to %s: %s", route, error)
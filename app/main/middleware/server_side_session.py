@@ -0,0 +1,116 @@
+import logging
+import secrets
+
+from flask import Flask, Request, Response
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SecureCookieSession, SessionInterface
+from itsdangerous import BadSignature, Signer
+
+from app.main.services.session_store import SessionStore
+
+logger = logging.getLogger(__name__)
+
+
+class ServerSideSession(SecureCookieSession):
+    def __init__(self, initial=None, sid: str | None = None) -> None:
+        super().__init__(initial)
+        self.sid = sid
+        self.previous_sid: str | None = None
+
+    def regenerate(self) -> None:
+        """Move the data to a new session id when the response is saved, and
+        delete the old one, so an id planted before login is never authenticated."""
+        if self.sid is not None:
+            self.previous_sid = self.sid
+            self.sid = None
+        self.modified = True
+
+
+def regenerate_session(session) -> None:
+    """Give a server-side session a new id; signed cookie sessions change
+    their cookie whenever their data changes, so need nothing."""
+    if isinstance(session, ServerSideSession):
+        session.regenerate()
+
+
+class ServerSideSessionInterface(SessionInterface):
+    """Keeps session data in a ``SessionStore``; the cookie only holds a signed,
+    random session id.
+
+    Requests without a session cookie, such as asset fetches, never touch the
+    store, and the store is only written when the session is modified.
+    """
+
+    serializer = TaggedJSONSerializer()
+
+    def __init__(self, store: SessionStore, ttl_seconds: int) -> None:
+        self.store = store
+        self.ttl_seconds = ttl_seconds
+
+    def get_signer(self, app: Flask) -> Signer | None:
+        if not app.secret_key:
+            return None
+        return Signer(app.secret_key, salt="server-side-session")
+
+    def open_session(self, app: Flask, request: Request) -> ServerSideSession | None:
+        signer = self.get_signer(app)
+        if signer is None:
+            return None
+
+        cookie = request.cookies.get(self.get_cookie_name(app))
+        if not cookie:
+            return ServerSideSession()
+        try:
+            sid = signer.unsign(cookie).decode("utf-8")
+        except BadSignature:
+            return ServerSideSession()
+
+        data = self.store.load(sid)
+        if data is None:
+            return ServerSideSession()
+        return ServerSideSession(self.serializer.loads(data), sid)
+
+    def save_session(self, app: Flask, session: ServerSideSession, response: Response) -> None:
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        secure = self.get_cookie_secure(app)
+        samesite = self.get_cookie_samesite(app)
+        httponly = self.get_cookie_httponly(app)
+
+        if session.accessed:
+            response.vary.add("Cookie")
+
+        if session.previous_sid is not None:
+            self.store.delete(session.previous_sid)
+            session.previous_sid = None
+
+        if not session:
+            if session.modified:
+                if session.sid is not None:
+                    self.store.delete(session.sid)
+                response.delete_cookie(
+                    name, domain=domain, path=path, secure=secure, samesite=samesite, httponly=httponly
+                )
+                response.vary.add("Cookie")
+            return
+
+        if not self.should_set_cookie(app, session):
+            return
+
+        if session.modified:
+            if session.sid is None:
+                session.sid = secrets.token_urlsafe(32)
+            self.store.save(session.sid, self.serializer.dumps(dict(session)), self.ttl_seconds)
+
+        response.set_cookie(
+            name,
+            self.get_signer(app).sign(session.sid).decode("utf-8"),
+            expires=self.get_expiration_time(app, session),
+            httponly=httponly,
+            domain=domain,
+            path=path,
+            secure=secure,
+            samesite=samesite,
+        )
+        response.vary.add("Cookie")
@@ -0,0 +1,218 @@
+import copy
+import itertools
+import json
+import logging
+import queue
+import sys
+import time
+import uuid
+from logging.handlers import QueueHandler, QueueListener
+
+from flask import Response, current_app, has_request_context, request
+
+from app.main.config.metrics_config import REQUEST_STARTED_ENVIRON_KEY
+
+logger = logging.getLogger(__name__)
+
+REQUEST_ID_ENVIRON_KEY = "join_github.request_id"
+REQUEST_ID_MAX_LENGTH = 128
+# Optional fields a record may carry, written by JsonFormatter when present
+CONTEXT_FIELDS = ("route", "method", "path", "status", "duration_ms", "request_id", "org", "sample_rate")
+# Loggers of libraries whose every record is one of a flood
+SAMPLED_LOGGERS = {"flask-limiter": "rate_limited"}
+# Responses logged once per sample, so a scan cannot fill the logs
+SAMPLED_STATUSES = {404: "not_found", 429: "rate_limited"}
+
+
+def request_id(environ: dict) -> str:
+    """The ingress's X-Request-Id for this request, or a new one."""
+    identifier = environ.get(REQUEST_ID_ENVIRON_KEY)
+    if identifier is None:
+        identifier = environ.get("HTTP_X_REQUEST_ID", "")
+        if not identifier or len(identifier) > REQUEST_ID_MAX_LENGTH:
+            identifier = uuid.uuid4().hex
+        environ[REQUEST_ID_ENVIRON_KEY] = identifier
+    return identifier
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with stable field names."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+            + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "source": f"{record.filename}:{record.lineno}",
+            "message": record.getMessage(),
+        }
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):  # pylint: disable=too-few-public-methods
+    """Passes the first of every ``every`` records sharing a sample key, and
+    marks it with the ``sample_rate`` it stands for.
+
+    The key is the record's ``sample_key`` extra, or comes from
+    ``SAMPLED_LOGGERS``; records without one always pass. Counts are kept per
+    logger and key without a lock, so under contention the rate is approximate.
+    """
+
+    def __init__(self, every: int) -> None:
+        super().__init__()
+        self.every = every
+        self.counters = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = getattr(record, "sample_key", None) or SAMPLED_LOGGERS.get(record.name)
+        if key is None or self.every <= 1:
+            return True
+        counter = self.counters.get((record.name, key))
+        if counter is None:
+            counter = self.counters.setdefault((record.name, key), itertools.count())
+        if next(counter) % self.every:
+            return False
+        record.sample_rate = self.every
+        return True
+
+
+class RequestContextFilter(logging.Filter):  # pylint: disable=too-few-public-methods
+    """Adds the route and request id to records logged while handling a request."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if has_request_context():
+            current_request = request._get_current_object()  # pylint: disable=protected-access
+            if getattr(record, "route", None) is None:
+                record.route = current_request.endpoint
+            record.request_id = request_id(current_request.environ)
+        return True
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """Hands records to a bounded queue, dropping them when it is full
+    rather than making the logging thread wait."""
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Unlike QueueHandler.prepare, leave the formatting to the listener's
+        # formatter and only render what cannot cross threads: the arguments
+        # and the traceback
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            try:
+                self.queue.put_nowait(logging.makeLogRecord({
+                    "name": __name__,
+                    "levelno": logging.WARNING,
+                    "levelname": "WARNING",
+                    "msg": f"Dropped {dropped} log records while the log queue was full",
+                }))
+            except queue.Full:
+                self.dropped += dropped
+
+
+class StdoutHandler(logging.StreamHandler):
+    """Writes to whatever ``sys.stdout`` is when each record is emitted."""
+
+    def __init__(self) -> None:
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value) -> None:
+        pass
+
+
+class LogPipeline:
+    """Root logger handler putting records on a queue, and a listener thread
+    writing them out, so threads that log never wait on stdout.
+    """
+
+    def __init__(
+        self,
+        formatter: logging.Formatter,
+        sample_every: int = 1,
+        queue_size: int = 10000,
+        output: logging.Handler | None = None,
+    ) -> None:
+        self.queue_size = queue_size
+        self.output = output or StdoutHandler()
+        self.output.setFormatter(formatter)
+        self.handler = NonBlockingQueueHandler(queue.Queue(queue_size))
+        self.handler.addFilter(SamplingFilter(sample_every))
+        self.handler.addFilter(RequestContextFilter())
+        self.listener = QueueListener(self.handler.queue, self.output, respect_handler_level=True)
+
+    def start(self) -> None:
+        self.listener.start()
+
+    def stop(self) -> None:
+        """Write out everything queued so far and stop the listener thread."""
+        self.listener.stop()
+
+    def restart_after_fork(self) -> None:
+        """Give a forked child its own queue and listener thread: the
+        parent's thread is not copied, and its queue's lock may have been
+        held at the moment of the fork."""
+        self.handler.queue = queue.Queue(self.queue_size)
+        self.listener = QueueListener(self.handler.queue, self.output, respect_handler_level=True)
+        self.listener.start()
+
+
+def log_request(response: Response) -> Response:
+    """One record per request with its route, status and duration.
+
+    Successful fast-path requests (assets, probes and metrics) are left out,
+    and 404s and 429s are sampled.
+    """
+    current_request = request._get_current_object()  # pylint: disable=protected-access
+    environ = current_request.environ
+    status = response.status_code
+    if status < 400 and current_app.fast_path.is_fast_path(environ):
+        return response
+    started = environ.get(REQUEST_STARTED_ENVIRON_KEY)
+    logger.info(
+        "%s %s %s",
+        current_request.method,
+        current_request.path,
+        status,
+        extra={
+            "route": current_request.endpoint or "unmatched",
+            "method": current_request.method,
+            "path": current_request.path,
+            "status": status,
+            "duration_ms": None if started is None else round((time.perf_counter() - started) * 1000, 3),
+            "sample_key": SAMPLED_STATUSES.get(status),
+        },
+    )
+    return response
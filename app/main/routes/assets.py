@@ -0,0 +1,37 @@
+import mimetypes
+import os
+
+from flask import Blueprint, abort, current_app, request, send_from_directory
+
+from app.main.services.asset_service import (
+    DIST_DIRECTORY,
+    ENCODINGS,
+    FINGERPRINTED_URL_PATH,
+)
+
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+assets_route = Blueprint("assets_route", __name__)
+
+
+@assets_route.route(f"{FINGERPRINTED_URL_PATH}/<path:filename>")
+def send_fingerprinted_asset(filename: str):
+    encodings = current_app.asset_variants.get(filename)
+    if encodings is None:
+        abort(404)
+
+    encoding = next(
+        (encoding for encoding in encodings if request.accept_encodings[encoding]), None
+    )
+    response = send_from_directory(
+        os.path.join(current_app.static_folder, DIST_DIRECTORY),
+        filename + ENCODINGS[encoding] if encoding else filename,
+        mimetype=mimetypes.guess_type(filename)[0],
+        max_age=IMMUTABLE_MAX_AGE,
+    )
+    if encoding:
+        response.content_encoding = encoding
+    response.vary.add("Accept-Encoding")
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
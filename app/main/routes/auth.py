@@ -2,33 +2,29 @@ import logging
 
 from flask import Blueprint, current_app, redirect, session, url_for
 
-from app.main.config.app_config import app_config
-from app.main.services.auth0_service import Auth0_Service
+from app.main.middleware.server_side_session import regenerate_session
 
 logger = logging.getLogger(__name__)
 
 auth_route = Blueprint("auth_routes", __name__)
 
-auth0_service = Auth0_Service(
-    current_app,
-    app_config.auth0.client_id,
-    app_config.auth0.client_secret,
-    app_config.auth0.domain,
-)
-
 
 @auth_route.route("/login")
 def login():
-    return auth0_service.login(url_for("auth_routes.callback", _external=True))
+    return current_app.auth0_service.login(url_for("auth_routes.callback", _external=True))
 
 
 @auth_route.route("/logout", methods=["GET", "POST"])
 def logout():
     session.clear()
-    return auth0_service.logout(url_for("main.index", _external=True))
+    return current_app.auth0_service.logout(url_for("main.index", _external=True))
 
 
 @auth_route.route("/callback", methods=["GET", "POST"])
 def callback():
-    session["user"] = auth0_service.get_access_token()
+    # Only the verified email is kept; the tokens are not needed after login
+    token = current_app.auth0_service.get_access_token()
+    # A new session id on login, so one planted beforehand is never authenticated
+    regenerate_session(session)
+    session["verified_email"] = token["userinfo"]["email"]
     return redirect("/join/send-invitation")
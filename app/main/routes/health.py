@@ -0,0 +1,28 @@
+from flask import Blueprint, Response, current_app, jsonify
+
+health_route = Blueprint("health_route", __name__)
+
+
+@health_route.route("/healthz")
+def healthz():
+    return Response("ok", mimetype="text/plain")
+
+
+@health_route.route("/readyz")
+def readyz():
+    readiness = current_app.readiness
+    response = jsonify(
+        ready=readiness.is_ready(),
+        degraded=readiness.is_degraded(),
+        checks={
+            name: {
+                "ready": result.is_ready,
+                "degraded": result.is_degraded,
+                "detail": result.detail,
+                "checked_at": result.checked_at,
+            }
+            for name, result in readiness.results.items()
+        },
+    )
+    response.status_code = 200 if readiness.is_ready() else 503
+    return response
@@ -1,13 +1,13 @@
 import logging
-from typing import Any
 
-from flask import (Blueprint, abort, current_app, flash, redirect,
+from flask import (Blueprint, abort, current_app, flash, jsonify, redirect,
                    render_template, request, session, url_for)
-from github import GithubException
 
-from app.main.config.app_config import app_config
 from app.main.middleware.auth import requires_auth
-from app.main.validators.index import is_valid_email_pattern
+from app.main.middleware.error_handler import InvitationsDeferred
+from app.main.services.github_service import InvitationStatus
+from app.main.services.organisation_registry import organisation_registry
+from app.main.validators.email_policy import email_policy
 
 logger = logging.getLogger(__name__)
 join_route = Blueprint("join_route", __name__)
@@ -17,11 +17,12 @@ join_route = Blueprint("join_route", __name__)
 def submit_email():
     if request.method == "POST":
         user_input_email = request.form.get("emailAddress", "Empty").strip()
-        if not is_valid_email_pattern(user_input_email):
+        classification = email_policy.classify(user_input_email)
+        if not classification.is_valid:
             flash("Please enter a valid email address.")
             return render_template("pages/submit-email.html")
         session["user_input_email"] = user_input_email
-        if is_pre_approved_email_domain(user_input_email):
+        if classification.is_pre_approved:
             return redirect("/join/select-organisations")
         return redirect("/join/outside-collaborator")
     return render_template("pages/submit-email.html")
@@ -39,16 +40,11 @@ def outside_collaborator():
 def select_organisations():
     user_input_email = session.get("user_input_email", "").lower()
     is_digital_justice_user = is_digital_justice_email(user_input_email)
+    is_invitation_quota_low = (
+        current_app.github_service.get_invitation_quota().is_low
+    )
 
-    checkboxes_items = [
-        {
-            "value": org.name,
-            "text": org.display_text,
-            "disabled":
-            org.name == "moj-analytical-services" and is_digital_justice_user,
-        }
-        for org in get_enabled_organisations()
-    ]
+    checkboxes_items = organisation_registry.checkbox_items(is_digital_justice_user)
 
     if request.method == "POST":
         sanitised_org_selection = sanitise_org_selection(
@@ -61,6 +57,7 @@ def select_organisations():
                 "pages/select-organisations.html",
                 checkboxes_items=checkboxes_items,
                 is_digital_justice_user=is_digital_justice_user,
+                is_invitation_quota_low=is_invitation_quota_low,
             )
 
         session["org_selection"] = sanitised_org_selection
@@ -70,6 +67,7 @@ def select_organisations():
         "pages/select-organisations.html",
         checkboxes_items=checkboxes_items,
         is_digital_justice_user=is_digital_justice_user,
+        is_invitation_quota_low=is_invitation_quota_low,
     )
 
 
@@ -95,7 +93,7 @@ def join_selection():
 @requires_auth
 @join_route.route("/invitation-sent")
 def invitation_sent():
-    auth0_email = session["user"]["userinfo"]["email"].lower()
+    auth0_email = session["verified_email"].lower()
     org_selection = sanitise_org_selection(session["org_selection"])
     if len(org_selection) == 1:
         org_selection_string = org_selection[0]
@@ -106,17 +104,37 @@ def invitation_sent():
         )
         template = "pages/multiple-invitations-sent.html"
 
+    invitation_job_id = session.get("invitation_job_id")
+    failed_organisations = session.get("failed_organisations", [])
+    deferred_organisations = session.get("deferred_organisations", [])
     session.clear()
 
     return render_template(
-        template, org_selection_string=org_selection_string, email=auth0_email
+        template,
+        org_selection_string=org_selection_string,
+        email=auth0_email,
+        invitation_job_id=invitation_job_id,
+        failed_organisations=failed_organisations,
+        deferred_organisations=deferred_organisations,
     )
 
 
+@join_route.route("/invitation-status/<job_id>")
+def invitation_status(job_id: str):
+    if not current_app.invitation_outbox:
+        abort(404)
+
+    job_status = current_app.invitation_outbox.get_status(job_id)
+    if job_status is None:
+        abort(404)
+
+    return jsonify(job_status)
+
+
 @requires_auth
 @join_route.route("/send-invitation")
 def send_invitation():
-    auth0_email = session["user"]["userinfo"]["email"].lower()
+    auth0_email = session["verified_email"].lower()
     user_input_email = session["user_input_email"].lower()
     org_selection = sanitise_org_selection(session["org_selection"])
 
@@ -129,46 +147,59 @@ def send_invitation():
         logger.error("Email domain is not pre-approved")
         abort(400, f"Email {auth0_email} is not pre-approved")
 
-    try:
-        current_app.github_service.send_invites_to_user_email(
+    if current_app.invitation_outbox:
+        session["invitation_job_id"] = current_app.invitation_outbox.enqueue(
             auth0_email, org_selection)
-    except GithubException as e:
-        error_message = str(e)
-        logger.error("GithubException occurred: %s", error_message)
-        if "already a part of this organization" in error_message:
-            logger.error(
-                "User %s is already a member of the organization.", auth0_email)
-            return render_template(
-                "pages/already-a-member.html",
-            )
-        # re-raise the exception if it's a different error
-        logger.error("An unexpected GithubException occurred: %s", error_message)
-        raise e
-    except Exception as e:
-        logger.error("An unexpected exception occurred: %s", str(e))
-        raise e
+        return redirect(url_for("join_route.invitation_sent"))
+
+    invitation_results = current_app.github_service.send_invites_to_user_email(
+        auth0_email, org_selection)
+
+    sent_organisations = organisations_with_status(invitation_results, InvitationStatus.SENT)
+    failed_organisations = organisations_with_status(invitation_results, InvitationStatus.FAILED)
+    deferred_organisations = organisations_with_status(invitation_results, InvitationStatus.RATE_LIMITED)
+    log_unsent_invitations(invitation_results)
+
+    # Only an error when nothing was sent; otherwise the invitations that went
+    # out are confirmed alongside the ones that did not
+    if not sent_organisations:
+        if failed_organisations:
+            abort(500)
+        if deferred_organisations:
+            raise InvitationsDeferred()
+        if not organisations_with_status(invitation_results, InvitationStatus.ALREADY_MEMBER):
+            abort(400, "None of the selected organisations can be joined")
+        logger.info(
+            "User %s is already a member of the selected organisations.", auth0_email)
+        return render_template(
+            "pages/already-a-member.html",
+        )
+
+    session["org_selection"] = sent_organisations
+    session["failed_organisations"] = failed_organisations
+    session["deferred_organisations"] = deferred_organisations
 
     return redirect(url_for("join_route.invitation_sent"))
 
 
-def get_enabled_organisations() -> list[Any]:
-    return [
-        organisation
-        for organisation in app_config.github.organisations
-        if organisation.enabled
-    ]
+def log_unsent_invitations(invitation_results) -> None:
+    for result in invitation_results:
+        if result.status == InvitationStatus.FAILED:
+            logger.error(
+                "Invitation to organisation [ %s ] failed: %s",
+                result.organisation, result.error, extra={"org": result.organisation})
+        elif result.status == InvitationStatus.RATE_LIMITED:
+            logger.warning(
+                "Invitation to organisation [ %s ] deferred by the GitHub rate limit",
+                result.organisation, extra={"org": result.organisation})
 
 
-def get_enabled_organisations_names() -> list[str]:
-    return [
-        organisation.name
-        for organisation in app_config.github.organisations
-        if organisation.enabled
-    ]
+def organisations_with_status(invitation_results, status: InvitationStatus) -> list[str]:
+    return [result.organisation for result in invitation_results if result.status == status]
 
 
 def sanitise_org_selection(org_selection: list[str]) -> list[str]:
-    enabled_organisation_names = get_enabled_organisations_names()
+    enabled_organisation_names = organisation_registry.enabled_names
 
     sanitised_org_selection = []
     for org_name in org_selection:
@@ -184,10 +215,8 @@ def sanitise_org_selection(org_selection: list[str]) -> list[str]:
 
 
 def is_pre_approved_email_domain(email: str) -> bool:
-    domain = email[email.index("@") + 1:]
-    return domain in app_config.github.allowed_email_domains
+    return email_policy.classify(email).is_pre_approved
 
 
 def is_digital_justice_email(email: str) -> bool:
-    domain = email[email.index("@")+1:]
-    return "digital.justice.gov.uk" == domain.lower()
+    return email_policy.classify(email).is_digital_justice
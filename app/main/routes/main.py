@@ -3,9 +3,12 @@ from flask import (
     render_template
 )
 
+from app.main.middleware.page_cache import cached_page
+
 main = Blueprint("main", __name__)
 
 
 @main.route("/")
+@cached_page
 def index():
     return render_template("pages/home.html")
@@ -0,0 +1,15 @@
+from flask import Blueprint, Response, abort, request
+
+from app.main.services.metrics_service import render_metrics
+
+metrics_route = Blueprint("metrics_route", __name__)
+
+
+@metrics_route.route("/metrics")
+def metrics():
+    # Prometheus scrapes the pod directly; requests through the ingress carry
+    # X-Forwarded-For and are not shown the metrics
+    if "X-Forwarded-For" in request.headers:
+        abort(404)
+    body, content_type = render_metrics()
+    return Response(body, content_type=content_type)
@@ -3,9 +3,12 @@ from flask import (
     send_from_directory
 )
 
+from app.main.middleware.page_cache import cached_page
+
 robot_route = Blueprint("robot_route", __name__)
 
 
 @robot_route.route("/robots.txt")
+@cached_page
 def send_robots_txt():
     return send_from_directory("static", "robots.txt")
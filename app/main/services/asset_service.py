@@ -0,0 +1,112 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli variants are optional
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+DIST_DIRECTORY = "dist"
+MANIFEST_FILENAME = "manifest.json"
+STATIC_URL_PATH = "/assets"
+FINGERPRINTED_URL_PATH = f"{STATIC_URL_PATH}/{DIST_DIRECTORY}"
+COMPRESSIBLE_EXTENSIONS = (".css", ".js", ".svg", ".json", ".ico", ".txt")
+# Files requested by name, by browsers or crawlers, keep their unhashed URL only
+UNFINGERPRINTED_FILES = ("robots.txt", "VERSION.txt", "manifest.json")
+ENCODINGS = {"br": ".br", "gzip": ".gz"}
+CSS_URL_PATTERN = re.compile(r"url\(\s*['\"]?" + re.escape(STATIC_URL_PATH) + r"/([^'\")?#]+)")
+
+
+def fingerprint(path: str, content: bytes) -> str:
+    stem, extension = os.path.splitext(path)
+    return f"{stem}.{hashlib.sha256(content).hexdigest()[:12]}{extension}"
+
+
+def build_assets(static_folder: str) -> dict[str, str]:
+    """Copy each static file to ``dist/`` under a content-hashed name, with
+    ``.gz`` and ``.br`` variants where they are smaller, and write a manifest
+    mapping original paths to fingerprinted ones.
+
+    Stylesheets are fingerprinted last, with their ``url(/assets/...)``
+    references rewritten, so a font or image change also changes the hash of
+    the stylesheets using it.
+    """
+    dist_folder = os.path.join(static_folder, DIST_DIRECTORY)
+    shutil.rmtree(dist_folder, ignore_errors=True)
+
+    paths = sorted(
+        os.path.relpath(os.path.join(directory, filename), static_folder)
+        for directory, _, filenames in os.walk(static_folder)
+        for filename in filenames
+        if filename not in UNFINGERPRINTED_FILES
+    )
+    manifest = {}
+    for path in sorted(paths, key=lambda path: path.endswith(".css")):
+        with open(os.path.join(static_folder, path), "rb") as asset:
+            content = asset.read()
+        if path.endswith(".css"):
+            content = CSS_URL_PATTERN.sub(
+                lambda match: match.group(0).replace(
+                    f"{STATIC_URL_PATH}/{match.group(1)}", asset_url(manifest, match.group(1))
+                ),
+                content.decode("utf-8"),
+            ).encode("utf-8")
+        manifest[path] = fingerprint(path, content)
+        write_variants(os.path.join(dist_folder, manifest[path]), content)
+
+    with open(os.path.join(dist_folder, MANIFEST_FILENAME), "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+    logger.info("Fingerprinted %d assets into [ %s ]", len(manifest), dist_folder)
+    return manifest
+
+
+def write_variants(path: str, content: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as asset:
+        asset.write(content)
+    if not path.endswith(COMPRESSIBLE_EXTENSIONS):
+        return
+
+    variants = {".gz": gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(content, quality=11)
+    for suffix, compressed in variants.items():
+        if len(compressed) < len(content):
+            with open(path + suffix, "wb") as variant:
+                variant.write(compressed)
+
+
+def load_manifest(static_folder: str) -> dict[str, str]:
+    try:
+        with open(os.path.join(static_folder, DIST_DIRECTORY, MANIFEST_FILENAME), encoding="utf-8") as manifest_file:
+            return json.load(manifest_file)
+    except FileNotFoundError:
+        return {}
+
+
+def asset_url(manifest: dict[str, str], path: str) -> str:
+    """URL of a static asset: fingerprinted when it has been built, otherwise
+    the plain ``/assets`` URL Flask serves from ``app/static``."""
+    if path in manifest:
+        return f"{FINGERPRINTED_URL_PATH}/{manifest[path]}"
+    return f"{STATIC_URL_PATH}/{path}"
+
+
+def precompressed_variants(static_folder: str, manifest: dict[str, str]) -> dict[str, list[str]]:
+    """Map each fingerprinted path to the encodings it has a variant for, in preference order."""
+    dist_folder = os.path.join(static_folder, DIST_DIRECTORY)
+    return {
+        fingerprinted: [
+            encoding
+            for encoding, suffix in ENCODINGS.items()
+            if os.path.exists(os.path.join(dist_folder, fingerprinted + suffix))
+        ]
+        for fingerprinted in manifest.values()
+    }
@@ -1,13 +1,141 @@
 import logging
-from typing import Any
+import threading
+import time
+from typing import Any, Callable
 from urllib.parse import quote_plus, urlencode
 
-from authlib.integrations.flask_client import OAuth
+from authlib.integrations.flask_client import FlaskOAuth2App, OAuth
+from authlib.integrations.requests_client import OAuth2Session
 from flask import Flask, redirect
 
+from app.main.config.app_config import app_config
+from app.main.services.http_client import mount_http_adapter
+from app.main.services.metrics_service import time_outbound_request
+
 logger = logging.getLogger(__name__)
 
 
+class Auth0HttpSession(OAuth2Session):
+    """Authlib session on the shared keep-alive pool with per-call timeouts."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        mount_http_adapter(self)
+
+    def request(self, method, url, withhold_token=False, auth=None, **kwargs):
+        # Authlib fetches discovery metadata and JWKS with ``withhold_token``
+        kwargs.setdefault(
+            "timeout",
+            app_config.http.timeouts.auth0_metadata
+            if withhold_token
+            else app_config.http.timeouts.auth0_token,
+        )
+        with time_outbound_request("auth0", "metadata" if withhold_token else "token"):
+            return super().request(
+                method, url, withhold_token=withhold_token, auth=auth, **kwargs
+            )
+
+
+class OidcMetadataCache:  # pylint: disable=too-many-instance-attributes
+    """The discovery document and JWKS of the identity provider, shared by every
+    request in the process.
+
+    Metadata younger than ``ttl_seconds`` is served as is. Older metadata is
+    still served for up to ``max_stale_seconds`` more while one background
+    thread fetches a replacement, so a request only waits on a fetch when
+    there is nothing usable cached.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], dict],
+        ttl_seconds: int = 3600,
+        max_stale_seconds: int = 86400,
+        clock=time.time,
+    ) -> None:
+        self.fetch = fetch
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self.clock = clock
+        self.metadata: dict | None = None
+        self.loaded_at = 0.0
+        self.__fetch_lock = threading.Lock()
+        self.__refresh_lock = threading.Lock()
+        self.__is_refreshing = False
+
+    def get(self) -> dict:
+        metadata = self.metadata
+        age = self.clock() - self.loaded_at
+        if metadata is not None and age < self.ttl_seconds:
+            return metadata
+        if metadata is not None and age < self.ttl_seconds + self.max_stale_seconds:
+            self.refresh_in_background()
+            return metadata
+        return self.refresh(force=False)
+
+    def refresh(self, force: bool = True) -> dict:
+        with self.__fetch_lock:
+            # Another thread may have fetched while this one waited for the lock
+            if not force and self.metadata is not None and self.clock() - self.loaded_at < self.ttl_seconds:
+                return self.metadata
+            metadata = self.fetch()
+            self.metadata, self.loaded_at = metadata, self.clock()
+            return metadata
+
+    def refresh_in_background(self) -> None:
+        with self.__refresh_lock:
+            if self.__is_refreshing:
+                return
+            self.__is_refreshing = True
+        threading.Thread(target=self.__refresh_quietly, name="oidc-metadata-refresh", daemon=True).start()
+
+    def __refresh_quietly(self) -> None:
+        try:
+            self.refresh()
+            logger.info("Refreshed OIDC metadata")
+        except Exception as e:
+            logger.warning("Failed to refresh OIDC metadata: %s", str(e))
+        finally:
+            self.__is_refreshing = False
+
+
+class Auth0App(FlaskOAuth2App):
+    """Authlib client reading discovery metadata and JWKS from an ``OidcMetadataCache``.
+
+    ``id_token`` signatures are verified locally against the cached keys; the
+    keys are only re-fetched when a token is signed with an unknown key.
+    """
+
+    client_cls = Auth0HttpSession
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.metadata_cache = OidcMetadataCache(
+            self.fetch_server_metadata,
+            app_config.auth0.metadata_ttl_seconds,
+            app_config.auth0.metadata_max_stale_seconds,
+        )
+
+    def fetch_server_metadata(self) -> dict:
+        with self.client_cls(**self.client_kwargs) as session:
+            response = session.request("GET", self._server_metadata_url, withhold_token=True)
+            response.raise_for_status()
+            metadata = response.json()
+            response = session.request("GET", metadata["jwks_uri"], withhold_token=True)
+            response.raise_for_status()
+            metadata["jwks"] = response.json()
+        metadata["_loaded_at"] = time.time()
+        return {**self.server_metadata, **metadata}
+
+    def load_server_metadata(self) -> dict:
+        return self.metadata_cache.get()
+
+    def fetch_jwk_set(self, force: bool = False) -> dict:
+        if force:
+            return self.metadata_cache.refresh()["jwks"]
+        return self.load_server_metadata()["jwks"]
+
+
 class Auth0_Service:
     def __init__(
         self, app: Flask, client_id: str, client_secret: str, domain: str
@@ -17,6 +145,7 @@ class Auth0_Service:
         self.oauth = OAuth(app)
         self.oauth.register(
             "auth0",
+            client_cls=Auth0App,
             client_id=client_id,
             client_secret=client_secret,
             client_kwargs={
@@ -25,6 +154,13 @@ class Auth0_Service:
             server_metadata_url=f"https://{domain}/.well-known/openid-configuration",
         )
 
+    def load_server_metadata(self) -> dict:
+        return self.oauth.auth0.load_server_metadata()
+
+    def prefetch_server_metadata(self) -> None:
+        """Start fetching discovery metadata and JWKS so the first login does not wait."""
+        self.oauth.auth0.metadata_cache.refresh_in_background()
+
     def login(self, redirect_uri: str) -> Any:
         return self.oauth.auth0.authorize_redirect(
             redirect_uri=redirect_uri, _external=True
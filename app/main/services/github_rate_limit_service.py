@@ -0,0 +1,150 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+
+from limits import RateLimitItemPerDay, RateLimitItemPerSecond
+from limits.storage import storage_from_string
+from limits.strategies import SlidingWindowCounterRateLimiter
+
+# Registers the sqlite:// and sketch:// storage schemes with limits
+from app.main.services import rate_limit_storage  # noqa: F401  # pylint: disable=unused-import
+
+logger = logging.getLogger(__name__)
+
+INVITATION_WINDOW_SECONDS = 24 * 60 * 60
+PACING_WINDOW_SECONDS = 10
+# Keys in the shared rate limit storage, beside the per-client request limits
+REQUESTS_KEY = "github-requests"
+INVITATIONS_KEY = "github-invitations"
+# Shortest pause between checks, so a deferred call does not spin on the storage
+MIN_WAIT_SECONDS = 0.05
+
+
+@dataclass(frozen=True)
+class InvitationQuota:
+    remaining_requests: int | None
+    blocked_until: float
+    remaining_invitations: dict[str, int] = field(default_factory=dict)
+    is_low: bool = False
+
+
+class GithubRateLimitScheduler:  # pylint: disable=too-many-instance-attributes
+    """Paces GitHub calls for one token so they stay inside GitHub's limits.
+
+    The primary budget (``X-RateLimit-*``) and any ``Retry-After`` back-off are
+    read from every response. Content-creating calls are additionally paced to
+    stay under the secondary rate limit, and invitations are counted per
+    organisation against GitHub's rolling 24 hour invitation limit.
+
+    The pacing and invitation counters are kept in the rate limit storage at
+    ``storage_uri``, so every process using the same storage shares one
+    budget: ``sqlite://`` shares it between the workers on a pod and
+    ``redis://`` between pods. With ``memory://`` or ``sketch://`` each
+    gunicorn worker keeps its own counters.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        requests_per_minute: int = 80,
+        daily_invitation_limit: int = 500,
+        max_wait_seconds: int = 5,
+        low_quota_threshold: int = 10,
+        storage_uri: str = "memory://",
+        clock=time.time,
+    ) -> None:
+        self.max_wait_seconds = max_wait_seconds
+        self.low_quota_threshold = low_quota_threshold
+        self.clock = clock
+        self.limiter = SlidingWindowCounterRateLimiter(storage_from_string(storage_uri))
+        # Bursts of up to a sixth of the per-minute budget, as GitHub recommends spreading calls out
+        self.requests = RateLimitItemPerSecond(
+            max(1, requests_per_minute * PACING_WINDOW_SECONDS // 60), PACING_WINDOW_SECONDS
+        )
+        self.invitations = RateLimitItemPerDay(daily_invitation_limit)
+        self.remaining_requests: int | None = None
+        self.reset_at = 0.0
+        self.blocked_until = 0.0
+        self.organisation_blocked_until: dict[str, float] = {}
+        self.__lock = threading.Lock()
+
+    def acquire(self, organisation: str) -> bool:
+        """Wait for budget to invite to ``organisation``.
+
+        Returns ``False`` if the call should be deferred because budget will
+        not be available within ``max_wait_seconds``.
+        """
+        deadline = self.clock() + self.max_wait_seconds
+        while True:
+            with self.__lock:
+                now = self.clock()
+                if not self.limiter.test(self.invitations, INVITATIONS_KEY, organisation):
+                    return False
+                wait = max(
+                    self.blocked_until - now,
+                    self.organisation_blocked_until.get(organisation, 0) - now,
+                    0,
+                )
+                if self.remaining_requests is not None and self.reset_at <= now:
+                    self.remaining_requests = None
+                if wait == 0 and self.remaining_requests is not None and self.remaining_requests <= 0:
+                    wait = self.reset_at - now
+                if wait == 0 and not self.limiter.hit(self.requests, REQUESTS_KEY):
+                    reset_time = self.limiter.get_window_stats(self.requests, REQUESTS_KEY).reset_time
+                    wait = max(reset_time - now, MIN_WAIT_SECONDS)
+                if wait == 0:
+                    if self.remaining_requests is not None:
+                        self.remaining_requests -= 1
+                    return True
+            if now + wait > deadline:
+                logger.warning("Deferring GitHub call for organisation [ %s ] for %.1f seconds", organisation, wait)
+                return False
+            time.sleep(wait)
+
+    def record_response(self, organisation: str, response) -> None:
+        headers = response.headers
+        now = self.clock()
+        with self.__lock:
+            if "X-RateLimit-Remaining" in headers:
+                self.remaining_requests = int(headers["X-RateLimit-Remaining"])
+            if "X-RateLimit-Reset" in headers:
+                self.reset_at = float(headers["X-RateLimit-Reset"])
+            if "Retry-After" in headers:
+                self.blocked_until = max(self.blocked_until, now + float(headers["Retry-After"]))
+            elif response.status_code in (403, 429) and self.remaining_requests == 0:
+                self.blocked_until = max(self.blocked_until, self.reset_at)
+
+            if response.status_code == 201:
+                self.limiter.hit(self.invitations, INVITATIONS_KEY, organisation)
+            elif response.status_code == 422 and "invitation rate limit" in response.text.lower():
+                self.organisation_blocked_until[organisation] = now + INVITATION_WINDOW_SECONDS
+
+    def __remaining_invitations(self, organisation: str) -> int:
+        return self.limiter.get_window_stats(self.invitations, INVITATIONS_KEY, organisation).remaining
+
+    def get_quota(self, organisations: list[str]) -> InvitationQuota:
+        with self.__lock:
+            now = self.clock()
+            remaining_invitations = {
+                organisation: 0
+                if self.organisation_blocked_until.get(organisation, 0) > now
+                else self.__remaining_invitations(organisation)
+                for organisation in organisations
+            }
+            return InvitationQuota(
+                remaining_requests=self.remaining_requests,
+                blocked_until=self.blocked_until,
+                remaining_invitations=remaining_invitations,
+                is_low=(
+                    self.blocked_until > now
+                    or (
+                        self.remaining_requests is not None
+                        and self.remaining_requests < self.low_quota_threshold
+                        and self.reset_at > now
+                    )
+                    or any(
+                        remaining < self.low_quota_threshold
+                        for remaining in remaining_invitations.values()
+                    )
+                ),
+            )
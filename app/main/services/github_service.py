@@ -1,30 +1,164 @@
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from http.cookiejar import DefaultCookiePolicy
+from typing import TYPE_CHECKING
 
 import requests
-from github import Github
+import sentry_sdk
+from sentry_sdk.tracing import Span
 
 from app.main.config.app_config import app_config
+from app.main.services.github_rate_limit_service import (
+    GithubRateLimitScheduler,
+    InvitationQuota,
+)
+from app.main.services.http_client import create_http_session
+from app.main.services.metrics_service import INVITATIONS, time_outbound_request
+from app.main.services.organisation_registry import organisation_registry
+from app.main.services.tracing_service import child_span
+
+if TYPE_CHECKING:
+    from github import Github
 
 logger = logging.getLogger(__name__)
 
 
+class InvitationStatus(Enum):
+    SENT = "sent"
+    ALREADY_MEMBER = "already_member"
+    FAILED = "failed"
+    RATE_LIMITED = "rate_limited"
+    SKIPPED_DISABLED = "skipped_disabled"
+
+
+@dataclass(frozen=True)
+class InvitationResult:
+    organisation: str
+    status: InvitationStatus
+    error: str | None = None
+
+
 class GithubService:
     def __init__(self, org_token: str) -> None:
-        self.github_client_core_api: Github = Github(org_token)
-        self.github_client_rest_api = requests.Session()
+        self.api_base_url = app_config.github.api_base_url
+        self.__org_token = org_token
+        # Shared by the invitation threads; refusing cookies keeps the session read-only
+        self.github_client_rest_api = create_http_session()
+        self.github_client_rest_api.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
         self.github_client_rest_api.headers.update(
             {
                 "Accept": "application/vnd.github+json",
                 "Authorization": f"Bearer {org_token}",
             }
         )
+        self.invitation_executor = ThreadPoolExecutor(
+            max_workers=app_config.github.invite_max_workers,
+            thread_name_prefix="github-invite",
+        )
+        self.rate_limit_scheduler = GithubRateLimitScheduler(
+            requests_per_minute=app_config.github.rate_limit.requests_per_minute,
+            daily_invitation_limit=app_config.github.rate_limit.daily_invitation_limit,
+            max_wait_seconds=app_config.github.rate_limit.max_wait_seconds,
+            low_quota_threshold=app_config.github.rate_limit.low_quota_threshold,
+            storage_uri=app_config.rate_limit.storage_uri,
+        )
+
+    @functools.cached_property
+    def github_client_core_api(self) -> "Github":
+        # PyGithub is a large share of start-up time and nothing on the join
+        # flow uses it, so it is only imported when first needed
+        from github import Github  # pylint: disable=import-outside-toplevel
 
-    def send_invites_to_user_email(self, email: str, organisations: list) -> None:
-        valid_orgs = [organisation.name for organisation in app_config.github.organisations if organisation.enabled]
+        return Github(self.__org_token, base_url=self.api_base_url)
+
+    def send_invites_to_user_email(self, email: str, organisations: list) -> list[InvitationResult]:
+        valid_orgs = organisation_registry.enabled_names
+        # Invitations run on other threads, so hand them the request's span explicitly
+        parent_span = sentry_sdk.get_current_span()
+        results = {}
+        futures = {}
         for organisation in organisations:
             if organisation in valid_orgs and app_config.github.send_email_invites_is_enabled:
-                self.github_client_core_api.get_organization(organisation.lower()).invite_user(email=email)
+                futures[organisation] = self.invitation_executor.submit(self.__send_invite, email, organisation, parent_span)
             elif not app_config.github.send_email_invites_is_enabled:
-                logger.info("Invitation for organisation [ %s ] not sent as SEND_EMAIL_INVITES is [ %s ]", organisation, app_config.github.send_email_invites_is_enabled)
+                logger.info("Invitation for organisation [ %s ] not sent as SEND_EMAIL_INVITES is [ %s ]", organisation, app_config.github.send_email_invites_is_enabled, extra={"org": organisation})
+                results[organisation] = InvitationResult(organisation, InvitationStatus.SKIPPED_DISABLED)
             else:
-                logger.info("Invitation for organisation [ %s ] not sent as selected organisation is invalid", organisation)
+                logger.info("Invitation for organisation [ %s ] not sent as selected organisation is invalid", organisation, extra={"org": organisation})
+                results[organisation] = InvitationResult(organisation, InvitationStatus.SKIPPED_DISABLED)
+
+        for organisation, future in futures.items():
+            results[organisation] = future.result()
+
+        for result in results.values():
+            INVITATIONS.labels(result.status.value).inc()
+
+        return [results[organisation] for organisation in organisations]
+
+    def get_invitation_quota(self) -> InvitationQuota:
+        return self.rate_limit_scheduler.get_quota(organisation_registry.snapshot.enabled_names_in_order)
+
+    def get_rate_limit_remaining(self) -> int:
+        """Requests left in the token's core REST budget; raises if the token is rejected.
+
+        ``GET /rate_limit`` does not itself count against the budget.
+        """
+        with time_outbound_request("github", "rate_limit"):
+            response = self.github_client_rest_api.get(
+                f"{self.api_base_url}/rate_limit",
+                timeout=app_config.http.timeouts.readiness_check,
+            )
+        response.raise_for_status()
+        return response.json()["resources"]["core"]["remaining"]
+
+    def __send_invite(self, email: str, organisation: str, parent_span: Span | None = None) -> InvitationResult:
+        with child_span("github.invitation", organisation, parent_span) as span:
+            result = self.__invite(email, organisation, span)
+            if span is not None:
+                span.set_data("outcome", result.status.value)
+            return result
+
+    def __invite(self, email: str, organisation: str, span: Span | None) -> InvitationResult:
+        if not self.rate_limit_scheduler.acquire(organisation):
+            logger.warning("Invitation for organisation [ %s ] deferred as the GitHub rate limit is exhausted", organisation, extra={"org": organisation})
+            return InvitationResult(organisation, InvitationStatus.RATE_LIMITED, "GitHub rate limit exhausted")
+        try:
+            status, error = self.invite_user_by_email(organisation, email, span)
+        except requests.RequestException as e:
+            logger.error("Invitation for organisation [ %s ] failed: %s", organisation, str(e), extra={"org": organisation})
+            return InvitationResult(organisation, InvitationStatus.FAILED, str(e))
+        if status == InvitationStatus.ALREADY_MEMBER:
+            logger.info("User is already a member of organisation [ %s ]", organisation, extra={"org": organisation})
+        elif status == InvitationStatus.RATE_LIMITED:
+            logger.warning("Invitation for organisation [ %s ] was rate limited by GitHub: %s", organisation, error, extra={"org": organisation})
+        elif status == InvitationStatus.FAILED:
+            logger.error("Invitation for organisation [ %s ] failed: %s", organisation, error, extra={"org": organisation})
+        return InvitationResult(organisation, status, error)
+
+    def invite_user_by_email(
+        self, organisation: str, email: str, parent_span: Span | None = None
+    ) -> tuple[InvitationStatus, str | None]:
+        """Invite an email address to an organisation with a single REST call.
+
+        Unlike ``Github.get_organization(...).invite_user(...)`` this does not
+        fetch the organisation before creating the invitation.
+        """
+        with time_outbound_request("github", "create_invitation", parent_span):
+            response = self.github_client_rest_api.post(
+                f"{self.api_base_url}/orgs/{organisation.lower()}/invitations",
+                json={"email": email, "role": "direct_member"},
+                timeout=app_config.http.timeouts.github_invite,
+            )
+        self.rate_limit_scheduler.record_response(organisation, response)
+        if response.status_code == 201:
+            return InvitationStatus.SENT, None
+        if response.status_code == 422 and "already a part of this organization" in response.text:
+            return InvitationStatus.ALREADY_MEMBER, None
+        if (
+            response.status_code in (403, 429) and ("Retry-After" in response.headers or "rate limit" in response.text)
+        ) or (response.status_code == 422 and "invitation rate limit" in response.text.lower()):
+            return InvitationStatus.RATE_LIMITED, f"{response.status_code} {response.text}"
+        return InvitationStatus.FAILED, f"{response.status_code} {response.text}"
@@ -0,0 +1,102 @@
+import logging
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.main.config.app_config import app_config
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS_CODES = (502, 503, 504)
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """An ``HTTPAdapter`` whose connection pool outlives the sessions using it.
+
+    Authlib opens and closes a session for every OAuth call; closing a normal
+    adapter would drop its pooled keep-alive connections each time.
+    """
+
+    def close(self) -> None:
+        pass
+
+
+def build_retry() -> Retry:
+    """Retry connection failures for any method, and 5xx responses and read
+    errors only for idempotent methods, with jittered exponential backoff."""
+    return Retry(
+        total=app_config.http.max_retries,
+        backoff_factor=app_config.http.backoff_factor,
+        backoff_jitter=app_config.http.backoff_jitter,
+        backoff_max=app_config.http.backoff_max,
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        status_forcelist=RETRY_STATUS_CODES,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+class SharedHTTPAdapter:
+    """The process's one ``KeepAliveHTTPAdapter``, created on first use."""
+
+    def __init__(self) -> None:
+        self.adapter: HTTPAdapter | None = None
+        self.lock = threading.Lock()
+
+    def get(self) -> HTTPAdapter:
+        with self.lock:
+            if self.adapter is None:
+                self.adapter = KeepAliveHTTPAdapter(
+                    pool_connections=app_config.http.pool_connections,
+                    pool_maxsize=app_config.http.pool_maxsize,
+                    max_retries=build_retry(),
+                )
+            return self.adapter
+
+    def discard_inherited_connections(self) -> None:
+        # A forked worker must not share the parent's sockets, so give the shared
+        # adapter a new, empty pool without closing the parent's connections
+        self.lock = threading.Lock()
+        if self.adapter is not None:
+            self.adapter.init_poolmanager(
+                app_config.http.pool_connections, app_config.http.pool_maxsize
+            )
+
+
+shared_http_adapter = SharedHTTPAdapter()
+
+
+def get_http_adapter() -> HTTPAdapter:
+    return shared_http_adapter.get()
+
+
+def __discard_inherited_connections() -> None:
+    shared_http_adapter.discard_inherited_connections()
+
+
+os.register_at_fork(after_in_child=__discard_inherited_connections)
+
+
+def mount_http_adapter(session: requests.Session) -> requests.Session:
+    adapter = get_http_adapter()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def create_http_session() -> requests.Session:
+    return mount_http_adapter(requests.Session())
+
+
+def prewarm_connections(urls: list[str]) -> None:
+    """Open a pooled keep-alive connection to each URL before the first request needs it."""
+    session = create_http_session()
+    for url in urls:
+        try:
+            session.head(url, timeout=app_config.http.timeouts.prewarm)
+            logger.info("Pre-warmed connection to [ %s ]", url)
+        except requests.RequestException as e:
+            logger.warning("Failed to pre-warm connection to [ %s ]: %s", url, str(e))
@@ -0,0 +1,284 @@
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from enum import Enum
+
+from app.main.services.github_service import InvitationStatus
+from app.main.services.sqlite_connection import SQLiteConnections
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES = (InvitationStatus.FAILED.value, InvitationStatus.RATE_LIMITED.value)
+
+
+class InvitationJobStatus(Enum):
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class InvitationOutbox:
+    """Durable queue of invitation jobs stored in a local SQLite database.
+
+    The database runs in WAL mode so the web workers can enqueue jobs while a
+    worker drains them. A claimed job holds a lease; if the process dies before
+    the job is finished the lease expires and the job is claimed again.
+    """
+
+    def __init__(
+        self,
+        database_path: str,
+        max_attempts: int = 5,
+        backoff_seconds: int = 5,
+        max_backoff_seconds: int = 300,
+        lease_seconds: int = 60,
+    ) -> None:
+        self.database_path = database_path
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.lease_seconds = lease_seconds
+        self.__connections = SQLiteConnections(database_path, timeout=30, row_factory=sqlite3.Row)
+        self.__create_schema()
+
+    def __create_schema(self) -> None:
+        self.__connections.get().executescript(
+            """
+            CREATE TABLE IF NOT EXISTS invitation_jobs (
+                id TEXT PRIMARY KEY,
+                email TEXT NOT NULL,
+                organisations TEXT NOT NULL,
+                pending_organisations TEXT NOT NULL,
+                results TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                next_attempt_at REAL NOT NULL,
+                locked_until REAL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS invitation_jobs_due
+                ON invitation_jobs (status, next_attempt_at);
+            """
+        )
+
+    def enqueue(self, email: str, organisations: list[str]) -> str:
+        job_id = str(uuid.uuid4())
+        now = time.time()
+        self.__connections.get().execute(
+            """
+            INSERT INTO invitation_jobs (
+                id, email, organisations, pending_organisations, results,
+                status, next_attempt_at, created_at, updated_at
+            ) VALUES (?, ?, ?, ?, '{}', ?, ?, ?, ?)
+            """,
+            (
+                job_id,
+                email,
+                json.dumps(organisations),
+                json.dumps(organisations),
+                InvitationJobStatus.PENDING.value,
+                now,
+                now,
+                now,
+            ),
+        )
+        logger.info("Queued invitation job [ %s ] for %s", job_id, organisations)
+        return job_id
+
+    def claim_next(self) -> dict | None:
+        now = time.time()
+        connection = self.__connections.get()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                """
+                SELECT * FROM invitation_jobs
+                WHERE (status = ? AND next_attempt_at <= ?)
+                   OR (status = ? AND locked_until <= ?)
+                ORDER BY next_attempt_at
+                LIMIT 1
+                """,
+                (
+                    InvitationJobStatus.PENDING.value,
+                    now,
+                    InvitationJobStatus.IN_PROGRESS.value,
+                    now,
+                ),
+            ).fetchone()
+            if row is None:
+                connection.execute("COMMIT")
+                return None
+            connection.execute(
+                """
+                UPDATE invitation_jobs
+                SET status = ?, attempts = attempts + 1, locked_until = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (
+                    InvitationJobStatus.IN_PROGRESS.value,
+                    now + self.lease_seconds,
+                    now,
+                    row["id"],
+                ),
+            )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+        return {
+            "id": row["id"],
+            "email": row["email"],
+            "pending_organisations": json.loads(row["pending_organisations"]),
+            "results": json.loads(row["results"]),
+            "attempts": row["attempts"] + 1,
+        }
+
+    def record_attempt(
+        self, job: dict, results: dict[str, str], error: str | None = None
+    ) -> InvitationJobStatus:
+        """Store the outcome of an attempt and schedule a retry for failures.
+
+        ``results`` maps each organisation attempted to an ``InvitationStatus``
+        value; organisations that failed or were rate limited stay pending for
+        the next attempt.
+        """
+        merged_results = {**job["results"], **results}
+        pending_organisations = [
+            organisation
+            for organisation in job["pending_organisations"]
+            if merged_results.get(organisation, InvitationStatus.FAILED.value)
+            in RETRYABLE_STATUSES
+        ]
+        is_rate_limited = bool(pending_organisations) and all(
+            merged_results.get(organisation) == InvitationStatus.RATE_LIMITED.value
+            for organisation in pending_organisations
+        )
+        attempts = job["attempts"]
+        now = time.time()
+
+        if not pending_organisations:
+            status = InvitationJobStatus.COMPLETED
+            next_attempt_at = now
+        elif is_rate_limited:
+            # Waiting for GitHub's rate limit to reset does not use up attempts
+            status = InvitationJobStatus.PENDING
+            next_attempt_at = now + self.max_backoff_seconds
+            attempts -= 1
+        elif attempts >= self.max_attempts:
+            status = InvitationJobStatus.FAILED
+            next_attempt_at = now
+        else:
+            status = InvitationJobStatus.PENDING
+            next_attempt_at = now + self.__backoff(attempts)
+
+        self.__connections.get().execute(
+            """
+            UPDATE invitation_jobs
+            SET status = ?, attempts = ?, pending_organisations = ?, results = ?,
+                last_error = ?, next_attempt_at = ?, locked_until = NULL, updated_at = ?
+            WHERE id = ?
+            """,
+            (
+                status.value,
+                attempts,
+                json.dumps(pending_organisations),
+                json.dumps(merged_results),
+                error,
+                next_attempt_at,
+                now,
+                job["id"],
+            ),
+        )
+        return status
+
+    def __backoff(self, attempts: int) -> float:
+        delay = min(self.max_backoff_seconds, self.backoff_seconds * 2 ** (attempts - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    def get_status(self, job_id: str) -> dict | None:
+        row = self.__connections.get().execute(
+            "SELECT status, organisations, results FROM invitation_jobs WHERE id = ?",
+            (job_id,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        results = json.loads(row["results"])
+        return {
+            "status": row["status"],
+            "organisations": {
+                organisation: results.get(organisation, InvitationJobStatus.PENDING.value)
+                for organisation in json.loads(row["organisations"])
+            },
+        }
+
+
+class InvitationOutboxWorker:
+    """Drains an ``InvitationOutbox`` by sending invites through ``GithubService``."""
+
+    def __init__(self, outbox: InvitationOutbox, github_service, poll_interval_seconds: int = 1) -> None:
+        self.outbox = outbox
+        self.github_service = github_service
+        self.poll_interval_seconds = poll_interval_seconds
+        self.__stop_event = threading.Event()
+        self.__thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self.__thread is not None and self.__thread.is_alive():
+            return
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(
+            target=self.run_forever, name="invitation-outbox-worker", daemon=True
+        )
+        self.__thread.start()
+        logger.info("Invitation outbox worker started")
+
+    def stop(self) -> None:
+        self.__stop_event.set()
+        if self.__thread is not None:
+            self.__thread.join()
+
+    def run_forever(self) -> None:
+        while not self.__stop_event.is_set():
+            try:
+                processed = self.run_once()
+            except Exception as e:
+                logger.error("Invitation outbox worker failed to process a job: %s", str(e))
+                processed = False
+            if not processed:
+                self.__stop_event.wait(self.poll_interval_seconds)
+
+    def run_once(self) -> bool:
+        job = self.outbox.claim_next()
+        if job is None:
+            return False
+
+        try:
+            invitation_results = self.github_service.send_invites_to_user_email(
+                job["email"], job["pending_organisations"]
+            )
+        except Exception as e:
+            logger.error("Invitation job [ %s ] attempt %s failed: %s", job["id"], job["attempts"], str(e))
+            status = self.outbox.record_attempt(job, {}, str(e))
+        else:
+            errors = [
+                f"{result.organisation}: {result.error}"
+                for result in invitation_results
+                if result.status == InvitationStatus.FAILED
+            ]
+            status = self.outbox.record_attempt(
+                job,
+                {result.organisation: result.status.value for result in invitation_results},
+                "; ".join(errors) or None,
+            )
+
+        logger.info("Invitation job [ %s ] is now [ %s ]", job["id"], status.value)
+        return True
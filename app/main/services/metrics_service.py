@@ -0,0 +1,76 @@
+import contextlib
+import functools
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.multiprocess import MultiProcessCollector
+from sentry_sdk.tracing import Span
+
+from app.main.services.tracing_service import child_span
+
+# prometheus_client picks its storage when first imported: with
+# PROMETHEUS_MULTIPROC_DIR set, each process writes its samples to mmap files
+# in that directory and a scrape adds them up across every gunicorn worker.
+MULTIPROCESS_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+REQUEST_LATENCY = Histogram(
+    "join_github_request_duration_seconds",
+    "Time to handle a request, by endpoint.",
+    ["endpoint", "method", "status"],
+)
+OUTBOUND_REQUEST_LATENCY = Histogram(
+    "join_github_outbound_request_duration_seconds",
+    "Time spent on calls to GitHub and Auth0.",
+    ["service", "operation"],
+)
+INVITATIONS = Counter(
+    "join_github_invitations",
+    "GitHub invitations by outcome.",
+    ["outcome"],
+)
+RATE_LIMIT_REJECTIONS = Counter(
+    "join_github_rate_limit_rejections",
+    "Requests rejected by the rate limiter, by endpoint.",
+    ["endpoint"],
+)
+
+
+@functools.cache
+def outbound_request_latency(service: str, operation: str) -> Histogram:
+    return OUTBOUND_REQUEST_LATENCY.labels(service, operation)
+
+
+# Created on first use: an unlabelled metric writes its mmap file as soon as it
+# exists, and importing the app must not need PROMETHEUS_MULTIPROC_DIR
+@functools.cache
+def github_requests_remaining() -> Gauge:
+    return Gauge(
+        "join_github_github_requests_remaining",
+        "GitHub API requests left in the token's rate limit window, at the last readiness check.",
+        multiprocess_mode="mostrecent",
+    )
+
+
+@contextlib.contextmanager
+def time_outbound_request(service: str, operation: str, parent_span: Span | None = None):
+    """Time one call to ``service``, and trace it as a span of the request."""
+    with outbound_request_latency(service, operation).time(), \
+            child_span("http.client", f"{service} {operation}", parent_span):
+        yield
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """The latest samples in the Prometheus text format, with their content type."""
+    registry = REGISTRY
+    if os.environ.get(MULTIPROCESS_DIR_ENV):
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
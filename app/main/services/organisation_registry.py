@@ -0,0 +1,171 @@
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from types import MappingProxyType
+
+from app.main.config.app_config import app_config
+
+logger = logging.getLogger(__name__)
+
+# Digital Justice users are not offered these organisations
+DIGITAL_JUSTICE_EXCLUDED_ORGANISATIONS = frozenset({"moj-analytical-services"})
+
+
+@dataclass(frozen=True)
+class Organisation:
+    name: str
+    enabled: bool
+    display_text: str
+
+
+class OrganisationSnapshot:  # pylint: disable=too-few-public-methods
+    """One immutable version of the organisations, with every lookup the
+    request path needs computed up front."""
+
+    def __init__(self, organisations: tuple[Organisation, ...]) -> None:
+        self.organisations = organisations
+        self.by_name = MappingProxyType({organisation.name: organisation for organisation in organisations})
+        self.enabled = tuple(organisation for organisation in organisations if organisation.enabled)
+        self.enabled_names = frozenset(organisation.name for organisation in self.enabled)
+        self.enabled_names_in_order = tuple(organisation.name for organisation in self.enabled)
+        # Read-only view models for the select-organisations checkboxes, keyed on
+        # whether the user has a Digital Justice email address
+        self.checkbox_items = MappingProxyType({
+            is_digital_justice_user: tuple(
+                MappingProxyType({
+                    "value": organisation.name,
+                    "text": organisation.display_text,
+                    "disabled": is_digital_justice_user
+                    and organisation.name in DIGITAL_JUSTICE_EXCLUDED_ORGANISATIONS,
+                })
+                for organisation in self.enabled
+            )
+            for is_digital_justice_user in (False, True)
+        })
+        self.version = hashlib.sha256(
+            json.dumps([asdict(organisation) for organisation in organisations], sort_keys=True).encode("utf-8")
+        ).hexdigest()[:12]
+
+
+@contextlib.contextmanager
+def acquired_without_waiting(lock: threading.Lock):
+    """Hold ``lock`` if it is free, yielding whether it was acquired."""
+    acquired = lock.acquire(blocking=False)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            lock.release()
+
+
+def load_organisations(path: str) -> tuple[Organisation, ...]:
+    """Read ``{"organisations": [{"name": ..., "enabled": ..., "display_text": ...}]}``."""
+    with open(path, encoding="utf-8") as organisations_file:
+        organisations = json.load(organisations_file)["organisations"]
+    return tuple(
+        Organisation(
+            name=str(organisation["name"]),
+            enabled=organisation["enabled"] is True,
+            display_text=str(organisation["display_text"]),
+        )
+        for organisation in organisations
+    )
+
+
+class OrganisationRegistry:
+    """The GitHub organisations users can join.
+
+    Starts from the organisations in ``app_config``. When ``config_path`` is
+    set, the file is checked for changes at most every
+    ``reload_interval_seconds`` and a changed file replaces the snapshot
+    atomically, so an organisation can be enabled or disabled by updating a
+    mounted ConfigMap. A file that cannot be read keeps the last good
+    snapshot. The file overrides the ``MOJ_*_ORG_ENABLED`` flags, so setting
+    both logs a warning.
+    """
+
+    def __init__(
+        self,
+        organisations: list[Organisation] | tuple[Organisation, ...],
+        config_path: str | None = None,
+        reload_interval_seconds: int = 10,
+        clock=time.monotonic,
+        organisation_flags_set: bool = False,
+    ) -> None:
+        self.config_path = config_path
+        self.reload_interval_seconds = reload_interval_seconds
+        self.clock = clock
+        self.__snapshot = OrganisationSnapshot(tuple(organisations))
+        self.__file_stamp: tuple[int, int, int] | None = None
+        self.__next_check_at = 0.0
+        self.__reload_lock = threading.Lock()
+        if config_path:
+            if organisation_flags_set:
+                logger.warning(
+                    "Both GITHUB_ORGANISATIONS_FILE and MOJ_*_ORG_ENABLED are set; the flags are ignored"
+                )
+            self.reload_if_changed()
+
+    @property
+    def snapshot(self) -> OrganisationSnapshot:
+        if self.config_path and self.clock() >= self.__next_check_at:
+            self.reload_if_changed()
+        return self.__snapshot
+
+    @property
+    def version(self) -> str:
+        return self.snapshot.version
+
+    @property
+    def enabled_names(self) -> frozenset[str]:
+        return self.snapshot.enabled_names
+
+    def get(self, name: str) -> Organisation | None:
+        return self.snapshot.by_name.get(name)
+
+    def checkbox_items(self, is_digital_justice_user: bool) -> tuple[MappingProxyType, ...]:
+        return self.snapshot.checkbox_items[is_digital_justice_user]
+
+    def reload_if_changed(self) -> bool:
+        # Only one thread checks; the others carry on with the current snapshot
+        with acquired_without_waiting(self.__reload_lock) as acquired:
+            return acquired and self.__reload()
+
+    def __reload(self) -> bool:
+        self.__next_check_at = self.clock() + self.reload_interval_seconds
+        try:
+            stat = os.stat(self.config_path)
+        except OSError as e:
+            logger.warning("Cannot read organisations file [ %s ]: %s", self.config_path, str(e))
+            return False
+        file_stamp = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        if file_stamp == self.__file_stamp:
+            return False
+        self.__file_stamp = file_stamp
+        try:
+            organisations = load_organisations(self.config_path)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.error("Ignoring invalid organisations file [ %s ]: %s", self.config_path, str(e))
+            return False
+        self.__snapshot = OrganisationSnapshot(organisations)
+        logger.info(
+            "Loaded %d organisations, version [ %s ], from [ %s ]",
+            len(organisations), self.__snapshot.version, self.config_path,
+        )
+        return True
+
+
+organisation_registry = OrganisationRegistry(
+    [
+        Organisation(organisation.name, organisation.enabled, organisation.display_text)
+        for organisation in app_config.github.organisations
+    ],
+    app_config.github.organisations_file,
+    app_config.github.organisations_reload_seconds,
+    organisation_flags_set=app_config.github.organisation_flags_set,
+)
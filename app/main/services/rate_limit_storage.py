@@ -0,0 +1,360 @@
+import hashlib
+import logging
+import sqlite3
+import struct
+import threading
+import time
+import urllib.parse
+from array import array
+from math import floor
+
+from limits.errors import ConfigurationError
+from limits.storage.base import (
+    MovingWindowSupport,
+    SlidingWindowCounterSupport,
+    Storage,
+    TimestampedSlidingWindow,
+)
+
+from app.main.services.sqlite_connection import SQLiteConnections
+
+logger = logging.getLogger(__name__)
+
+PURGE_INTERVAL_SECONDS = 60
+DEFAULT_SKETCH_WIDTH = 65536
+DEFAULT_SKETCH_DEPTH = 4
+SKETCH_STRATEGY_ERROR = "sketch:// rate limit storage only supports the sliding-window-counter strategy"
+
+
+class SQLiteStorage(
+    Storage, MovingWindowSupport, SlidingWindowCounterSupport, TimestampedSlidingWindow
+):
+    """Rate limit storage shared by every process on a node through a SQLite file.
+
+    Registered with ``limits`` under the ``sqlite`` scheme, so it is selected
+    with a URI such as ``sqlite:////tmp/join-github-rate-limits.db``. Gunicorn
+    workers on the same pod see the same counters, and the counters survive a
+    worker being recycled. Use a ``redis://`` URI to share limits between pods.
+    """
+
+    STORAGE_SCHEME = ["sqlite"]
+
+    def __init__(self, uri: str, wrap_exceptions: bool = False, **options) -> None:
+        self.database_path = urllib.parse.urlparse(uri).path[1:]
+        if not self.database_path:
+            raise ConfigurationError(f"sqlite storage needs a database path: {uri}")
+        self.busy_timeout = float(options.get("busy_timeout", 5))
+        self.__connections = SQLiteConnections(self.database_path, self.busy_timeout)
+        self.__purged_at = 0.0
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self.__create_schema()
+
+    @property
+    def base_exceptions(self) -> type[Exception]:
+        return sqlite3.Error
+
+    def __create_schema(self) -> None:
+        self.__connections.get().executescript(
+            """
+            CREATE TABLE IF NOT EXISTS rate_limit_counters (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL,
+                expires_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS rate_limit_entries (
+                key TEXT NOT NULL,
+                acquired_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS rate_limit_entries_key
+                ON rate_limit_entries (key, acquired_at);
+            """
+        )
+
+    def __transaction(self, callback):
+        connection = self.__connections.get()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            result = callback(connection, time.time())
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        return result
+
+    def __purge_expired(self, connection: sqlite3.Connection, now: float) -> None:
+        if now - self.__purged_at < PURGE_INTERVAL_SECONDS:
+            return
+        self.__purged_at = now
+        connection.execute("DELETE FROM rate_limit_counters WHERE expires_at <= ?", (now,))
+        connection.execute("DELETE FROM rate_limit_entries WHERE expires_at <= ?", (now,))
+
+    @staticmethod
+    def __get_counter(connection: sqlite3.Connection, key: str, now: float) -> int:
+        row = connection.execute(
+            "SELECT value FROM rate_limit_counters WHERE key = ? AND expires_at > ?",
+            (key, now),
+        ).fetchone()
+        return row[0] if row else 0
+
+    @staticmethod
+    def __incr_counter(
+        connection: sqlite3.Connection, key: str, expiry: float, amount: int, now: float
+    ) -> int:
+        return connection.execute(
+            """
+            INSERT INTO rate_limit_counters (key, value, expires_at) VALUES (?, ?, ?)
+            ON CONFLICT (key) DO UPDATE SET
+                value = CASE WHEN expires_at > ? THEN value + excluded.value ELSE excluded.value END,
+                expires_at = CASE WHEN expires_at > ? THEN expires_at ELSE excluded.expires_at END
+            RETURNING value
+            """,
+            (key, amount, now + expiry, now, now),
+        ).fetchone()[0]
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        def incr(connection, now):
+            self.__purge_expired(connection, now)
+            return self.__incr_counter(connection, key, expiry, amount, now)
+
+        return self.__transaction(incr)
+
+    def get(self, key: str) -> int:
+        return self.__get_counter(self.__connections.get(), key, time.time())
+
+    def get_expiry(self, key: str) -> float:
+        now = time.time()
+        row = self.__connections.get().execute(
+            "SELECT expires_at FROM rate_limit_counters WHERE key = ? AND expires_at > ?",
+            (key, now),
+        ).fetchone()
+        return row[0] if row else now
+
+    def check(self) -> bool:
+        try:
+            self.__connections.get().execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self) -> int | None:
+        def reset(connection, _):
+            counters = connection.execute("DELETE FROM rate_limit_counters").rowcount
+            entries = connection.execute("DELETE FROM rate_limit_entries").rowcount
+            return counters + entries
+
+        return self.__transaction(reset)
+
+    def clear(self, key: str) -> None:
+        def clear(connection, _):
+            connection.execute("DELETE FROM rate_limit_counters WHERE key = ?", (key,))
+            connection.execute("DELETE FROM rate_limit_entries WHERE key = ?", (key,))
+
+        self.__transaction(clear)
+
+    def acquire_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        if amount > limit:
+            return False
+
+        def acquire(connection, now):
+            self.__purge_expired(connection, now)
+            acquired = connection.execute(
+                "SELECT COUNT(*) FROM rate_limit_entries WHERE key = ? AND acquired_at > ?",
+                (key, now - expiry),
+            ).fetchone()[0]
+            if acquired + amount > limit:
+                return False
+            connection.executemany(
+                "INSERT INTO rate_limit_entries (key, acquired_at, expires_at) VALUES (?, ?, ?)",
+                [(key, now, now + expiry)] * amount,
+            )
+            return True
+
+        return self.__transaction(acquire)
+
+    def get_moving_window(self, key: str, limit: int, expiry: int) -> tuple[float, int]:
+        now = time.time()
+        oldest, acquired = self.__connections.get().execute(
+            "SELECT MIN(acquired_at), COUNT(*) FROM rate_limit_entries WHERE key = ? AND acquired_at > ?",
+            (key, now - expiry),
+        ).fetchone()
+        return (oldest if oldest is not None else now), acquired
+
+    def acquire_sliding_window_entry(
+        self, key: str, limit: int, expiry: int, amount: int = 1
+    ) -> bool:
+        if amount > limit:
+            return False
+
+        def acquire(connection, now):
+            self.__purge_expired(connection, now)
+            previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+            previous_count, previous_ttl, current_count, _ = self.__get_sliding_window(
+                connection, previous_key, current_key, expiry, now
+            )
+            if floor(previous_count * previous_ttl / expiry + current_count) + amount > limit:
+                return False
+            # The current window's counter is read as the previous window for one more period
+            self.__incr_counter(connection, current_key, 2 * expiry, amount, now)
+            return True
+
+        return self.__transaction(acquire)
+
+    def __get_sliding_window(
+        self,
+        connection: sqlite3.Connection,
+        previous_key: str,
+        current_key: str,
+        expiry: int,
+        now: float,
+    ) -> tuple[int, float, int, float]:
+        previous_count = self.__get_counter(connection, previous_key, now)
+        current_count = self.__get_counter(connection, current_key, now)
+        previous_ttl = 0.0 if previous_count == 0 else (1 - (((now - expiry) / expiry) % 1)) * expiry
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return previous_count, previous_ttl, current_count, current_ttl
+
+    def get_sliding_window(self, key: str, expiry: int) -> tuple[int, float, int, float]:
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        return self.__get_sliding_window(
+            self.__connections.get(), previous_key, current_key, expiry, now
+        )
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, time.time())
+        self.clear(previous_key)
+        self.clear(current_key)
+
+
+class _SketchWindows:  # pylint: disable=too-few-public-methods
+    def __init__(self, size: int) -> None:
+        self.index = 0
+        self.current = array("I", bytes(4 * size))
+        self.previous = array("I", bytes(4 * size))
+
+    def rotate(self, index: int) -> None:
+        if index == self.index:
+            return
+        size = len(self.current)
+        if index == self.index + 1:
+            self.previous, self.current = self.current, self.previous
+            self.current[:] = array("I", bytes(4 * size))
+        else:
+            self.previous[:] = array("I", bytes(4 * size))
+            self.current[:] = array("I", bytes(4 * size))
+        self.index = index
+
+
+class CountMinSketchStorage(Storage, SlidingWindowCounterSupport):
+    """Constant-memory rate limit storage for the sliding window counter strategy.
+
+    Selected with ``sketch://`` and sized with ``?width=65536&depth=4``. Each
+    window length used by a configured limit gets a current and a previous
+    count-min sketch of ``depth`` rows of ``width`` 32-bit counters, so memory
+    is ``2 * width * depth * 4`` bytes per distinct window length however many
+    clients are seen.
+
+    Counts are never underestimated, so a client is never let over its limit.
+    With ``N`` hits in a window a client's count is overestimated by at most
+    ``e / width * N`` with probability ``1 - e ** -depth``; with the defaults
+    that is 42 extra hits per million with 98% confidence. Conservative
+    updates make the error much smaller than this in practice. Like
+    ``memory://`` the counters are per process, and individual keys cannot be
+    cleared.
+    """
+
+    STORAGE_SCHEME = ["sketch"]
+
+    def __init__(self, uri: str, wrap_exceptions: bool = False, **options) -> None:
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(uri).query)
+        self.width = int(options.get("width", query.get("width", [DEFAULT_SKETCH_WIDTH])[0]))
+        self.depth = int(options.get("depth", query.get("depth", [DEFAULT_SKETCH_DEPTH])[0]))
+        if self.width < 1 or not 1 <= self.depth <= 16:
+            raise ConfigurationError(f"sketch storage needs a width of at least 1 and a depth of 1 to 16: {uri}")
+        self.windows: dict[int, _SketchWindows] = {}
+        self.__lock = threading.Lock()
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+    @property
+    def base_exceptions(self) -> type[Exception]:
+        return ValueError
+
+    def __cells(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=4 * self.depth).digest()
+        return [
+            row * self.width + hashed % self.width
+            for row, hashed in enumerate(struct.unpack(f"<{self.depth}I", digest))
+        ]
+
+    def __windows(self, expiry: int, now: float) -> _SketchWindows:
+        windows = self.windows.get(expiry)
+        if windows is None:
+            windows = self.windows[expiry] = _SketchWindows(self.width * self.depth)
+            windows.index = int(now / expiry)
+        windows.rotate(int(now / expiry))
+        return windows
+
+    def __get_sliding_window(
+        self, cells: list[int], expiry: int, now: float
+    ) -> tuple[int, float, int, float]:
+        windows = self.__windows(expiry, now)
+        previous_count = min(windows.previous[cell] for cell in cells)
+        current_count = min(windows.current[cell] for cell in cells)
+        elapsed = (now / expiry) % 1
+        previous_ttl = 0.0 if previous_count == 0 else (1 - elapsed) * expiry
+        current_ttl = (1 - elapsed) * expiry + expiry
+        return previous_count, previous_ttl, current_count, current_ttl
+
+    def acquire_sliding_window_entry(
+        self, key: str, limit: int, expiry: int, amount: int = 1
+    ) -> bool:
+        if amount > limit:
+            return False
+        cells = self.__cells(key)
+        with self.__lock:
+            now = time.time()
+            previous_count, previous_ttl, current_count, _ = self.__get_sliding_window(
+                cells, expiry, now
+            )
+            if floor(previous_count * previous_ttl / expiry + current_count) + amount > limit:
+                return False
+            # Conservative update: only raise the counters that are below the new estimate
+            count = current_count + amount
+            current = self.windows[expiry].current
+            for cell in cells:
+                if current[cell] < count:
+                    current[cell] = count
+            return True
+
+    def get_sliding_window(self, key: str, expiry: int) -> tuple[int, float, int, float]:
+        cells = self.__cells(key)
+        with self.__lock:
+            return self.__get_sliding_window(cells, expiry, time.time())
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        # Lowering a key's counters would also lower other keys sharing them
+        logger.warning("sketch rate limit storage cannot clear a single key, so %s is still limited", key)
+
+    # Needed by the fixed and moving window strategies, which configure_limiter
+    # refuses to pair with this storage
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        raise ConfigurationError(SKETCH_STRATEGY_ERROR)
+
+    def get(self, key: str) -> int:
+        raise ConfigurationError(SKETCH_STRATEGY_ERROR)
+
+    def get_expiry(self, key: str) -> float:
+        raise ConfigurationError(SKETCH_STRATEGY_ERROR)
+
+    def check(self) -> bool:
+        return True
+
+    def reset(self) -> int | None:
+        with self.__lock:
+            count = len(self.windows)
+            self.windows.clear()
+        return count
+
+    def clear(self, key: str) -> None:
+        logger.warning("sketch rate limit storage cannot clear a single key, so %s is still limited", key)
@@ -0,0 +1,83 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class DependencyNotReady(Exception):
+    pass
+
+
+class DependencyDegraded(Exception):
+    """The dependency works but is running short, so the app stays ready."""
+
+
+@dataclass(frozen=True)
+class CheckResult:
+    is_ready: bool
+    detail: str
+    checked_at: float
+    is_degraded: bool = False
+
+
+class ReadinessService:
+    """Readiness of the app's dependencies, refreshed by a background thread.
+
+    Each check returns a short detail string, or raises when its dependency is
+    not usable. A check raising ``DependencyDegraded`` is reported but keeps
+    the app ready, since a shared limit such as the GitHub token's budget would
+    otherwise take every replica out of service at once. Probes read the last
+    results and never call a dependency, so a slow GitHub or Auth0 cannot make
+    a probe time out.
+    """
+
+    def __init__(self, checks: dict[str, Callable[[], str]], refresh_interval_seconds: int = 30) -> None:
+        self.checks = checks
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.results: dict[str, CheckResult] = {}
+        self.__stop_event = threading.Event()
+        self.__thread: threading.Thread | None = None
+
+    def refresh(self) -> dict[str, CheckResult]:
+        results = {}
+        for name, check in self.checks.items():
+            try:
+                results[name] = CheckResult(True, check(), time.time())
+            except DependencyDegraded as e:
+                logger.warning("Readiness check [ %s ] is degraded: %s", name, str(e))
+                results[name] = CheckResult(True, str(e), time.time(), is_degraded=True)
+            except Exception as e:
+                logger.warning("Readiness check [ %s ] failed: %s", name, str(e))
+                results[name] = CheckResult(False, str(e), time.time())
+        self.results = results
+        return results
+
+    def is_ready(self) -> bool:
+        results = self.results
+        return bool(results) and all(result.is_ready for result in results.values())
+
+    def is_degraded(self) -> bool:
+        return any(result.is_degraded for result in self.results.values())
+
+    def start(self) -> None:
+        if self.__thread is not None and self.__thread.is_alive():
+            return
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(
+            target=self.run_forever, name="readiness-checks", daemon=True
+        )
+        self.__thread.start()
+        logger.info("Readiness checks started")
+
+    def stop(self) -> None:
+        self.__stop_event.set()
+        if self.__thread is not None:
+            self.__thread.join()
+
+    def run_forever(self) -> None:
+        while not self.__stop_event.is_set():
+            self.refresh()
+            self.__stop_event.wait(self.refresh_interval_seconds)
@@ -0,0 +1,122 @@
+import time
+import urllib.parse
+from abc import ABC, abstractmethod
+
+from app.main.services.sqlite_connection import SQLiteConnections
+
+PURGE_INTERVAL_SECONDS = 60
+
+
+class SessionStore(ABC):
+    """Serialised session data keyed by session id, each entry with a time to live."""
+
+    @abstractmethod
+    def load(self, sid: str) -> str | None:
+        """The session's data, or ``None`` if it is missing or has expired."""
+
+    @abstractmethod
+    def save(self, sid: str, data: str, ttl_seconds: int) -> None:
+        """Store the session's data for ``ttl_seconds``."""
+
+    @abstractmethod
+    def delete(self, sid: str) -> None:
+        """Forget the session, if it exists."""
+
+
+class MemorySessionStore(SessionStore):
+    """Sessions held in this process only; for local development and tests."""
+
+    def __init__(self, clock=time.time) -> None:
+        self.clock = clock
+        self.sessions: dict[str, tuple[str, float]] = {}
+
+    def load(self, sid: str) -> str | None:
+        data, expires_at = self.sessions.get(sid, (None, 0.0))
+        if expires_at <= self.clock():
+            self.sessions.pop(sid, None)
+            return None
+        return data
+
+    def save(self, sid: str, data: str, ttl_seconds: int) -> None:
+        self.sessions[sid] = (data, self.clock() + ttl_seconds)
+
+    def delete(self, sid: str) -> None:
+        self.sessions.pop(sid, None)
+
+
+class SQLiteSessionStore(SessionStore):
+    """Sessions shared by every worker on a pod through a SQLite file."""
+
+    def __init__(self, database_path: str, busy_timeout: float = 5) -> None:
+        self.database_path = database_path
+        self.busy_timeout = busy_timeout
+        self.__connections = SQLiteConnections(database_path, busy_timeout)
+        self.__purged_at = 0.0
+        self.__connections.get().execute(
+            """
+            CREATE TABLE IF NOT EXISTS sessions (
+                sid TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+
+    def load(self, sid: str) -> str | None:
+        row = self.__connections.get().execute(
+            "SELECT data FROM sessions WHERE sid = ? AND expires_at > ?", (sid, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def save(self, sid: str, data: str, ttl_seconds: int) -> None:
+        now = time.time()
+        connection = self.__connections.get()
+        connection.execute(
+            """
+            INSERT INTO sessions (sid, data, expires_at) VALUES (?, ?, ?)
+            ON CONFLICT (sid) DO UPDATE SET data = excluded.data, expires_at = excluded.expires_at
+            """,
+            (sid, data, now + ttl_seconds),
+        )
+        if now - self.__purged_at >= PURGE_INTERVAL_SECONDS:
+            self.__purged_at = now
+            connection.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+
+    def delete(self, sid: str) -> None:
+        self.__connections.get().execute("DELETE FROM sessions WHERE sid = ?", (sid,))
+
+
+class RedisSessionStore(SessionStore):
+    """Sessions shared by every pod through Redis, or anything speaking its protocol."""
+
+    KEY_PREFIX = "join-github:session:"
+
+    def __init__(self, client) -> None:
+        self.client = client
+
+    def load(self, sid: str) -> str | None:
+        data = self.client.get(self.KEY_PREFIX + sid)
+        return data.decode("utf-8") if data is not None else None
+
+    def save(self, sid: str, data: str, ttl_seconds: int) -> None:
+        self.client.set(self.KEY_PREFIX + sid, data, ex=ttl_seconds)
+
+    def delete(self, sid: str) -> None:
+        self.client.delete(self.KEY_PREFIX + sid)
+
+
+def session_store_from_uri(uri: str) -> SessionStore:
+    """Build a store from ``memory://``, ``sqlite:////path/to.db`` or ``redis://host:port/db``."""
+    parsed = urllib.parse.urlparse(uri)
+    if parsed.scheme == "memory":
+        return MemorySessionStore()
+    if parsed.scheme == "sqlite":
+        if not parsed.path[1:]:
+            raise ValueError(f"sqlite session store needs a database path: {uri}")
+        return SQLiteSessionStore(parsed.path[1:])
+    if parsed.scheme in ("redis", "rediss"):
+        # Imported here as it is slow to import and most deployments do not use it
+        import redis  # pylint: disable=import-outside-toplevel
+
+        return RedisSessionStore(redis.Redis.from_url(uri))
+    raise ValueError(f"Unsupported session store: {uri}")
@@ -0,0 +1,29 @@
+import os
+import sqlite3
+import threading
+
+
+class SQLiteConnections:  # pylint: disable=too-few-public-methods
+    """A WAL-mode connection to a SQLite file for each thread that asks for one.
+
+    Connections must not cross a fork, so a preloaded app reconnects in each
+    worker.
+    """
+
+    def __init__(self, database_path: str, timeout: float = 5, row_factory=None) -> None:
+        self.database_path = database_path
+        self.timeout = timeout
+        self.row_factory = row_factory
+        self.__local = threading.local()
+
+    def get(self) -> sqlite3.Connection:
+        connection = getattr(self.__local, "connection", None)
+        if connection is None or self.__local.pid != os.getpid():
+            connection = sqlite3.connect(self.database_path, timeout=self.timeout, isolation_level=None)
+            if self.row_factory is not None:
+                connection.row_factory = self.row_factory
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self.__local.connection = connection
+            self.__local.pid = os.getpid()
+        return connection
@@ -0,0 +1,27 @@
+import contextlib
+
+import sentry_sdk
+from sentry_sdk.tracing import Span
+
+
+@contextlib.contextmanager
+def child_span(op: str, description: str, parent: Span | None = None):
+    """A Sentry span under ``parent``, or the current span, finished on exit.
+
+    Yields ``None`` when there is no transaction to add it to. Unlike
+    ``sentry_sdk.start_span`` it does not become the scope's current span, so
+    threads working on behalf of a request can record spans under it without
+    changing the request's scope.
+    """
+    parent = parent or sentry_sdk.get_current_span()
+    if parent is None:
+        yield None
+        return
+    span = parent.start_child(op=op, description=description)
+    try:
+        yield span
+    except BaseException:
+        span.set_status("internal_error")
+        raise
+    finally:
+        span.finish()
@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+
+from app.main.config.app_config import app_config
+from app.main.validators.index import EMAIL_PATTERN
+
+DIGITAL_JUSTICE_COHORT = "digital_justice"
+
+_MATCH = object()
+
+
+class DomainIndex:
+    """Domains, and ``*.domain`` wildcards for their subdomains, each mapped to a value.
+
+    Exact domains are one hash lookup. Wildcards are held in a trie keyed on
+    reversed labels, so a lookup costs one step per label of the domain being
+    checked however many entries there are.
+    """
+
+    def __init__(self) -> None:
+        self.exact: dict[str, object] = {}
+        self.wildcards: dict = {}
+
+    def add(self, pattern: str, value: object) -> None:
+        pattern = pattern.strip().lower().rstrip(".")
+        if not pattern.startswith("*."):
+            self.exact[pattern] = value
+            return
+        node = self.wildcards
+        for label in reversed(pattern[2:].split(".")):
+            node = node.setdefault(label, {})
+        node[_MATCH] = value
+
+    def lookup(self, domain: str) -> object | None:
+        value = self.exact.get(domain)
+        if value is not None or not self.wildcards:
+            return value
+        node = self.wildcards
+        # The first label is never walked: a wildcard only matches subdomains
+        for label in reversed(domain.split(".")[1:]):
+            node = node.get(label)
+            if node is None:
+                break
+            value = node.get(_MATCH, value)
+        return value
+
+
+@dataclass(frozen=True)
+class EmailClassification:
+    is_valid: bool
+    domain: str | None
+    is_pre_approved: bool
+    cohort: str | None
+
+    @property
+    def is_digital_justice(self) -> bool:
+        return self.cohort == DIGITAL_JUSTICE_COHORT
+
+
+class EmailPolicy:  # pylint: disable=too-few-public-methods
+    """Classifies an email address in one pass: whether it is well formed,
+    whether its domain may join without approval and which cohort, such as
+    Digital Justice, it belongs to.
+
+    Domains are matched case-insensitively and exactly; an entry of the form
+    ``*.example.gov.uk`` also admits every subdomain of ``example.gov.uk``.
+    """
+
+    def __init__(self, allowed_domains: list[str], cohorts: dict[str, list[str]]) -> None:
+        self.allowed_domains = DomainIndex()
+        for domain in allowed_domains:
+            self.allowed_domains.add(domain, True)
+        self.cohorts = DomainIndex()
+        for cohort, domains in cohorts.items():
+            for domain in domains:
+                self.cohorts.add(domain, cohort)
+
+    def classify(self, email: str) -> EmailClassification:
+        is_valid = EMAIL_PATTERN.match(email) is not None
+        _, at, domain = email.partition("@")
+        if not at:
+            return EmailClassification(is_valid, None, False, None)
+        domain = domain.lower()
+        return EmailClassification(
+            is_valid=is_valid,
+            domain=domain,
+            is_pre_approved=self.allowed_domains.lookup(domain) is True,
+            cohort=self.cohorts.lookup(domain),
+        )
+
+
+email_policy = EmailPolicy(
+    app_config.github.allowed_email_domains,
+    {DIGITAL_JUSTICE_COHORT: app_config.github.digital_justice_email_domains},
+)
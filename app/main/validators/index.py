@@ -1,10 +1,10 @@
 import re
 
+EMAIL_PATTERN = re.compile("^[a-zA-Z0-9._-]+@{1}[a-zA-Z0-9.-]+$")
+
 
 def is_valid_email_pattern(email):
-    pattern = "^[a-zA-Z0-9._-]+@{1}[a-zA-Z0-9.-]+$"
-    regex = re.compile(pattern)
-    result = regex.match(email)
+    result = EMAIL_PATTERN.match(email)
     if result:
         return True
     return False
@@ -1,9 +1,10 @@
 from app.app import create_app
 
 
-# Gunicorn entry point - used in production and referenced in the`Dockerfile`
+# Gunicorn entry point - used in production and referenced in the`Dockerfile`. Background
+# tasks are started in each worker by `post_worker_init` in `app/main/config/gunicorn_config.py`
 def app():
-    return create_app()
+    return create_app(is_background_tasks_enabled=False)
 
 
 # Flask entry point - used for local development and referenced in the `makefile`
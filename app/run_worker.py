@@ -0,0 +1,21 @@
+from app.main.config.app_config import app_config
+from app.main.config.invitation_outbox_config import build_invitation_outbox
+from app.main.config.logging_config import configure_logging_from_app_config
+from app.main.services.github_service import GithubService
+from app.main.services.invitation_outbox_service import InvitationOutboxWorker
+
+
+# Invitation outbox worker entry point - drains the queue written by `/join/send-invitation`
+# when `INVITATION_OUTBOX_ENABLED` is set and the worker is not run in-process
+def run_worker():
+    configure_logging_from_app_config()
+    worker = InvitationOutboxWorker(
+        build_invitation_outbox(),
+        GithubService(app_config.github.token),
+        app_config.invitation_outbox.poll_interval_seconds,
+    )
+    worker.run_forever()
+
+
+if __name__ == "__main__":
+    run_worker()
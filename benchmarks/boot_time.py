@@ -0,0 +1,146 @@
+"""Check how long a gunicorn worker takes to import and create the app.
+
+Each run starts a fresh interpreter, as a new pod does, with ``-X importtime``.
+It loads the gunicorn config, then times importing ``app.run`` and calling
+its ``app()`` factory, with ``PROMETHEUS_MULTIPROC_DIR`` set as in the image.
+Gunicorn itself is then started with the same settings and must answer
+``/healthz``. The check fails if gunicorn exits during boot, if the median
+boot time exceeds ``--budget-ms``, or if a module kept off the boot path,
+such as PyGithub or redis, is imported:
+
+    python -m benchmarks.boot_time --runs 5 --budget-ms 1500
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from collections import Counter
+
+# Imported only by the code paths that need them, none of which run at boot
+# with the default settings
+DEFERRED_MODULES = ("github", "redis")
+RESULT_PREFIX = "boot-time-result "
+GUNICORN_CONFIG = "app.main.config.gunicorn_config"
+BOOT_SCRIPT = f"""
+import json, sys, time
+# Gunicorn loads its config, which prepares the metrics directory, before the app
+import {GUNICORN_CONFIG}
+started = time.perf_counter()
+import app.run
+imported = time.perf_counter()
+app.run.app()
+created = time.perf_counter()
+print({RESULT_PREFIX!r} + json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "create_app_ms": (created - imported) * 1000,
+    "modules": sorted(sys.modules),
+}}), flush=True)
+"""
+
+
+def image_environ(directory: str) -> dict[str, str]:
+    """This environment with the image's settings, and a metrics directory
+    under ``directory`` that does not exist yet, as in a new container."""
+    return os.environ | {"PROMETHEUS_MULTIPROC_DIR": os.path.join(directory, "metrics")}
+
+
+def boot_once() -> tuple[dict, Counter]:
+    """Timings and module list from one fresh interpreter, and the import
+    time in microseconds of each top-level package it loaded."""
+    with tempfile.TemporaryDirectory() as directory:
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", BOOT_SCRIPT],
+            capture_output=True,
+            text=True,
+            env=image_environ(directory),
+            check=True,
+        )
+    result = next(
+        json.loads(line[len(RESULT_PREFIX):])
+        for line in completed.stdout.splitlines()
+        if line.startswith(RESULT_PREFIX)
+    )
+    packages = Counter()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, module = line[len("import time:"):].split("|")
+        packages[module.strip().split(".")[0]] += int(self_us)
+    return result, packages
+
+
+def boot_gunicorn(timeout_seconds: float = 30) -> str | None:
+    """Start gunicorn as the image does, and return why it did not answer
+    ``/healthz``, or None once it has."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    with tempfile.TemporaryDirectory() as directory, tempfile.TemporaryFile("w+", encoding="utf-8") as log:
+        environ = image_environ(directory) | {"GUNICORN_BIND": f"127.0.0.1:{port}", "GUNICORN_WORKERS": "1"}
+        server = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", f"--config=python:{GUNICORN_CONFIG}", "app.run:app()"],
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            env=environ,
+        )
+        try:
+            deadline = time.monotonic() + timeout_seconds
+            while time.monotonic() < deadline:
+                if server.poll() is not None:
+                    log.seek(0)
+                    return f"gunicorn exited with {server.returncode} during boot:\n{log.read()[-2000:]}"
+                try:
+                    with urllib.request.urlopen(f"http://127.0.0.1:{port}/healthz", timeout=1):
+                        return None
+                except OSError:
+                    time.sleep(0.1)
+            return f"gunicorn did not answer /healthz within {timeout_seconds:g} s"
+        finally:
+            server.terminate()
+            server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to boot")
+    parser.add_argument("--budget-ms", type=float, default=1500, help="fail if the median boot takes longer")
+    parser.add_argument("--top", type=int, default=10, help="slowest packages to list")
+    arguments = parser.parse_args()
+
+    gunicorn_failure = boot_gunicorn()
+    runs = [boot_once() for _ in range(arguments.runs)]
+    import_ms = statistics.median(result["import_ms"] for result, _ in runs)
+    create_app_ms = statistics.median(result["create_app_ms"] for result, _ in runs)
+    total_ms = statistics.median(result["import_ms"] + result["create_app_ms"] for result, _ in runs)
+    packages = sum((package_times for _, package_times in runs), Counter())
+
+    print(f"median of {arguments.runs} boots")
+    print(f"import app.run   {import_ms:8.1f} ms")
+    print(f"create app       {create_app_ms:8.1f} ms")
+    print(f"total            {total_ms:8.1f} ms (budget {arguments.budget_ms:g} ms)")
+    print("slowest packages to import")
+    for package, microseconds in packages.most_common(arguments.top):
+        print(f"  {package:<28} {microseconds / arguments.runs / 1000:8.1f} ms")
+
+    failures = [
+        f"{module} is imported while booting"
+        for module in DEFERRED_MODULES
+        if module in runs[0][0]["modules"]
+    ]
+    if gunicorn_failure:
+        failures.append(gunicorn_failure)
+    if total_ms > arguments.budget_ms:
+        failures.append(f"boot took {total_ms:.1f} ms, over the {arguments.budget_ms:g} ms budget")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Cost of classifying an email address against a large synthetic domain allowlist.
+
+Compares the list scan the join routes used to do, with the domain parsed
+once per check, against one ``EmailPolicy.classify`` call over exact domains
+and ``*.domain`` wildcards:
+
+    python -m benchmarks.email_policy --domains 1000 --emails 20000
+"""
+import argparse
+import random
+import time
+
+from app.main.validators.email_policy import DIGITAL_JUSTICE_COHORT, EmailPolicy
+from app.main.validators.index import is_valid_email_pattern
+
+
+def synthetic_domains(count: int) -> list[str]:
+    return [f"agency{index}.justice.gov.uk" for index in range(count)]
+
+
+def synthetic_emails(domains: list[str], count: int) -> list[str]:
+    randomiser = random.Random(0)
+    # Half the addresses miss the allowlist, the worst case for a list scan
+    return [
+        f"user{index}@{randomiser.choice(domains)}" if index % 2 else f"user{index}@example{index}.com"
+        for index in range(count)
+    ]
+
+
+def list_scan(emails: list[str], allowed_domains: list[str]) -> float:
+    started = time.perf_counter()
+    for email in emails:
+        is_valid_email_pattern(email)
+        domain = email[email.index("@") + 1:]
+        domain in allowed_domains
+        "digital.justice.gov.uk" == email[email.index("@") + 1:].lower()
+    return (time.perf_counter() - started) / len(emails) * 1_000_000
+
+
+def email_policy(emails: list[str], policy: EmailPolicy) -> float:
+    started = time.perf_counter()
+    for email in emails:
+        policy.classify(email)
+    return (time.perf_counter() - started) / len(emails) * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--domains", type=int, default=1000, help="domains in the allowlist")
+    parser.add_argument("--emails", type=int, default=20000, help="emails to classify per scenario")
+    arguments = parser.parse_args()
+
+    domains = synthetic_domains(arguments.domains)
+    emails = synthetic_emails(domains, arguments.emails)
+    cohorts = {DIGITAL_JUSTICE_COHORT: ["digital.justice.gov.uk"]}
+    wildcards = [f"*.{domain}" for domain in domains]
+
+    print(f"{'classifier':<28} {'us/email':>9}")
+    print(f"{'list scan':<28} {list_scan(emails, domains):>9.2f}")
+    print(f"{'EmailPolicy, exact':<28} {email_policy(emails, EmailPolicy(domains, cohorts)):>9.2f}")
+    print(f"{'EmailPolicy, wildcards':<28} {email_policy(emails, EmailPolicy(wildcards, cohorts)):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""A local stand-in for the GitHub REST API, with injected latency and faults.
+
+Serves ``GET /orgs/{org}``, ``POST /orgs/{org}/invitations`` and
+``GET /rate_limit`` with GitHub's rate-limit headers and a primary budget
+that resets every hour. A share of invitations can be answered with a 422
+"already a part of this organization", a 403 secondary rate limit with
+Retry-After, or a 502, and every response waits for a delay drawn from a
+latency distribution: ``fixed:MS``, ``uniform:LOW_MS:HIGH_MS`` or
+``lognormal:MEDIAN_MS:SIGMA``.
+
+Point the app at it with GITHUB_API_BASE_URL:
+
+    python -m benchmarks.fake_github --port 8081 --latency lognormal:150:0.5 --already-member-rate 0.2
+    GITHUB_API_BASE_URL=http://127.0.0.1:8081 make local
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ORGANISATION_PATH = re.compile(r"^/orgs/(?P<org>[^/]+)$")
+INVITATIONS_PATH = re.compile(r"^/orgs/(?P<org>[^/]+)/invitations$")
+
+ALREADY_MEMBER_BODY = {
+    "message": "Validation Failed",
+    "errors": [
+        {
+            "resource": "OrganizationInvitation",
+            "code": "unprocessable",
+            "field": "data",
+            "message": "A user with this email address is already a part of this organization",
+        }
+    ],
+}
+SECONDARY_RATE_LIMIT_BODY = {
+    "message": "You have exceeded a secondary rate limit. Please wait a few minutes before you try again.",
+}
+PRIMARY_RATE_LIMIT_BODY = {"message": "API rate limit exceeded for user."}
+SERVER_ERROR_BODY = {"message": "Server Error"}
+
+
+def parse_latency(spec: str):
+    """Turn ``fixed:MS``, ``uniform:LOW_MS:HIGH_MS`` or ``lognormal:MEDIAN_MS:SIGMA``
+    into a function of a ``random.Random`` returning a delay in seconds."""
+    kind, *values = spec.split(":")
+    try:
+        values = [float(value) for value in values]
+    except ValueError:
+        raise ValueError(f"Invalid latency: {spec}") from None
+    if kind == "fixed" and len(values) == 1:
+        return lambda randomiser: values[0] / 1000
+    if kind == "uniform" and len(values) == 2:
+        return lambda randomiser: randomiser.uniform(values[0], values[1]) / 1000
+    if kind == "lognormal" and len(values) == 2:
+        median_seconds = values[0] / 1000
+        return lambda randomiser: median_seconds * randomiser.lognormvariate(0, values[1])
+    raise ValueError(f"Invalid latency: {spec}")
+
+
+class QuietThreadingHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def handle_error(self, request, client_address) -> None:
+        # Clients that time out close the connection mid-response
+        pass
+
+
+class FakeGithubServer:
+    """Answers like GitHub, one thread per connection, and counts every response by status."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: str = "fixed:0",
+        already_member_rate: float = 0,
+        secondary_rate_limit_rate: float = 0,
+        server_error_rate: float = 0,
+        retry_after_seconds: int = 60,
+        rate_limit: int = 5000,
+        seed: int | None = None,
+        clock=time.time,
+    ) -> None:
+        self.latency = parse_latency(latency)
+        self.already_member_rate = already_member_rate
+        self.secondary_rate_limit_rate = secondary_rate_limit_rate
+        self.server_error_rate = server_error_rate
+        self.retry_after_seconds = retry_after_seconds
+        self.rate_limit = rate_limit
+        self.clock = clock
+        self.randomiser = random.Random(seed)
+        self.responses = Counter()
+        self.__lock = threading.Lock()
+        self.__used = 0
+        self.__reset_at = int(clock()) + 3600
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def handle_request(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                status, body, headers = fake.respond(self.command, self.path, self.headers.get("Authorization"))
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = handle_request
+
+        self.server = QuietThreadingHTTPServer((host, port), Handler)
+        self.url = f"http://{self.server.server_address[0]}:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, name="fake-github", daemon=True)
+
+    def __draw(self) -> tuple[float, float]:
+        with self.__lock:
+            return self.latency(self.randomiser), self.randomiser.random()
+
+    def __spend_request(self) -> tuple[bool, dict[str, str]]:
+        with self.__lock:
+            now = self.clock()
+            if now >= self.__reset_at:
+                self.__used = 0
+                self.__reset_at = int(now) + 3600
+            is_allowed = self.__used < self.rate_limit
+            if is_allowed:
+                self.__used += 1
+            return is_allowed, {
+                "X-RateLimit-Limit": str(self.rate_limit),
+                "X-RateLimit-Remaining": str(self.rate_limit - self.__used),
+                "X-RateLimit-Reset": str(self.__reset_at),
+                "X-RateLimit-Used": str(self.__used),
+                "X-RateLimit-Resource": "core",
+            }
+
+    def respond(self, method: str, path: str, authorization: str | None) -> tuple[int, dict, dict]:
+        delay, outcome = self.__draw()
+        time.sleep(delay)
+        status, body, headers = self.__route(method, path.split("?", 1)[0], authorization, outcome)
+        with self.__lock:
+            self.responses[status] += 1
+        return status, body, headers
+
+    def __route(self, method: str, path: str, authorization: str | None, outcome: float) -> tuple[int, dict, dict]:
+        if not authorization:
+            return 401, {"message": "Requires authentication"}, {}
+
+        if method == "GET" and path == "/rate_limit":
+            with self.__lock:
+                core = {
+                    "limit": self.rate_limit,
+                    "remaining": self.rate_limit - self.__used,
+                    "reset": self.__reset_at,
+                    "used": self.__used,
+                }
+            return 200, {"resources": {"core": core}, "rate": core}, {}
+
+        organisation = ORGANISATION_PATH.match(path)
+        invitations = INVITATIONS_PATH.match(path)
+        if not (method == "GET" and organisation) and not (method == "POST" and invitations):
+            return 404, {"message": "Not Found"}, {}
+
+        is_allowed, headers = self.__spend_request()
+        if not is_allowed:
+            return 403, PRIMARY_RATE_LIMIT_BODY, headers
+        if organisation:
+            login = organisation["org"]
+            return 200, {"login": login, "id": abs(hash(login)) % 10_000_000, "type": "Organization"}, headers
+
+        if outcome < self.server_error_rate:
+            return 502, SERVER_ERROR_BODY, headers
+        outcome -= self.server_error_rate
+        if outcome < self.secondary_rate_limit_rate:
+            return 403, SECONDARY_RATE_LIMIT_BODY, headers | {"Retry-After": str(self.retry_after_seconds)}
+        outcome -= self.secondary_rate_limit_rate
+        if outcome < self.already_member_rate:
+            return 422, ALREADY_MEMBER_BODY, headers
+        return 201, {"role": "direct_member", "login": None, "inviter": {"login": "join-github"}}, headers
+
+    def __enter__(self) -> "FakeGithubServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency", default="lognormal:150:0.5", help="fixed:MS, uniform:LOW:HIGH or lognormal:MEDIAN:SIGMA")
+    parser.add_argument("--already-member-rate", type=float, default=0, help="share of invitations answered 422")
+    parser.add_argument("--secondary-rate-limit-rate", type=float, default=0, help="share answered 403 with Retry-After")
+    parser.add_argument("--server-error-rate", type=float, default=0, help="share answered 502")
+    parser.add_argument("--retry-after", type=int, default=60, help="Retry-After seconds on secondary rate limits")
+    parser.add_argument("--rate-limit", type=int, default=5000, help="primary requests per hour")
+    parser.add_argument("--seed", type=int, help="seed the latency and fault draws")
+    arguments = parser.parse_args()
+
+    fake = FakeGithubServer(
+        arguments.host,
+        arguments.port,
+        latency=arguments.latency,
+        already_member_rate=arguments.already_member_rate,
+        secondary_rate_limit_rate=arguments.secondary_rate_limit_rate,
+        server_error_rate=arguments.server_error_rate,
+        retry_after_seconds=arguments.retry_after,
+        rate_limit=arguments.rate_limit,
+        seed=arguments.seed,
+    )
+    print(f"Fake GitHub API listening on {fake.url}")
+    try:
+        fake.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        fake.server.server_close()
+        print(f"Responses by status: {dict(sorted(fake.responses.items()))}")
+
+
+if __name__ == "__main__":
+    main()
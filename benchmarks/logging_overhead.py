@@ -0,0 +1,78 @@
+"""Time a request thread spends logging, with stdout slow to drain.
+
+Compares the synchronous text handler ``configure_logging`` used to install
+with the queued pipeline, in text and JSON, for ordinary records and for a
+flood of sampled 404 records. The stream sleeps for ``--write-delay-us`` per
+write, standing in for a container log pipe that is backing up:
+
+    python -m benchmarks.logging_overhead --records 20000 --write-delay-us 50
+"""
+import argparse
+import logging
+import time
+
+from app.main.config.logging_config import TEXT_FORMATTER
+from app.main.middleware.structured_logging import JsonFormatter, LogPipeline
+
+
+class SlowStream:
+    def __init__(self, delay_seconds: float) -> None:
+        self.delay_seconds = delay_seconds
+
+    def write(self, text: str) -> None:
+        time.sleep(self.delay_seconds)
+
+    def flush(self) -> None:
+        pass
+
+
+def time_records(handler: logging.Handler, records: int, extra: dict) -> float:
+    """Microseconds per ``logger.info`` call on the calling thread."""
+    logger = logging.getLogger("benchmarks.logging_overhead")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.handlers = [handler]
+    started = time.perf_counter()
+    for index in range(records):
+        logger.info("A request was made to a page that doesn't exist %s", index, extra=extra)
+    elapsed = time.perf_counter() - started
+    logger.handlers = []
+    return elapsed / records * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000, help="records to log per scenario")
+    parser.add_argument("--write-delay-us", type=float, default=50, help="time the stream takes per write")
+    parser.add_argument("--sample-every", type=int, default=100, help="LOG_SAMPLE_EVERY for sampled records")
+    arguments = parser.parse_args()
+    stream = SlowStream(arguments.write_delay_us / 1_000_000)
+
+    def synchronous(extra: dict) -> float:
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(TEXT_FORMATTER)
+        return time_records(handler, arguments.records, extra)
+
+    def queued(formatter: logging.Formatter, extra: dict) -> float:
+        # Big enough to hold every record, so none are dropped
+        pipeline = LogPipeline(formatter, arguments.sample_every, arguments.records + 1, logging.StreamHandler(stream))
+        pipeline.start()
+        per_record = time_records(pipeline.handler, arguments.records, extra)
+        pipeline.stop()
+        return per_record
+
+    sampled = {"sample_key": "not_found"}
+    scenarios = {
+        "synchronous text": lambda: synchronous({}),
+        "queued text": lambda: queued(TEXT_FORMATTER, {}),
+        "queued json": lambda: queued(JsonFormatter(), {}),
+        "queued json, sampled": lambda: queued(JsonFormatter(), sampled),
+    }
+    print(f"{arguments.records} records, {arguments.write_delay_us:g} us per write")
+    print(f"{'handler':<22} {'us per record':>14}")
+    for name, scenario in scenarios.items():
+        print(f"{name:<22} {scenario():>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
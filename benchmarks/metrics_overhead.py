@@ -0,0 +1,77 @@
+"""Cost of recording Prometheus metrics, per request and per outbound call.
+
+Each mode runs in a fresh process, because prometheus_client chooses
+between in-memory and mmap-file storage when it is first imported:
+
+    python -m benchmarks.metrics_overhead --calls 200000
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+import timeit
+
+
+def run_mode(multiprocess_dir: str | None, calls: int, results) -> None:
+    if multiprocess_dir:
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = multiprocess_dir
+    from flask import Flask, Response
+
+    from app.main.config.metrics_config import (
+        REQUEST_STARTED_ENVIRON_KEY,
+        configure_metrics,
+    )
+    from app.main.services.metrics_service import INVITATIONS, time_outbound_request
+
+    app = Flask(__name__)
+    app.add_url_rule("/join/submit-email", "join_route.submit_email", lambda: "")
+    configure_metrics(app)
+    record_request_latency = app.after_request_funcs[None][0]
+    response = Response()
+
+    def outbound_timer() -> None:
+        with time_outbound_request("github", "create_invitation"):
+            pass
+
+    with app.test_request_context("/join/submit-email") as context:
+        environ = context.request.environ
+
+        def request_hooks() -> None:
+            # What RequestTimer does as the request arrives
+            environ[REQUEST_STARTED_ENVIRON_KEY] = time.perf_counter()
+            record_request_latency(response)
+
+        scenarios = {
+            "request hooks": request_hooks,
+            "invitation counter": lambda: INVITATIONS.labels("sent").inc(),
+            "outbound call timer": outbound_timer,
+        }
+        results.put({
+            name: min(timeit.repeat(scenario, number=calls, repeat=5)) / calls * 1_000_000
+            for name, scenario in scenarios.items()
+        })
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200000, help="calls to time per scenario")
+    arguments = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as directory:
+        timings = {}
+        for mode, multiprocess_dir in (("single process", None), ("multiprocess", directory)):
+            results = context.Queue()
+            process = context.Process(target=run_mode, args=(multiprocess_dir, arguments.calls, results))
+            process.start()
+            timings[mode] = results.get()
+            process.join()
+
+    print(f"{'recording':<22} {'single process us':>18} {'multiprocess us':>16}")
+    for name in timings["single process"]:
+        print(f"{name:<22} {timings['single process'][name]:>18.2f} {timings['multiprocess'][name]:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
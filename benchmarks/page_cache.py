@@ -0,0 +1,43 @@
+"""Requests per second for the home page with the rendered-page cache off and on.
+
+Requests go through the full WSGI stack with Flask's test client, with rate
+limiting and background tasks disabled:
+
+    python -m benchmarks.page_cache --requests 5000
+"""
+import argparse
+import time
+from unittest.mock import MagicMock
+
+
+def requests_per_second(page_cache_enabled: bool, path: str, requests: int) -> float:
+    from app.app import create_app
+    from app.main.services.github_service import GithubService
+
+    app = create_app(MagicMock(GithubService), False, False)
+    app.page_cache.enabled = page_cache_enabled
+    client = app.test_client()
+    client.get(path)
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        client.get(path)
+    return requests / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000, help="requests to time per scenario")
+    parser.add_argument("--path", default="/", help="page to request")
+    arguments = parser.parse_args()
+
+    before = requests_per_second(False, arguments.path, arguments.requests)
+    after = requests_per_second(True, arguments.path, arguments.requests)
+    print(f"{'page cache':<12} {'requests/s':>12}")
+    print(f"{'disabled':<12} {before:>12.0f}")
+    print(f"{'enabled':<12} {after:>12.0f}")
+    print(f"{'speed-up':<12} {after / before:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Compare rate limit storages under traffic from many distinct client IPs.
+
+Each storage runs in a fresh process that hits a "10 per minute" limit once
+for each synthetic IP, then reports the growth in resident memory and the
+latency of each check:
+
+    python -m benchmarks.rate_limit_storage --ips 1000000
+"""
+import argparse
+import ipaddress
+import multiprocessing
+import resource
+import statistics
+import time
+from array import array
+
+SCENARIOS = [
+    ("memory://", "moving-window"),
+    ("memory://", "sliding-window-counter"),
+    ("sketch://", "sliding-window-counter"),
+]
+
+
+def resident_memory_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def run_scenario(storage_uri: str, strategy: str, ips: int, results) -> None:
+    from limits import parse
+    from limits.storage import storage_from_string
+    from limits.strategies import STRATEGIES
+
+    from app.main.services import rate_limit_storage  # noqa: F401
+
+    limit = parse("10 per minute")
+    limiter = STRATEGIES[strategy](storage_from_string(storage_uri))
+    first_ip = int(ipaddress.IPv4Address("10.0.0.0"))
+    keys = [str(ipaddress.IPv4Address(first_ip + offset)) for offset in range(ips)]
+
+    latencies = array("q", bytes(8 * ips))
+
+    rss_before = resident_memory_bytes()
+    for index, key in enumerate(keys):
+        started = time.perf_counter_ns()
+        limiter.hit(limit, key)
+        latencies[index] = time.perf_counter_ns() - started
+    rss_after = resident_memory_bytes()
+
+    latencies = sorted(latencies)
+    results.put({
+        "storage": storage_uri,
+        "strategy": strategy,
+        "rss_growth_mib": (rss_after - rss_before) / 2 ** 20,
+        "mean_us": statistics.fmean(latencies) / 1000,
+        "p50_us": latencies[len(latencies) // 2] / 1000,
+        "p99_us": latencies[int(len(latencies) * 0.99)] / 1000,
+    })
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ips", type=int, default=1_000_000, help="distinct client IPs to simulate")
+    arguments = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    print(f"{'storage':<12} {'strategy':<24} {'RSS growth MiB':>15} {'mean us':>9} {'p50 us':>8} {'p99 us':>8}")
+    for storage_uri, strategy in SCENARIOS:
+        results = context.Queue()
+        process = context.Process(target=run_scenario, args=(storage_uri, strategy, arguments.ips, results))
+        process.start()
+        result = results.get()
+        process.join()
+        print(
+            f"{result['storage']:<12} {result['strategy']:<24} {result['rss_growth_mib']:>15.1f} "
+            f"{result['mean_us']:>9.1f} {result['p50_us']:>8.1f} {result['p99_us']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
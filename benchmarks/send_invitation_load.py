@@ -0,0 +1,109 @@
+"""Latency of /join/send-invitation under concurrent load against the fake GitHub API.
+
+Starts ``benchmarks.fake_github`` in-process, points GithubService at it and
+sends requests from a pool of client threads, each standing in for a busy
+gunicorn worker thread. Reports throughput, latency percentiles and the
+responses seen on both sides:
+
+    python -m benchmarks.send_invitation_load --concurrency 8 --requests 400 --latency lognormal:150:0.5
+"""
+import argparse
+import statistics
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from app.main.services.organisation_registry import Organisation, OrganisationRegistry
+from benchmarks.fake_github import FakeGithubServer
+
+ORGANISATIONS = ["ministryofjustice", "moj-analytical-services"]
+EMAIL = "first.last@justice.gov.uk"
+
+
+def invitation_app(api_base_url: str, invite_max_workers: int):
+    from app.app import create_app
+    from app.main.config.app_config import app_config
+    from app.main.services.github_service import GithubService
+
+    app_config.github.api_base_url = api_base_url
+    app_config.github.send_email_invites_is_enabled = True
+    app_config.github.invite_max_workers = invite_max_workers
+    # Leave pacing to the fake server so its faults reach the app unchanged
+    app_config.github.rate_limit.requests_per_minute = 1_000_000
+    app = create_app(GithubService("fake-token"), False, False)
+    app.secret_key = "benchmark"
+    app.invitation_outbox = None
+    return app
+
+
+def session_cookie(app) -> str:
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session.update(user_input_email=EMAIL, verified_email=EMAIL, org_selection=ORGANISATIONS)
+    return f"{app.config['SESSION_COOKIE_NAME']}={client.get_cookie(app.config['SESSION_COOKIE_NAME']).value}"
+
+
+def run(app, concurrency: int, requests: int) -> tuple[list[float], Counter, float]:
+    cookie = session_cookie(app)
+
+    def send_invitation(_) -> tuple[float, int]:
+        client = app.test_client(use_cookies=False)
+        started = time.perf_counter()
+        status = client.get("/join/send-invitation", headers={"Cookie": cookie}).status_code
+        return time.perf_counter() - started, status
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(send_invitation, range(requests)))
+    elapsed = time.perf_counter() - started
+    return sorted(latency for latency, _ in results), Counter(status for _, status in results), elapsed
+
+
+def percentile(latencies: list[float], fraction: float) -> float:
+    return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=8, help="client threads sending requests")
+    parser.add_argument("--requests", type=int, default=400, help="requests to send in total")
+    parser.add_argument("--invite-max-workers", type=int, default=3, help="GitHub invitation threads in the app")
+    parser.add_argument("--latency", default="lognormal:150:0.5", help="fake GitHub latency distribution")
+    parser.add_argument("--already-member-rate", type=float, default=0.1)
+    parser.add_argument("--secondary-rate-limit-rate", type=float, default=0.01)
+    parser.add_argument("--server-error-rate", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    fake = FakeGithubServer(
+        latency=arguments.latency,
+        already_member_rate=arguments.already_member_rate,
+        secondary_rate_limit_rate=arguments.secondary_rate_limit_rate,
+        server_error_rate=arguments.server_error_rate,
+        retry_after_seconds=1,
+        rate_limit=1_000_000,
+        seed=arguments.seed,
+    )
+    registry = OrganisationRegistry([Organisation(name, True, name) for name in ORGANISATIONS])
+    with fake, patch("app.main.routes.join.organisation_registry", registry), \
+            patch("app.main.services.github_service.organisation_registry", registry):
+        latencies, statuses, elapsed = run(
+            invitation_app(fake.url, arguments.invite_max_workers), arguments.concurrency, arguments.requests
+        )
+
+    print(
+        f"{arguments.requests} requests, {arguments.concurrency} threads, "
+        f"{arguments.invite_max_workers} invitation workers, GitHub latency {arguments.latency}"
+    )
+    print(f"throughput    {arguments.requests / elapsed:8.1f} requests/s")
+    print(f"mean          {statistics.fmean(latencies) * 1000:8.1f} ms")
+    for label, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+        print(f"{label:<13} {percentile(latencies, fraction):8.1f} ms")
+    print(f"max           {latencies[-1] * 1000:8.1f} ms")
+    print(f"app responses    {dict(sorted(statuses.items()))}")
+    print(f"GitHub responses {dict(sorted(fake.responses.items()))}")
+
+
+if __name__ == "__main__":
+    main()
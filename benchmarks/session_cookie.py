@@ -0,0 +1,112 @@
+"""Session cookie size and the cost of opening the session on each request.
+
+Compares the signed-cookie session holding the whole Auth0 token response,
+as the callback used to store it, with the compact session the join flow now
+keeps, and with server-side sessions whose cookie only holds an id:
+
+    python -m benchmarks.session_cookie --requests 20000
+"""
+import argparse
+import base64
+import json
+import os
+import tempfile
+import time
+
+from flask import Flask
+from flask.sessions import SecureCookieSessionInterface
+
+from app.main.middleware.server_side_session import ServerSideSessionInterface
+from app.main.services.session_store import MemorySessionStore, SQLiteSessionStore
+
+COMPACT_SESSION = {
+    "user_input_email": "firstname.lastname@justice.gov.uk",
+    "org_selection": ["ministryofjustice", "moj-analytical-services"],
+    "verified_email": "firstname.lastname@justice.gov.uk",
+}
+
+
+def fake_jwt(payload_bytes: int) -> str:
+    def segment(value: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(value).encode()).rstrip(b"=").decode()
+
+    header = segment({"alg": "RS256", "typ": "JWT", "kid": "x" * 32})
+    payload = segment({"claims": "x" * payload_bytes})
+    signature = base64.urlsafe_b64encode(os.urandom(256)).rstrip(b"=").decode()
+    return f"{header}.{payload}.{signature}"
+
+
+def full_token_session() -> dict:
+    userinfo = {
+        "email": COMPACT_SESSION["verified_email"],
+        "email_verified": True,
+        "name": "Firstname Lastname",
+        "nickname": "firstname.lastname",
+        "picture": "https://s.gravatar.com/avatar/" + "0" * 32 + "?s=480&r=pg&d=https%3A%2F%2Fcdn.auth0.com%2Favatars%2Ffl.png",
+        "sub": "waad|" + "x" * 43,
+        "iss": "https://example.eu.auth0.com/",
+        "aud": "x" * 32,
+        "iat": 1700000000,
+        "exp": 1700036000,
+        "sid": "x" * 32,
+        "nonce": "x" * 20,
+    }
+    return {
+        "user_input_email": COMPACT_SESSION["user_input_email"],
+        "org_selection": COMPACT_SESSION["org_selection"],
+        "user": {
+            "access_token": fake_jwt(600),
+            "id_token": fake_jwt(700),
+            "scope": "openid profile email",
+            "expires_in": 86400,
+            "token_type": "Bearer",
+            "expires_at": 1700086400,
+            "userinfo": userinfo,
+        },
+    }
+
+
+def measure(app: Flask, interface, session: dict, requests: int) -> tuple[int, float]:
+    app.session_interface = interface
+    with app.test_request_context("/") as context:
+        opened = interface.open_session(app, context.request)
+        opened.update(session)
+        response = app.response_class()
+        interface.save_session(app, opened, response)
+    cookie = response.headers["Set-Cookie"].split(";", 1)[0]
+
+    environ = {"HTTP_COOKIE": cookie}
+    with app.test_request_context("/assets/stylesheets/app.css", environ_base=environ) as context:
+        started = time.perf_counter()
+        for _ in range(requests):
+            interface.open_session(app, context.request)
+        elapsed = time.perf_counter() - started
+    return len(cookie), elapsed / requests * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000, help="sessions to open per scenario")
+    arguments = parser.parse_args()
+
+    app = Flask(__name__)
+    app.secret_key = "benchmark"
+    with tempfile.TemporaryDirectory() as directory:
+        scenarios = [
+            ("cookie, full token", SecureCookieSessionInterface(), full_token_session()),
+            ("cookie, compact", SecureCookieSessionInterface(), COMPACT_SESSION),
+            ("memory://, compact", ServerSideSessionInterface(MemorySessionStore(), 3600), COMPACT_SESSION),
+            (
+                "sqlite://, compact",
+                ServerSideSessionInterface(SQLiteSessionStore(os.path.join(directory, "sessions.db")), 3600),
+                COMPACT_SESSION,
+            ),
+        ]
+        print(f"{'session':<22} {'cookie bytes':>13} {'open us':>9}")
+        for name, interface, session in scenarios:
+            cookie_bytes, open_us = measure(app, interface, session, arguments.requests)
+            print(f"{name:<22} {cookie_bytes:>13} {open_us:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
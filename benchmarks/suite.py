@@ -0,0 +1,220 @@
+"""Microbenchmarks for the join-flow hot paths, compared against a saved baseline.
+
+Covers the organisation and email checks, rendering every page template and
+a test-client round trip for each join route, with GithubService and
+Auth0_Service stubbed. Results are written as JSON and each benchmark is
+compared with benchmarks/baseline.json; one slower than its baseline by more
+than --tolerance is reported as a regression and fails the run:
+
+    python -m benchmarks.suite --output benchmark-results.json
+    python -m benchmarks.suite --save-baseline
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+from unittest.mock import MagicMock, patch
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+PAGES_PATH = os.path.join(os.path.dirname(__file__), "..", "app", "templates", "pages")
+
+JUSTICE_EMAIL = "first.last@justice.gov.uk"
+ORG_SELECTION = ["ministryofjustice", "moj-analytical-services"]
+
+
+def benchmark_organisations():
+    from app.main.services.organisation_registry import (
+        Organisation,
+        OrganisationRegistry,
+    )
+
+    return OrganisationRegistry([
+        Organisation("ministryofjustice", True, "Ministry of Justice"),
+        Organisation("moj-analytical-services", True, "MoJ Analytical Services"),
+        Organisation("ministryofjustice-test", False, "Ministry of Justice Test Organisation"),
+    ])
+
+
+def check_benchmarks() -> dict:
+    from app.main.routes.join import (
+        is_digital_justice_email,
+        is_pre_approved_email_domain,
+        sanitise_org_selection,
+    )
+    from app.main.validators.email_policy import email_policy
+    from app.main.validators.index import is_valid_email_pattern
+
+    return {
+        "checks.sanitise_org_selection": lambda: sanitise_org_selection(ORG_SELECTION),
+        "checks.is_pre_approved_email_domain": lambda: is_pre_approved_email_domain(JUSTICE_EMAIL),
+        "checks.is_digital_justice_email": lambda: is_digital_justice_email(JUSTICE_EMAIL),
+        "checks.is_valid_email_pattern": lambda: is_valid_email_pattern(JUSTICE_EMAIL),
+        "checks.email_policy_classify": lambda: email_policy.classify(JUSTICE_EMAIL),
+    }
+
+
+def join_app():
+    from app.app import create_app
+    from app.main.services.github_rate_limit_service import InvitationQuota
+    from app.main.services.github_service import (
+        GithubService,
+        InvitationResult,
+        InvitationStatus,
+    )
+    from app.main.services.invitation_outbox_service import InvitationOutbox
+
+    github_service = MagicMock(GithubService)
+    github_service.get_invitation_quota.return_value = InvitationQuota(remaining_requests=5000, blocked_until=0)
+    github_service.send_invites_to_user_email.side_effect = lambda email, organisations: [
+        InvitationResult(organisation, InvitationStatus.SENT) for organisation in organisations
+    ]
+
+    app = create_app(github_service, False, False)
+    app.secret_key = "benchmark"
+    app.auth0_service = MagicMock()
+    app.invitation_outbox = MagicMock(InvitationOutbox)
+    app.invitation_outbox.enqueue.return_value = "job-id"
+    app.invitation_outbox.get_status.return_value = {"status": "sent", "organisations": {"ministryofjustice": "sent"}}
+    return app
+
+
+def template_benchmarks(app) -> dict:
+    from flask import render_template
+
+    context = {
+        "checkboxes_items": benchmark_organisations().checkbox_items(False),
+        "is_digital_justice_user": False,
+        "is_invitation_quota_low": False,
+        "org_selection": ORG_SELECTION,
+        "org_selection_string": " and ".join(ORG_SELECTION),
+        "email": JUSTICE_EMAIL,
+        "invitation_job_id": "job-id",
+        "error_message": "Something went wrong",
+    }
+
+    def render(template: str):
+        def benchmark():
+            with app.test_request_context("/"):
+                render_template(template, **context)
+
+        return benchmark
+
+    benchmarks = {}
+    for directory, _, files in sorted(os.walk(PAGES_PATH)):
+        for file in sorted(files):
+            template = os.path.relpath(os.path.join(directory, file), os.path.dirname(PAGES_PATH))
+            benchmarks[f"templates.{template}"] = render(template)
+    return benchmarks
+
+
+def route_benchmarks(app) -> dict:
+    def session_cookie(**values) -> str:
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session.update(values)
+        return client.get_cookie(app.config["SESSION_COOKIE_NAME"]).value
+
+    def request(method: str, path: str, expected_status: int, session: dict | None = None, **kwargs):
+        client = app.test_client(use_cookies=False)
+        if session:
+            kwargs["headers"] = {"Cookie": f"{app.config['SESSION_COOKIE_NAME']}={session_cookie(**session)}"}
+        status = client.open(path, method=method, **kwargs).status_code
+        if status != expected_status:
+            raise RuntimeError(f"{method} {path} returned {status}, expected {expected_status}")
+        return lambda: client.open(path, method=method, **kwargs)
+
+    user = {"user_input_email": JUSTICE_EMAIL}
+    selected = {**user, "org_selection": ORG_SELECTION}
+    authenticated = {**selected, "verified_email": JUSTICE_EMAIL}
+    return {
+        "routes.GET /join/submit-email": request("GET", "/join/submit-email", 200),
+        "routes.POST /join/submit-email": request(
+            "POST", "/join/submit-email", 302, data={"emailAddress": JUSTICE_EMAIL}
+        ),
+        "routes.GET /join/outside-collaborator": request(
+            "GET", "/join/outside-collaborator", 200, {"user_input_email": "someone@example.com"}
+        ),
+        "routes.GET /join/select-organisations": request("GET", "/join/select-organisations", 200, user),
+        "routes.POST /join/select-organisations": request(
+            "POST", "/join/select-organisations", 302, user, data={"organisation_selection": ORG_SELECTION}
+        ),
+        "routes.GET /join/selection": request("GET", "/join/selection", 200, selected),
+        "routes.GET /join/send-invitation": request("GET", "/join/send-invitation", 302, authenticated),
+        "routes.GET /join/invitation-sent": request("GET", "/join/invitation-sent", 200, authenticated),
+        "routes.GET /join/invitation-status/<job_id>": request("GET", "/join/invitation-status/job-id", 200),
+    }
+
+
+def nanoseconds_per_call(benchmark, repeat: int) -> float:
+    timer = timeit.Timer(benchmark)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number * 1_000_000_000
+
+
+def run(pattern: str, repeat: int) -> dict:
+    with patch("app.main.routes.join.organisation_registry", benchmark_organisations()):
+        app = join_app()
+        benchmarks = check_benchmarks() | template_benchmarks(app) | route_benchmarks(app)
+        return {
+            name: {"ns_per_call": round(nanoseconds_per_call(benchmark, repeat), 1)}
+            for name, benchmark in benchmarks.items()
+            if pattern in name
+        }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    print(f"{'benchmark':<58} {'ns/call':>12} {'baseline':>12} {'change':>8}")
+    for name, result in results.items():
+        current = result["ns_per_call"]
+        previous = baseline.get(name, {}).get("ns_per_call")
+        if previous is None:
+            print(f"{name:<58} {current:>12.0f} {'-':>12} {'new':>8}")
+            continue
+        change = current / previous - 1
+        flag = ""
+        if change > tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<58} {current:>12.0f} {previous:>12.0f} {change:>+8.0%}{flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="JSON results to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="overwrite the baseline with these results")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="slowdown allowed before failing, 0.5 is 50%%")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5, help="timings per benchmark; the fastest is kept")
+    arguments = parser.parse_args()
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": run(arguments.filter, arguments.repeat),
+    }
+
+    baseline = {}
+    if os.path.exists(arguments.baseline):
+        with open(arguments.baseline) as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+    regressions = compare(report["results"], baseline, arguments.tolerance)
+
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+    if arguments.save_baseline:
+        with open(arguments.baseline, "w") as baseline_file:
+            json.dump(report, baseline_file, indent=2)
+            baseline_file.write("\n")
+    elif regressions:
+        print(f"{len(regressions)} benchmarks regressed by more than {arguments.tolerance:.0%}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ from app.main.middleware.error_handler import (
     gateway_timeout,
     page_not_found,
     server_forbidden,
+    too_many_requests,
     unknown_server_error,
 )
 from app.main.services.github_service import GithubService
@@ -26,6 +27,11 @@ class TestErrorHandler(unittest.TestCase):
             response = server_forbidden("some-error")
             self.assertEqual(response[1], 403)
 
+    def test_too_many_requests(self):
+        with self.app.test_request_context():
+            response = too_many_requests("some-error")
+            self.assertEqual(response[1], 429)
+
     def test_unknown_server_error(self):
         with self.app.test_request_context():
             response = unknown_server_error("some-error")
@@ -0,0 +1,77 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from werkzeug.test import EnvironBuilder
+
+from app.app import create_app
+from app.main.config.sentry_config import traces_sampler
+from app.main.services.github_service import GithubService
+
+FAST_PATHS = ("/assets/images/favicon.ico", "/robots.txt", "/healthz", "/metrics", "/does-not-exist")
+
+
+class TestFastPath(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app(MagicMock(GithubService), True, False)
+        self.app.config["SECRET_KEY"] = "test_flask"
+        self.client = self.app.test_client()
+
+    def is_fast_path(self, path: str) -> bool:
+        return self.app.fast_path.is_fast_path(EnvironBuilder(path=path).get_environ())
+
+    def test_declared_routes_are_fast_path(self):
+        for path in FAST_PATHS:
+            self.assertTrue(self.is_fast_path(path), path)
+
+    def test_other_routes_are_not_fast_path(self):
+        for path in ("/", "/join/submit-email", "/auth/login"):
+            self.assertFalse(self.is_fast_path(path), path)
+
+    def test_fast_path_routes_never_set_a_cookie(self):
+        with self.client.session_transaction() as session:
+            # A permanent session is re-sent on every request that loads it
+            session.permanent = True
+            session["user_input_email"] = "test@justice.gov.uk"
+
+        self.assertIn("Set-Cookie", self.client.get("/").headers)
+        for path in FAST_PATHS:
+            response = self.client.get(path)
+            self.assertNotIn("Set-Cookie", response.headers, path)
+            self.assertNotIn("Cookie", response.vary, path)
+
+    def test_fast_path_routes_do_not_touch_limiter_storage(self):
+        storage = self.app.limiter.storage
+        with patch.object(
+            storage, "acquire_sliding_window_entry", wraps=storage.acquire_sliding_window_entry
+        ) as mock_acquire, patch.object(
+            storage, "get_sliding_window", wraps=storage.get_sliding_window
+        ) as mock_get:
+            for path in FAST_PATHS:
+                self.client.get(path)
+            mock_acquire.assert_not_called()
+            mock_get.assert_not_called()
+
+            self.client.get("/")
+            mock_acquire.assert_called()
+
+    def test_fast_path_routes_skip_cors_headers(self):
+        headers = {"Origin": "https://example.com"}
+
+        self.assertIn("Access-Control-Allow-Origin", self.client.get("/", headers=headers).headers)
+        for path in FAST_PATHS:
+            self.assertNotIn("Access-Control-Allow-Origin", self.client.get(path, headers=headers).headers, path)
+
+    def test_error_responses_keep_cors_headers(self):
+        response = self.client.get("/join/invitation-status/no-such-job", headers={"Origin": "https://example.com"})
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.headers["Access-Control-Allow-Origin"], "*")
+
+    def test_fast_path_routes_are_not_traced(self):
+        for path in FAST_PATHS:
+            environ = EnvironBuilder(path=path).get_environ()
+            self.assertEqual(traces_sampler({"wsgi_environ": environ}, self.app.fast_path), 0, path)
+
+
+if __name__ == "__main__":
+    unittest.main()
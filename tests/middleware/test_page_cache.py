@@ -0,0 +1,116 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from flask import render_template, session
+
+from app.app import create_app
+from app.main.middleware.page_cache import PageCache, cached_page
+from app.main.services.github_service import GithubService
+
+
+class TestCachedPage(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app(MagicMock(GithubService), False, False)
+        self.app.config["SECRET_KEY"] = "test_flask"
+        self.client = self.app.test_client()
+
+    def test_page_is_rendered_once(self):
+        with patch("app.main.routes.main.render_template", wraps=render_template) as mock_render_template:
+            first = self.client.get("/")
+            second = self.client.get("/")
+
+        mock_render_template.assert_called_once()
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(second.status_code, 200)
+
+    def test_cached_page_has_an_etag(self):
+        self.client.get("/")
+        response = self.client.get("/")
+
+        self.assertIsNotNone(response.headers.get("ETag"))
+        self.assertIn("no-cache", response.headers["Cache-Control"])
+
+    def test_matching_etag_is_not_modified(self):
+        etag = self.client.get("/").headers["ETag"]
+
+        response = self.client.get("/", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b"")
+
+    def test_cached_page_does_not_set_a_cookie(self):
+        self.client.get("/")
+
+        self.assertNotIn("Set-Cookie", self.client.get("/").headers)
+
+    def test_page_is_not_cached_while_flash_messages_are_pending(self):
+        self.client.get("/")
+        with self.client.session_transaction() as sess:
+            sess["_flashes"] = [("message", "Please enter a valid email address.")]
+
+        with patch("app.main.routes.main.render_template", wraps=render_template) as mock_render_template:
+            self.client.get("/")
+
+        mock_render_template.assert_called_once()
+
+    def test_response_that_reads_the_session_is_not_cached(self):
+        calls = []
+
+        @cached_page
+        def reads_session():
+            calls.append(session.get("user_input_email"))
+            return "page"
+
+        self.app.add_url_rule("/reads-session", "reads_session", reads_session)
+        self.client.get("/reads-session")
+        self.client.get("/reads-session")
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(self.app.page_cache.get("reads_session"), None)
+
+    def test_page_is_rendered_every_time_when_disabled(self):
+        self.app.page_cache.enabled = False
+
+        with patch("app.main.routes.main.render_template", wraps=render_template) as mock_render_template:
+            self.client.get("/")
+            self.client.get("/")
+
+        self.assertEqual(mock_render_template.call_count, 2)
+
+    def test_robots_txt_is_cached(self):
+        self.client.get("/robots.txt")
+        response = self.client.get("/robots.txt")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"User-agent", response.data)
+        self.assertIsNotNone(self.app.page_cache.get("robot_route.send_robots_txt"))
+
+
+class TestCachedErrorPage(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app(MagicMock(GithubService), False, False)
+        self.client = self.app.test_client()
+
+    def test_error_page_is_rendered_once(self):
+        with patch("app.main.middleware.page_cache.render_template", wraps=render_template) as mock_render_template:
+            first = self.client.get("/does-not-exist")
+            second = self.client.get("/also-does-not-exist")
+
+        mock_render_template.assert_called_once()
+        self.assertEqual(second.status_code, 404)
+        self.assertEqual(first.data, second.data)
+        self.assertNotIn("ETag", second.headers)
+
+
+class TestPageCacheVersion(unittest.TestCase):
+    def test_entries_are_keyed_on_the_config_version(self):
+        cache = PageCache("v1")
+        cache.store("main.index", MagicMock(get_data=MagicMock(return_value=b"v1"), status_code=200, headers={}))
+
+        cache.version = "v2"
+
+        self.assertIsNone(cache.get("main.index"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import pstats
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from werkzeug.routing import Map
+from werkzeug.test import create_environ
+
+from app.app import create_app
+from app.main.config.app_config import app_config
+from app.main.middleware.request_profiler import RequestProfiler, prune_profiles
+from app.main.services.github_service import GithubService
+
+
+class TestRequestProfiler(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def create_app(self, sample_rate: float = 0, token: str | None = None):
+        with patch.object(app_config.profiling, "sample_rate", sample_rate), \
+                patch.object(app_config.profiling, "token", token), \
+                patch.object(app_config.profiling, "directory", self.directory.name):
+            return create_app(MagicMock(GithubService), False, False)
+
+    def get(self, client, path: str, **kwargs):
+        # Profiles are saved once the response is closed
+        with client.get(path, **kwargs) as response:
+            return response
+
+    def profiles(self) -> list[str]:
+        return sorted(os.listdir(self.directory.name))
+
+    def test_is_off_by_default(self):
+        app = self.create_app()
+
+        self.assertNotIsInstance(app.wsgi_app, RequestProfiler)
+
+    def test_writes_a_profile_named_after_the_route(self):
+        app = self.create_app(sample_rate=1)
+
+        response = self.get(app.test_client(), "/join/submit-email")
+
+        self.assertEqual(response.status_code, 200)
+        [name] = self.profiles()
+        self.assertIn("-join_route.submit_email-", name)
+        self.assertRegex(name, r"-\d+ms-0concurrent-\d+-0\.prof$")
+        stats = pstats.Stats(os.path.join(self.directory.name, name))
+        self.assertGreater(stats.total_calls, 0)
+
+    def test_names_unmatched_requests(self):
+        app = self.create_app(sample_rate=1)
+
+        self.get(app.test_client(), "/does-not-exist")
+
+        self.assertIn("-unmatched-", self.profiles()[0])
+
+    def test_profiles_requests_with_the_token(self):
+        app = self.create_app(token="secret")
+        client = app.test_client()
+
+        self.get(client, "/healthz")
+        self.get(client, "/healthz", headers={"X-Profile-Token": "wrong"})
+        self.assertEqual(self.profiles(), [])
+
+        self.get(client, "/healthz", headers={"X-Profile-Token": "secret"})
+        self.assertEqual(len(self.profiles()), 1)
+
+    def test_names_the_requests_handled_during_the_profile(self):
+        def wsgi_app(environ, start_response):
+            if environ.get("HTTP_X_PROFILE_TOKEN"):
+                # Another request on this worker arrives while the profiled one runs
+                profiler(create_environ("/"), start_response)
+            start_response("200 OK", [])
+            return [b""]
+
+        profiler = RequestProfiler(wsgi_app, Map(), self.directory.name, token="secret")
+
+        profiler(create_environ("/", headers={"X-Profile-Token": "secret"}), lambda *args: None).close()
+
+        self.assertIn("-1concurrent-", self.profiles()[0])
+
+
+class TestPruneProfiles(unittest.TestCase):
+    def test_deletes_the_oldest_profiles_over_the_cap(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for index in range(4):
+                path = os.path.join(directory, f"{index}.prof")
+                with open(path, "wb") as profile:
+                    profile.write(b"x" * 100)
+                os.utime(path, ns=(index * 10**9, index * 10**9))
+            with open(os.path.join(directory, "notes.txt"), "wb") as notes:
+                notes.write(b"x" * 1000)
+
+            prune_profiles(directory, 250)
+
+            self.assertEqual(sorted(os.listdir(directory)), ["2.prof", "3.prof", "notes.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
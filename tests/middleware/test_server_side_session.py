@@ -0,0 +1,92 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from app.app import create_app
+from app.main.middleware.server_side_session import ServerSideSessionInterface
+from app.main.services.github_service import GithubService
+
+
+class TestServerSideSession(unittest.TestCase):
+    def setUp(self):
+        with patch(
+            "app.main.config.session_config.app_config",
+            SimpleNamespace(session=SimpleNamespace(store_uri="memory://", ttl_seconds=60)),
+        ):
+            self.app = create_app(MagicMock(GithubService), False, False)
+        self.app.config["SECRET_KEY"] = "test_flask"
+        self.store = self.app.session_interface.wrapped.store
+        self.client = self.app.test_client()
+
+    def session_cookie(self) -> str:
+        return self.client.get_cookie("session").value
+
+    def test_server_side_sessions_are_configured(self):
+        self.assertIsInstance(self.app.session_interface.wrapped, ServerSideSessionInterface)
+
+    def test_cookie_holds_only_a_signed_session_id(self):
+        self.client.post("/join/submit-email", data={"emailAddress": "test@justice.gov.uk"})
+
+        sid, _ = self.session_cookie().rsplit(".", 1)
+        self.assertLess(len(self.session_cookie()), 80)
+        self.assertIn("test@justice.gov.uk", self.store.load(sid))
+
+    def test_session_is_read_back_from_the_store(self):
+        with self.client.session_transaction() as session:
+            session["verified_email"] = "test@justice.gov.uk"
+
+        with self.client.session_transaction() as session:
+            self.assertEqual(session["verified_email"], "test@justice.gov.uk")
+
+    def test_requests_without_a_cookie_do_not_create_a_session(self):
+        response = self.client.get("/")
+
+        self.assertNotIn("Set-Cookie", response.headers)
+        self.assertEqual(self.store.sessions, {})
+
+    def test_tampered_cookie_starts_a_new_session(self):
+        with self.client.session_transaction() as session:
+            session["verified_email"] = "test@justice.gov.uk"
+        sid, _ = self.session_cookie().rsplit(".", 1)
+        self.client.set_cookie("session", f"{sid}.forged")
+
+        with self.client.session_transaction() as session:
+            self.assertNotIn("verified_email", session)
+
+    def test_login_issues_a_new_session_id(self):
+        self.app.auth0_service = MagicMock()
+        self.app.auth0_service.get_access_token.return_value = {"userinfo": {"email": "test@justice.gov.uk"}}
+        with self.client.session_transaction() as session:
+            session["user_input_email"] = "test@justice.gov.uk"
+        cookie_before_login = self.session_cookie()
+        sid_before_login, _ = cookie_before_login.rsplit(".", 1)
+
+        self.client.get("/auth/callback")
+
+        self.assertNotEqual(self.session_cookie(), cookie_before_login)
+        self.assertIsNone(self.store.load(sid_before_login))
+        with self.client.session_transaction() as session:
+            self.assertEqual(session["user_input_email"], "test@justice.gov.uk")
+            self.assertEqual(session["verified_email"], "test@justice.gov.uk")
+
+    def test_cleared_session_is_deleted_from_the_store(self):
+        with self.client.session_transaction() as session:
+            session["verified_email"] = "test@justice.gov.uk"
+
+        self.client.get("/auth/logout")
+
+        self.assertEqual(self.store.sessions, {})
+        self.assertIsNone(self.client.get_cookie("session"))
+
+    def test_unmodified_session_is_not_written_again(self):
+        with self.client.session_transaction() as session:
+            session["verified_email"] = "test@justice.gov.uk"
+        self.store.save = MagicMock()
+
+        self.client.get("/join/submit-email")
+
+        self.store.save.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+import io
+import json
+import logging
+import queue
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.app import create_app
+from app.main.config.app_config import app_config
+from app.main.middleware.structured_logging import (
+    REQUEST_ID_ENVIRON_KEY,
+    JsonFormatter,
+    LogPipeline,
+    NonBlockingQueueHandler,
+    SamplingFilter,
+    request_id,
+)
+from app.main.services.github_service import GithubService
+
+
+def make_record(name: str = "app.test", msg: str = "message %s", args=("one",), **extra) -> logging.LogRecord:
+    record = logging.LogRecord(name, logging.INFO, "test.py", 10, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestJsonFormatter(unittest.TestCase):
+    def test_writes_stable_fields(self):
+        entry = json.loads(JsonFormatter().format(make_record(route="join_route.join", status=200, org="ministryofjustice")))
+
+        self.assertEqual(entry["level"], "INFO")
+        self.assertEqual(entry["logger"], "app.test")
+        self.assertEqual(entry["source"], "test.py:10")
+        self.assertEqual(entry["message"], "message one")
+        self.assertEqual(entry["route"], "join_route.join")
+        self.assertEqual(entry["status"], 200)
+        self.assertEqual(entry["org"], "ministryofjustice")
+        self.assertTrue(entry["timestamp"].endswith("Z"))
+        self.assertNotIn("request_id", entry)
+
+    def test_includes_the_exception(self):
+        try:
+            raise ValueError("broken")
+        except ValueError:
+            record = logging.LogRecord("app.test", logging.ERROR, "test.py", 10, "failed", (), sys.exc_info())
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        self.assertIn("ValueError: broken", entry["exception"])
+
+
+class TestSamplingFilter(unittest.TestCase):
+    def test_passes_one_in_every_records_with_a_sample_key(self):
+        sampling_filter = SamplingFilter(10)
+        records = [make_record(sample_key="not_found") for _ in range(25)]
+
+        passed = [record for record in records if sampling_filter.filter(record)]
+
+        self.assertEqual(passed, [records[0], records[10], records[20]])
+        self.assertEqual(passed[0].sample_rate, 10)
+
+    def test_passes_records_without_a_sample_key(self):
+        sampling_filter = SamplingFilter(10)
+
+        self.assertTrue(all(sampling_filter.filter(make_record()) for _ in range(5)))
+
+    def test_samples_limiter_records(self):
+        sampling_filter = SamplingFilter(10)
+
+        passed = [sampling_filter.filter(make_record("flask-limiter")) for _ in range(10)]
+
+        self.assertEqual(passed.count(True), 1)
+
+    def test_counts_each_logger_separately(self):
+        sampling_filter = SamplingFilter(10)
+
+        self.assertTrue(sampling_filter.filter(make_record("app.one", sample_key="not_found")))
+        self.assertTrue(sampling_filter.filter(make_record("app.two", sample_key="not_found")))
+
+
+class TestRequestId(unittest.TestCase):
+    def test_uses_the_ingress_request_id(self):
+        self.assertEqual(request_id({"HTTP_X_REQUEST_ID": "abc123"}), "abc123")
+
+    def test_generates_one_once_per_request(self):
+        environ = {}
+
+        identifier = request_id(environ)
+
+        self.assertEqual(len(identifier), 32)
+        self.assertEqual(request_id(environ), identifier)
+        self.assertEqual(environ[REQUEST_ID_ENVIRON_KEY], identifier)
+
+    def test_replaces_an_overlong_request_id(self):
+        self.assertNotEqual(request_id({"HTTP_X_REQUEST_ID": "a" * 500}), "a" * 500)
+
+
+class TestNonBlockingQueueHandler(unittest.TestCase):
+    def test_drops_records_when_the_queue_is_full(self):
+        handler = NonBlockingQueueHandler(queue.Queue(1))
+
+        handler.handle(make_record())
+        handler.handle(make_record())
+
+        self.assertEqual(handler.dropped, 1)
+        self.assertEqual(handler.queue.qsize(), 1)
+
+    def test_reports_dropped_records_once_there_is_room(self):
+        handler = NonBlockingQueueHandler(queue.Queue(3))
+        handler.dropped = 4
+
+        handler.handle(make_record())
+
+        handler.queue.get_nowait()
+        self.assertEqual(handler.queue.get_nowait().getMessage(), "Dropped 4 log records while the log queue was full")
+        self.assertEqual(handler.dropped, 0)
+
+    def test_renders_the_message_before_queueing(self):
+        handler = NonBlockingQueueHandler(queue.Queue())
+
+        handler.handle(make_record(args=({"not": "picklable"},)))
+
+        queued = handler.queue.get_nowait()
+        self.assertEqual(queued.msg, "message {'not': 'picklable'}")
+        self.assertIsNone(queued.args)
+
+
+class TestLogPipeline(unittest.TestCase):
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.pipeline = LogPipeline(JsonFormatter(), output=logging.StreamHandler(self.stream))
+        self.logger = logging.getLogger("tests.structured_logging")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+        self.logger.addHandler(self.pipeline.handler)
+
+    def tearDown(self):
+        self.logger.removeHandler(self.pipeline.handler)
+        self.logger.propagate = True
+
+    def entries(self) -> list[dict]:
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def test_writes_records_from_the_listener_thread(self):
+        self.pipeline.start()
+        self.logger.info("Invitation sent", extra={"org": "ministryofjustice"})
+        self.pipeline.stop()
+
+        self.assertEqual(self.entries()[0]["message"], "Invitation sent")
+        self.assertEqual(self.entries()[0]["org"], "ministryofjustice")
+
+    def test_adds_the_route_and_request_id_during_a_request(self):
+        app = create_app(MagicMock(GithubService), False, False)
+
+        self.pipeline.start()
+        with app.test_request_context("/join/submit-email", headers={"X-Request-Id": "request-1"}):
+            app.preprocess_request()
+            self.logger.info("Checking email")
+        self.pipeline.stop()
+
+        self.assertEqual(self.entries()[0]["route"], "join_route.submit_email")
+        self.assertEqual(self.entries()[0]["request_id"], "request-1")
+
+    def test_restart_after_fork_uses_a_new_queue(self):
+        self.pipeline.start()
+        parent_queue, parent_listener = self.pipeline.handler.queue, self.pipeline.listener
+        self.pipeline.restart_after_fork()
+        self.logger.info("From the child")
+        self.pipeline.stop()
+        parent_listener.stop()
+
+        self.assertIsNot(self.pipeline.handler.queue, parent_queue)
+        self.assertEqual([entry["message"] for entry in self.entries()], ["From the child"])
+
+
+class TestRequestLogging(unittest.TestCase):
+    def setUp(self):
+        with patch.object(app_config.logging, "format", "json"):
+            self.app = create_app(MagicMock(GithubService), False, False)
+        self.client = self.app.test_client()
+
+    def test_logs_the_route_status_and_duration(self):
+        with self.assertLogs("app.main.middleware.structured_logging", logging.INFO) as logs:
+            self.client.get("/join/submit-email")
+
+        record = logs.records[0]
+        self.assertEqual(record.getMessage(), "GET /join/submit-email 200")
+        self.assertEqual(record.route, "join_route.submit_email")
+        self.assertEqual(record.status, 200)
+        self.assertGreater(record.duration_ms, 0)
+
+    def test_marks_missing_pages_for_sampling(self):
+        with self.assertLogs("app.main.middleware.structured_logging", logging.INFO) as logs:
+            self.client.get("/does-not-exist")
+
+        self.assertEqual(logs.records[0].route, "unmatched")
+        self.assertEqual(logs.records[0].sample_key, "not_found")
+
+    def test_skips_successful_fast_path_requests(self):
+        with patch("app.main.middleware.structured_logging.logger") as logger:
+            self.client.get("/healthz")
+            self.client.get("/robots.txt")
+
+        logger.info.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
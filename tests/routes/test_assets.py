@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from flask import Flask
+
+from app.main.config.assets_config import configure_assets
+from app.main.routes.assets import assets_route
+from app.main.services.asset_service import asset_url, build_assets
+
+STATIC_FOLDER = os.path.join(os.path.dirname(__file__), "..", "..", "app", "static")
+
+
+class TestFingerprintedAssets(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.static_folder = os.path.join(cls.directory.name, "static")
+        shutil.copytree(STATIC_FOLDER, cls.static_folder, ignore=shutil.ignore_patterns("dist"))
+        cls.manifest = build_assets(cls.static_folder)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.directory.cleanup()
+
+    def setUp(self) -> None:
+        self.app = Flask(__name__, static_folder=self.static_folder, static_url_path="/assets")
+        self.app.register_blueprint(assets_route)
+        self.app.add_url_rule("/page", "page", lambda: "<html></html>")
+        configure_assets(self.app)
+        self.client = self.app.test_client()
+        self.stylesheet_url = asset_url(self.manifest, "stylesheets/moj-frontend.min.css")
+
+    def test_assets_are_cached_as_immutable(self):
+        response = self.client.get(self.stylesheet_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "text/css")
+        self.assertIn("immutable", response.headers["Cache-Control"])
+        self.assertIn("max-age=31536000", response.headers["Cache-Control"])
+        self.assertEqual(response.headers["Vary"], "Accept-Encoding")
+
+    def test_brotli_is_preferred(self):
+        response = self.client.get(self.stylesheet_url, headers={"Accept-Encoding": "gzip, deflate, br"})
+
+        self.assertEqual(response.headers["Content-Encoding"], "br")
+
+    def test_gzip_is_served_without_brotli_support(self):
+        response = self.client.get(self.stylesheet_url, headers={"Accept-Encoding": "gzip"})
+
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+
+    def test_identity_is_served_without_accept_encoding(self):
+        response = self.client.get(self.stylesheet_url)
+
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertIn(b".govuk-", response.data)
+
+    def test_refused_encodings_are_not_served(self):
+        response = self.client.get(self.stylesheet_url, headers={"Accept-Encoding": "br;q=0, gzip"})
+
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+
+    def test_unknown_assets_are_not_found(self):
+        self.assertEqual(self.client.get("/assets/dist/stylesheets/moj-frontend.min.css").status_code, 404)
+        self.assertEqual(self.client.get("/assets/dist/../robots.txt").status_code, 404)
+
+    def test_unfingerprinted_assets_are_still_served(self):
+        self.assertEqual(self.client.get("/assets/stylesheets/moj-frontend.min.css").status_code, 200)
+
+    def test_pages_preload_critical_assets(self):
+        link = self.client.get("/page").headers["Link"]
+
+        self.assertIn(f"<{self.stylesheet_url}>; rel=preload; as=style", link)
+        self.assertIn(
+            f"<{asset_url(self.manifest, 'fonts/light-94a07e06a1-v2.woff2')}>; rel=preload; as=font; crossorigin",
+            link,
+        )
+
+    def test_assets_do_not_have_preload_links(self):
+        self.assertNotIn("Link", self.client.get(self.stylesheet_url).headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
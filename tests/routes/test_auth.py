@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 from flask import Response
 
@@ -15,12 +15,14 @@ class TestAuthRoutes(unittest.TestCase):
         self.ctx.push()
         self.app.config["SECRET_KEY"] = "my_precious_test_key"
         self.client = self.app.test_client()
+        self.mock_auth0_service = MagicMock()
+        self.app.auth0_service = self.mock_auth0_service
 
     def tearDown(self):
         self.ctx.pop()
 
-    @patch("app.main.routes.auth.auth0_service")
-    def test_login_route_redirects(self, mock_auth0_service):
+    def test_login_route_redirects(self):
+        mock_auth0_service = self.mock_auth0_service
         mock_auth0_service.login.return_value = Response(
             status=302, headers={"Location": "mock://auth0.redirect"}
         )
@@ -31,21 +33,23 @@ class TestAuthRoutes(unittest.TestCase):
         self.assertIn("mock://auth0.redirect", response.headers["Location"])
         mock_auth0_service.login.assert_called_once()
 
-    @patch("app.main.routes.auth.auth0_service")
-    def test_callback_route_stores_users_session_and_redirects(
-        self, mock_auth0_service
-    ):
-        mock_auth0_service.get_access_token.return_value = "The users session! 🤩"
+    def test_callback_route_stores_only_the_verified_email_and_redirects(self):
+        mock_auth0_service = self.mock_auth0_service
+        mock_auth0_service.get_access_token.return_value = {
+            "access_token": "access-token",
+            "id_token": "id-token",
+            "userinfo": {"email": "test@justice.gov.uk", "name": "Test"},
+        }
 
         response = self.client.get("/auth/callback")
 
         self.assertEqual(response.status_code, 302)
         with self.client.session_transaction() as session:
-            self.assertEqual(session["user"], "The users session! 🤩")
+            self.assertEqual(dict(session), {"verified_email": "test@justice.gov.uk"})
         self.assertIn("join/send-invitation", response.headers["Location"])
 
-    @patch("app.main.routes.auth.auth0_service")
-    def test_logout_route_clears_session_and_redirects(self, mock_auth0_service):
+    def test_logout_route_clears_session_and_redirects(self):
+        mock_auth0_service = self.mock_auth0_service
         mock_auth0_service.logout.return_value = Response(
             status=302, headers={"Location": "/"}
         )
@@ -53,7 +57,7 @@ class TestAuthRoutes(unittest.TestCase):
         response = self.client.get("/auth/logout")
 
         with self.client.session_transaction() as session:
-            self.assertEqual(session.get("user", None), None)
+            self.assertEqual(session.get("verified_email", None), None)
         self.assertIn("/", response.headers["Location"])
         self.assertEqual(response.status_code, 302)
         mock_auth0_service.logout.assert_called_with("http://localhost/")
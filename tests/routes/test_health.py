@@ -0,0 +1,109 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from prometheus_client import REGISTRY
+from werkzeug.test import EnvironBuilder
+
+from app.app import create_app
+from app.main.config.sentry_config import traces_sampler
+from app.main.services.github_service import GithubService
+
+
+class TestHealthRoutes(unittest.TestCase):
+    def setUp(self):
+        self.github_service = MagicMock(GithubService)
+        self.github_service.get_rate_limit_remaining.return_value = 5000
+        self.app = create_app(self.github_service, True, False)
+        self.app.auth0_service = MagicMock()
+        self.app.auth0_service.load_server_metadata.return_value = {
+            "issuer": "https://auth0.example/",
+            "authorization_endpoint": "https://auth0.example/authorize",
+        }
+        self.client = self.app.test_client()
+
+    def test_healthz_is_constant(self):
+        response = self.client.get("/healthz")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, b"ok")
+        self.assertNotIn("Set-Cookie", response.headers)
+
+    def test_healthz_is_not_rate_limited(self):
+        status_codes = [self.client.get("/healthz").status_code for _ in range(5)]
+
+        self.assertEqual(status_codes, [200] * 5)
+
+    def test_healthz_does_not_render_templates(self):
+        with patch("flask.templating._render") as mock_render:
+            self.client.get("/healthz")
+
+        mock_render.assert_not_called()
+
+    def test_readyz_is_unavailable_before_the_first_check(self):
+        response = self.client.get("/readyz")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertFalse(response.json["ready"])
+
+    def test_readyz_reports_cached_results(self):
+        self.app.readiness.refresh()
+
+        response = self.client.get("/readyz")
+        self.client.get("/readyz")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json["checks"]["github"]["detail"], "5000 GitHub requests remaining"
+        )
+        self.github_service.get_rate_limit_remaining.assert_called_once()
+
+    def test_readyz_reports_a_low_github_budget_as_degraded(self):
+        self.github_service.get_rate_limit_remaining.return_value = 3
+        self.app.readiness.refresh()
+
+        response = self.client.get("/readyz")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json["degraded"])
+        self.assertTrue(response.json["checks"]["github"]["ready"])
+        self.assertTrue(response.json["checks"]["github"]["degraded"])
+        self.assertEqual(REGISTRY.get_sample_value("join_github_github_requests_remaining"), 3)
+
+    def test_readyz_is_unavailable_when_github_cannot_be_reached(self):
+        self.github_service.get_rate_limit_remaining.side_effect = ConnectionError("timed out")
+        self.app.readiness.refresh()
+
+        response = self.client.get("/readyz")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertFalse(response.json["checks"]["github"]["ready"])
+        self.assertTrue(response.json["checks"]["oidc_metadata"]["ready"])
+
+    def test_readyz_is_unavailable_without_oidc_metadata(self):
+        self.app.auth0_service.load_server_metadata.side_effect = ConnectionError("timed out")
+        self.app.readiness.refresh()
+
+        response = self.client.get("/readyz")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json["checks"]["oidc_metadata"]["detail"], "timed out")
+
+
+class TestHealthTracing(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app(MagicMock(GithubService), False, False)
+
+    def sample_rate(self, path: str) -> float:
+        environ = EnvironBuilder(path=path).get_environ()
+        return traces_sampler({"wsgi_environ": environ}, self.app.fast_path)
+
+    def test_health_endpoints_are_not_traced(self):
+        for path in ("/healthz", "/readyz"):
+            self.assertEqual(self.sample_rate(path), 0)
+
+    def test_other_routes_are_sampled(self):
+        self.assertEqual(self.sample_rate("/"), 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
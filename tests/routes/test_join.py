@@ -1,12 +1,20 @@
 import unittest
-from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from flask import get_flashed_messages
-from github import GithubException
 
 from app.app import create_app
-from app.main.services.github_service import GithubService
+from app.main.services.github_rate_limit_service import InvitationQuota
+from app.main.services.github_service import (
+    GithubService,
+    InvitationResult,
+    InvitationStatus,
+)
+from app.main.services.invitation_outbox_service import InvitationOutbox
+from app.main.services.organisation_registry import (
+    Organisation,
+    OrganisationRegistry,
+)
 
 
 class TestSubmitEmail(unittest.TestCase):
@@ -67,18 +75,10 @@ class TestSelectOrganisation(unittest.TestCase):
         self.client = self.app.test_client()
 
     @patch(
-        "app.main.routes.join.app_config",
-        new=SimpleNamespace(
-            github=SimpleNamespace(
-                organisations=[
-                    SimpleNamespace(
-                        name="moj-analytical-services",
-                        enabled=True,
-                        display_text="MoJ Analytical Services",
-                    )
-                ]
-            )
-        ),
+        "app.main.routes.join.organisation_registry",
+        new=OrganisationRegistry([
+            Organisation("moj-analytical-services", True, "MoJ Analytical Services"),
+        ]),
     )
     def test_select_organisations_digital_justice_user(self):
         with self.client.session_transaction() as sess:
@@ -92,6 +92,29 @@ class TestSelectOrganisation(unittest.TestCase):
             "disabled", str(response.data)
         )  # Check if the checkbox is disabled
 
+    def test_warns_when_invitation_quota_is_low(self):
+        self.github_service.get_invitation_quota.return_value = InvitationQuota(
+            remaining_requests=1, blocked_until=0, is_low=True)
+
+        with self.client.session_transaction() as sess:
+            sess["user_input_email"] = "user@justice.gov.uk"
+
+        response = self.client.get("/join/select-organisations")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("We are sending a lot of GitHub invitations", str(response.data))
+
+    def test_does_not_warn_when_invitation_quota_is_healthy(self):
+        self.github_service.get_invitation_quota.return_value = InvitationQuota(
+            remaining_requests=5000, blocked_until=0, is_low=False)
+
+        with self.client.session_transaction() as sess:
+            sess["user_input_email"] = "user@justice.gov.uk"
+
+        response = self.client.get("/join/select-organisations")
+
+        self.assertNotIn("We are sending a lot of GitHub invitations", str(response.data))
+
 
 class TestSelection(unittest.TestCase):
     def setUp(self):
@@ -138,45 +161,14 @@ class TestSendInvitations(unittest.TestCase):
         self.app.config["SECRET_KEY"] = "test_flask"
         self.client = self.app.test_client()
 
-    @patch("app.main.routes.join.app_config", new_callable=MagicMock)
     @patch('app.main.routes.join.is_pre_approved_email_domain', return_value=True)
-    def test_when_user_is_already_member_of_an_org(self, mock_app_config, mock_is_pre_approved_email_domain):
-
-        mock_app_config.return_value = SimpleNamespace(
-            github=SimpleNamespace(
-                send_email_invites_is_enabled=True,
-                token="mock_token",
-                allowed_email_domains=[
-                    "justice.gov.uk"
-                ],
-                organisations=[
-                    SimpleNamespace(
-                        name="ministryofjustice",
-                        enabled=True,
-                        display_test="Mock"
-                    )
-                ]
-            )
-        )
-
-        self.github_service.send_invites_to_user_email.side_effect = GithubException(
-            status=422,
-            data={
-                "message": "Validation Failed",
-                "errors": [
-                    {
-                        "resource": "OrganizationInvitation",
-                        "code": "unprocessable",
-                        "field": "data",
-                        "message": "A user with this email address is already a part of this organization"
-                    }
-                ],
-                "documentation_url": "https://docs.github.com/rest/orgs/members#create-an-organization-invitation"
-            }
-        )
+    def test_when_user_is_already_member_of_an_org(self, mock_is_pre_approved_email_domain):
+        self.github_service.send_invites_to_user_email.return_value = [
+            InvitationResult("ministryofjustice", InvitationStatus.ALREADY_MEMBER)
+        ]
 
         with self.client.session_transaction() as sess:
-            sess["user"] = {"userinfo": {"email": "test@justice.gov.uk"}}
+            sess["verified_email"] = "test@justice.gov.uk"
             sess["user_input_email"] = "test@justice.gov.uk"
             sess["org_selection"] = ["ministryofjustice"]
 
@@ -187,6 +179,141 @@ class TestSendInvitations(unittest.TestCase):
             "It appears you are already a member", str(
                 response.data))
 
+    @patch('app.main.routes.join.is_pre_approved_email_domain', return_value=True)
+    def test_redirects_to_invitation_sent_when_invites_are_sent(self, mock_is_pre_approved_email_domain):
+        self.github_service.send_invites_to_user_email.return_value = [
+            InvitationResult("ministryofjustice", InvitationStatus.SENT),
+            InvitationResult("moj-analytical-services", InvitationStatus.ALREADY_MEMBER),
+        ]
+
+        with self.client.session_transaction() as sess:
+            sess["verified_email"] = "test@justice.gov.uk"
+            sess["user_input_email"] = "test@justice.gov.uk"
+            sess["org_selection"] = ["ministryofjustice", "moj-analytical-services"]
+
+        response = self.client.get("/join/send-invitation")
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.headers["Location"], "/join/invitation-sent")
+        with self.client.session_transaction() as sess:
+            self.assertEqual(sess["org_selection"], ["ministryofjustice"])
+
+    @patch('app.main.routes.join.is_pre_approved_email_domain', return_value=True)
+    def test_confirms_sent_invites_when_another_fails(self, mock_is_pre_approved_email_domain):
+        self.github_service.send_invites_to_user_email.return_value = [
+            InvitationResult("ministryofjustice", InvitationStatus.SENT),
+            InvitationResult("moj-analytical-services", InvitationStatus.FAILED, "Server Error"),
+        ]
+
+        with self.client.session_transaction() as sess:
+            sess["verified_email"] = "test@justice.gov.uk"
+            sess["user_input_email"] = "test@justice.gov.uk"
+            sess["org_selection"] = ["ministryofjustice", "moj-analytical-services"]
+
+        response = self.client.get("/join/send-invitation")
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.headers["Location"], "/join/invitation-sent")
+        with self.client.session_transaction() as sess:
+            self.assertEqual(sess["org_selection"], ["ministryofjustice"])
+            self.assertEqual(sess["failed_organisations"], ["moj-analytical-services"])
+            self.assertEqual(sess["deferred_organisations"], [])
+
+    @patch('app.main.routes.join.is_pre_approved_email_domain', return_value=True)
+    def test_confirms_sent_invites_when_another_is_rate_limited(self, mock_is_pre_approved_email_domain):
+        self.github_service.send_invites_to_user_email.return_value = [
+            InvitationResult("ministryofjustice", InvitationStatus.SENT),
+            InvitationResult("moj-analytical-services", InvitationStatus.RATE_LIMITED, "GitHub rate limit exhausted"),
+        ]
+
+        with self.client.session_transaction() as sess:
+            sess["verified_email"] = "test@justice.gov.uk"
+            sess["user_input_email"] = "test@justice.gov.uk"
+            sess["org_selection"] = ["ministryofjustice", "moj-analytical-services"]
+
+        response = self.client.get("/join/send-invitation")
+
+        self.assertEqual(response.status_code, 302)
+        with self.client.session_transaction() as sess:
+            self.assertEqual(sess["org_selection"], ["ministryofjustice"])
+            self.assertEqual(sess["deferred_organisations"], ["moj-analytical-services"])
+
+    @patch('app.main.routes.join.is_pre_approved_email_domain', return_value=True)
+    def test_returns_server_error_when_every_invite_fails(self, mock_is_pre_approved_email_domain):
+        self.github_service.send_invites_to_user_email.return_value = [
+            InvitationResult("ministryofjustice", InvitationStatus.FAILED, "Server Error"),
+            InvitationResult("moj-analytical-services", InvitationStatus.RATE_LIMITED, "GitHub rate limit exhausted"),
+        ]
+
+        with self.client.session_transaction() as sess:
+            sess["verified_email"] = "test@justice.gov.uk"
+            sess["user_input_email"] = "test@justice.gov.uk"
+            sess["org_selection"] = ["ministryofjustice", "moj-analytical-services"]
+
+        response = self.client.get("/join/send-invitation")
+
+        self.assertEqual(response.status_code, 500)
+
+    @patch('app.main.routes.join.is_pre_approved_email_domain', return_value=True)
+    def test_returns_too_many_requests_when_an_invite_is_rate_limited(self, mock_is_pre_approved_email_domain):
+        self.github_service.send_invites_to_user_email.return_value = [
+            InvitationResult("ministryofjustice", InvitationStatus.RATE_LIMITED, "GitHub rate limit exhausted"),
+        ]
+
+        with self.client.session_transaction() as sess:
+            sess["verified_email"] = "test@justice.gov.uk"
+            sess["user_input_email"] = "test@justice.gov.uk"
+            sess["org_selection"] = ["ministryofjustice"]
+
+        response = self.client.get("/join/send-invitation")
+
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("We are sending a lot of GitHub invitations", str(response.data))
+
+    @patch('app.main.routes.join.is_pre_approved_email_domain', return_value=True)
+    def test_queues_invitation_when_outbox_is_enabled(self, mock_is_pre_approved_email_domain):
+        self.app.invitation_outbox = MagicMock(InvitationOutbox)
+        self.app.invitation_outbox.enqueue.return_value = "job-id"
+
+        with self.client.session_transaction() as sess:
+            sess["verified_email"] = "test@justice.gov.uk"
+            sess["user_input_email"] = "test@justice.gov.uk"
+            sess["org_selection"] = ["ministryofjustice"]
+
+        response = self.client.get("/join/send-invitation")
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.headers["Location"], "/join/invitation-sent")
+        self.app.invitation_outbox.enqueue.assert_called_once()
+        self.github_service.send_invites_to_user_email.assert_not_called()
+        with self.client.session_transaction() as sess:
+            self.assertEqual(sess["invitation_job_id"], "job-id")
+
+
+class TestInvitationStatus(unittest.TestCase):
+    def setUp(self):
+        self.github_service = MagicMock(GithubService)
+        self.app = create_app(self.github_service, False)
+        self.client = self.app.test_client()
+
+    def test_returns_not_found_when_outbox_is_disabled(self):
+        response = self.client.get("/join/invitation-status/job-id")
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_returns_job_status(self):
+        self.app.invitation_outbox = MagicMock(InvitationOutbox)
+        self.app.invitation_outbox.get_status.return_value = {
+            "status": "completed",
+            "organisations": {"ministryofjustice": "sent"},
+        }
+
+        response = self.client.get("/join/invitation-status/job-id")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json["status"], "completed")
+        self.app.invitation_outbox.get_status.assert_called_once_with("job-id")
+
 
 class TestInvitationSent(unittest.TestCase):
     def setUp(self):
@@ -196,22 +323,14 @@ class TestInvitationSent(unittest.TestCase):
         self.client = self.app.test_client()
 
     @patch(
-        "app.main.routes.join.app_config",
-        new=SimpleNamespace(
-            github=SimpleNamespace(
-                organisations=[
-                    SimpleNamespace(
-                        name="ministryofjustice",
-                        enabled=True,
-                        display_text="Ministry of Justice",
-                    )
-                ]
-            )
-        ),
+        "app.main.routes.join.organisation_registry",
+        new=OrganisationRegistry([
+            Organisation("ministryofjustice", True, "Ministry of Justice"),
+        ]),
     )
     def test_single_invitation_sent(self):
         with self.client.session_transaction() as sess:
-            sess["user"] = {"userinfo": {"email": "test@justice.gov.uk"}}
+            sess["verified_email"] = "test@justice.gov.uk"
             sess["org_selection"] = ["ministryofjustice"]
 
         response = self.client.get("/join/invitation-sent")
@@ -219,29 +338,56 @@ class TestInvitationSent(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.request.path, "/join/invitation-sent")
         self.assertIn("ministryofjustice", str(response.data))
+        self.assertNotIn("invitations-failed", str(response.data))
+
+    @patch(
+        "app.main.routes.join.organisation_registry",
+        new=OrganisationRegistry([
+            Organisation("ministryofjustice", True, "Ministry of Justice"),
+        ]),
+    )
+    def test_lists_the_organisations_not_invited(self):
+        with self.client.session_transaction() as sess:
+            sess["verified_email"] = "test@justice.gov.uk"
+            sess["org_selection"] = ["ministryofjustice"]
+            sess["failed_organisations"] = ["moj-analytical-services"]
+            sess["deferred_organisations"] = ["ministryofjustice-test"]
+
+        response = self.client.get("/join/invitation-sent")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("could not send your invitation to join moj-analytical-services", str(response.data))
+        self.assertIn('id="invitations-deferred"', str(response.data))
+        self.assertIn("ministryofjustice-test", str(response.data))
+        self.assertNotIn("invitation-status", str(response.data))
+
+    @patch(
+        "app.main.routes.join.organisation_registry",
+        new=OrganisationRegistry([
+            Organisation("ministryofjustice", True, "Ministry of Justice"),
+        ]),
+    )
+    def test_queued_invitation_polls_for_status(self):
+        with self.client.session_transaction() as sess:
+            sess["verified_email"] = "test@justice.gov.uk"
+            sess["org_selection"] = ["ministryofjustice"]
+            sess["invitation_job_id"] = "job-id"
+
+        response = self.client.get("/join/invitation-sent")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("/join/invitation-status/job-id", str(response.data))
 
     @patch(
-        "app.main.routes.join.app_config",
-        new=SimpleNamespace(
-            github=SimpleNamespace(
-                organisations=[
-                    SimpleNamespace(
-                        name="ministryofjustice",
-                        enabled=True,
-                        display_text="Ministry of Justice",
-                    ),
-                    SimpleNamespace(
-                        name="moj-analytical-services",
-                        enabled=True,
-                        display_text="MoJ Analytical Services",
-                    ),
-                ]
-            )
-        ),
+        "app.main.routes.join.organisation_registry",
+        new=OrganisationRegistry([
+            Organisation("ministryofjustice", True, "Ministry of Justice"),
+            Organisation("moj-analytical-services", True, "MoJ Analytical Services"),
+        ]),
     )
     def test_multiple_invitations_sent(self):
         with self.client.session_transaction() as sess:
-            sess["user"] = {"userinfo": {"email": "test@justice.gov.uk"}}
+            sess["verified_email"] = "test@justice.gov.uk"
             sess["org_selection"] = [
                 "ministryofjustice", "moj-analytical-services"]
 
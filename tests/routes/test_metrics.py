@@ -0,0 +1,60 @@
+import unittest
+from unittest.mock import MagicMock
+
+from prometheus_client import REGISTRY
+
+from app.app import create_app
+from app.main.services.github_service import GithubService
+
+
+def sample(name: str, labels: dict) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class TestMetricsRoute(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app(MagicMock(GithubService), True, False)
+        self.app.config["SECRET_KEY"] = "test_flask"
+        self.client = self.app.test_client()
+
+    def test_exposes_prometheus_metrics(self):
+        response = self.client.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith("text/plain"))
+        self.assertIn(b"join_github_request_duration_seconds", response.data)
+
+    def test_hidden_from_requests_through_the_ingress(self):
+        response = self.client.get("/metrics", headers={"X-Forwarded-For": "203.0.113.1"})
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_request_latency_is_recorded_per_endpoint(self):
+        labels = {"endpoint": "join_route.submit_email", "method": "GET", "status": "200"}
+        before = sample("join_github_request_duration_seconds_count", labels)
+
+        self.client.get("/join/submit-email")
+
+        self.assertEqual(sample("join_github_request_duration_seconds_count", labels), before + 1)
+
+    def test_unmatched_requests_share_one_label(self):
+        labels = {"endpoint": "unmatched", "method": "other", "status": "404"}
+        before = sample("join_github_request_duration_seconds_count", labels)
+
+        self.client.open("/does-not-exist", method="PROPFIND")
+
+        self.assertEqual(sample("join_github_request_duration_seconds_count", labels), before + 1)
+
+    def test_rate_limit_rejections_are_counted(self):
+        labels = {"endpoint": "join_route.submit_email"}
+        before = sample("join_github_rate_limit_rejections_total", labels)
+
+        # More than the default "10 per minute" in any window
+        statuses = [self.client.get("/join/submit-email").status_code for _ in range(11)]
+
+        self.assertIn(429, statuses)
+        self.assertEqual(sample("join_github_rate_limit_rejections_total", labels), before + statuses.count(429))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import brotli
+
+from app.main.services.asset_service import (
+    asset_url,
+    build_assets,
+    load_manifest,
+    precompressed_variants,
+)
+
+STATIC_FOLDER = os.path.join(os.path.dirname(__file__), "..", "..", "app", "static")
+
+
+class TestBuildAssets(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.static_folder = os.path.join(cls.directory.name, "static")
+        shutil.copytree(STATIC_FOLDER, cls.static_folder, ignore=shutil.ignore_patterns("dist"))
+        cls.manifest = build_assets(cls.static_folder)
+        cls.dist_folder = os.path.join(cls.static_folder, "dist")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.directory.cleanup()
+
+    def read(self, path: str) -> bytes:
+        with open(os.path.join(self.dist_folder, path), "rb") as asset:
+            return asset.read()
+
+    def test_writes_the_manifest(self):
+        self.assertEqual(load_manifest(self.static_folder), self.manifest)
+        with open(os.path.join(self.dist_folder, "manifest.json")) as manifest_file:
+            self.assertEqual(json.load(manifest_file), self.manifest)
+
+    def test_fingerprints_with_the_content_hash(self):
+        fingerprinted = self.manifest["javascript/govuk-frontend-5.1.0.min.js"]
+
+        self.assertRegex(fingerprinted, r"^javascript/govuk-frontend-5\.1\.0\.min\.[0-9a-f]{12}\.js$")
+        with open(os.path.join(self.static_folder, "javascript/govuk-frontend-5.1.0.min.js"), "rb") as original:
+            self.assertEqual(self.read(fingerprinted), original.read())
+
+    def test_files_requested_by_name_are_not_fingerprinted(self):
+        self.assertNotIn("robots.txt", self.manifest)
+        self.assertNotIn("manifest.json", self.manifest)
+
+    def test_stylesheet_references_are_fingerprinted(self):
+        stylesheet = self.read(self.manifest["stylesheets/govuk-frontend-5.1.0.min.css"]).decode()
+
+        self.assertIn(f"url({asset_url(self.manifest, 'fonts/bold-b542beb274-v2.woff2')})", stylesheet)
+        self.assertNotIn("url(/assets/fonts/", stylesheet)
+
+    def test_text_assets_have_compressed_variants(self):
+        fingerprinted = self.manifest["stylesheets/moj-frontend.min.css"]
+        content = self.read(fingerprinted)
+
+        self.assertEqual(gzip.decompress(self.read(fingerprinted + ".gz")), content)
+        self.assertEqual(brotli.decompress(self.read(fingerprinted + ".br")), content)
+        self.assertEqual(precompressed_variants(self.static_folder, self.manifest)[fingerprinted], ["br", "gzip"])
+
+    def test_binary_assets_are_not_compressed(self):
+        fingerprinted = self.manifest["fonts/bold-b542beb274-v2.woff2"]
+
+        self.assertEqual(precompressed_variants(self.static_folder, self.manifest)[fingerprinted], [])
+
+
+class TestAssetUrl(unittest.TestCase):
+    def test_uses_the_fingerprinted_url_when_built(self):
+        self.assertEqual(
+            asset_url({"stylesheets/a.css": "stylesheets/a.0123456789ab.css"}, "stylesheets/a.css"),
+            "/assets/dist/stylesheets/a.0123456789ab.css",
+        )
+
+    def test_falls_back_to_the_static_url(self):
+        self.assertEqual(asset_url({}, "stylesheets/a.css"), "/assets/stylesheets/a.css")
+
+    def test_manifest_is_empty_when_not_built(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertEqual(load_manifest(directory), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
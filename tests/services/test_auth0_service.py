@@ -0,0 +1,179 @@
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from authlib.jose import JsonWebKey, jwt
+from flask import Flask
+
+from app.main.services.auth0_service import (
+    Auth0_Service,
+    Auth0HttpSession,
+    OidcMetadataCache,
+)
+
+
+@patch(
+    "app.main.services.auth0_service.app_config",
+    new=SimpleNamespace(
+        http=SimpleNamespace(
+            timeouts=SimpleNamespace(auth0_metadata=(1, 2), auth0_token=(1, 5)),
+        )
+    ),
+)
+@patch("requests.Session.request")
+class TestAuth0HttpSession(unittest.TestCase):
+    def test_metadata_requests_use_metadata_timeout(self, mock_request):
+        session = Auth0HttpSession("client-id", "client-secret")
+
+        session.request("GET", "https://auth0.test/.well-known/openid-configuration", withhold_token=True)
+
+        self.assertEqual(mock_request.call_args.kwargs["timeout"], (1, 2))
+
+    def test_token_requests_use_token_timeout(self, mock_request):
+        session = Auth0HttpSession("client-id", "client-secret")
+
+        session.post("https://auth0.test/oauth/token", data={}, auth=("client-id", "client-secret"))
+
+        self.assertEqual(mock_request.call_args.kwargs["timeout"], (1, 5))
+
+
+def join_refresh_threads() -> None:
+    for thread in threading.enumerate():
+        if thread.name == "oidc-metadata-refresh":
+            thread.join()
+
+
+class TestOidcMetadataCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = 1000.0
+        self.fetch = MagicMock(side_effect=lambda: {"issuer": f"fetched at {self.now}"})
+        self.cache = OidcMetadataCache(self.fetch, ttl_seconds=60, max_stale_seconds=600, clock=lambda: self.now)
+
+    def test_first_read_fetches(self):
+        self.assertEqual(self.cache.get(), {"issuer": "fetched at 1000.0"})
+        self.fetch.assert_called_once()
+
+    def test_fresh_metadata_is_not_fetched_again(self):
+        self.cache.get()
+        self.now += 59
+
+        self.cache.get()
+
+        self.fetch.assert_called_once()
+
+    def test_stale_metadata_is_served_while_refreshing_in_the_background(self):
+        self.cache.get()
+        self.now += 120
+
+        with patch.object(self.cache, "refresh_in_background") as mock_refresh_in_background:
+            metadata = self.cache.get()
+
+        self.assertEqual(metadata, {"issuer": "fetched at 1000.0"})
+        mock_refresh_in_background.assert_called_once()
+        self.fetch.assert_called_once()
+
+    def test_background_refresh_replaces_the_metadata(self):
+        self.cache.get()
+        self.now += 120
+
+        self.cache.refresh_in_background()
+        join_refresh_threads()
+
+        self.assertEqual(self.cache.metadata, {"issuer": "fetched at 1120.0"})
+        self.assertEqual(self.cache.loaded_at, 1120.0)
+
+    def test_failed_background_refresh_keeps_the_stale_metadata(self):
+        self.cache.get()
+        self.now += 120
+        self.fetch.side_effect = ConnectionError("timed out")
+
+        self.cache.refresh_in_background()
+        join_refresh_threads()
+
+        self.assertEqual(self.cache.get(), {"issuer": "fetched at 1000.0"})
+
+    def test_metadata_past_the_stale_limit_is_fetched_before_use(self):
+        self.cache.get()
+        self.now += 661
+
+        self.assertEqual(self.cache.get(), {"issuer": "fetched at 1661.0"})
+        self.assertEqual(self.fetch.call_count, 2)
+
+
+@patch(
+    "app.main.services.auth0_service.app_config",
+    new=SimpleNamespace(
+        auth0=SimpleNamespace(metadata_ttl_seconds=3600, metadata_max_stale_seconds=86400),
+        http=SimpleNamespace(
+            timeouts=SimpleNamespace(auth0_metadata=(1, 2), auth0_token=(1, 5)),
+        ),
+    ),
+)
+class TestAuth0App(unittest.TestCase):
+    def setUp(self) -> None:
+        self.key = JsonWebKey.generate_key("RSA", 2048, is_private=True, options={"kid": "key-1"})
+        self.metadata = {
+            "issuer": "https://auth0.test/",
+            "authorization_endpoint": "https://auth0.test/authorize",
+            "token_endpoint": "https://auth0.test/oauth/token",
+            "jwks_uri": "https://auth0.test/.well-known/jwks.json",
+            "id_token_signing_alg_values_supported": ["RS256"],
+        }
+        self.jwks = {"keys": [self.key.as_dict(is_private=False)]}
+
+    def responses(self, method, url, **kwargs):
+        body = self.jwks if url.endswith("jwks.json") else self.metadata
+        return MagicMock(json=MagicMock(return_value=dict(body)))
+
+    def create_client(self):
+        return Auth0_Service(Flask(__name__), "client-id", "client-secret", "auth0.test").oauth.auth0
+
+    def test_metadata_and_jwks_are_fetched_together_once(self):
+        client = self.create_client()
+
+        with patch("requests.Session.request", side_effect=self.responses) as mock_request:
+            metadata = client.load_server_metadata()
+            client.load_server_metadata()
+            jwks = client.fetch_jwk_set()
+
+        self.assertEqual(metadata["issuer"], "https://auth0.test/")
+        self.assertEqual(jwks, self.jwks)
+        self.assertEqual(
+            [call.args[1] for call in mock_request.call_args_list],
+            [
+                "https://auth0.test/.well-known/openid-configuration",
+                "https://auth0.test/.well-known/jwks.json",
+            ],
+        )
+
+    def test_id_token_is_validated_from_cached_keys(self):
+        client = self.create_client()
+        with patch("requests.Session.request", side_effect=self.responses):
+            client.load_server_metadata()
+        now = int(time.time())
+        id_token = jwt.encode(
+            {"alg": "RS256", "kid": "key-1"},
+            {"iss": "https://auth0.test/", "aud": "client-id", "sub": "user", "iat": now, "exp": now + 300, "nonce": "n"},
+            self.key,
+        ).decode("utf-8")
+
+        with patch("requests.Session.request") as mock_request:
+            user = client.parse_id_token({"id_token": id_token, "access_token": "token"}, nonce="n")
+
+        self.assertEqual(user["sub"], "user")
+        mock_request.assert_not_called()
+
+    def test_prefetch_fetches_in_the_background(self):
+        service = Auth0_Service(Flask(__name__), "client-id", "client-secret", "auth0.test")
+
+        with patch("requests.Session.request", side_effect=self.responses):
+            service.prefetch_server_metadata()
+            join_refresh_threads()
+
+        self.assertEqual(service.oauth.auth0.metadata_cache.metadata["jwks"], self.jwks)
+
+
+if __name__ == "__main__":
+    unittest.main(argv=["first-arg-is-ignored"], exit=False)
@@ -0,0 +1,110 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from freezegun import freeze_time
+
+from app.main.services.github_rate_limit_service import (
+    INVITATION_WINDOW_SECONDS,
+    GithubRateLimitScheduler,
+)
+
+
+def response(status_code: int = 201, headers: dict | None = None, text: str = "{}"):
+    return MagicMock(status_code=status_code, headers=headers or {}, text=text)
+
+
+class TestGithubRateLimitScheduler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.frozen_time = freeze_time("2024-01-01 12:00:00")
+        self.clock = self.frozen_time.start()
+        self.addCleanup(self.frozen_time.stop)
+        self.scheduler = self.create_scheduler()
+
+    def create_scheduler(self, storage_uri: str = "memory://", requests_per_minute: int = 600):
+        return GithubRateLimitScheduler(
+            requests_per_minute=requests_per_minute,
+            daily_invitation_limit=2,
+            max_wait_seconds=0,
+            low_quota_threshold=2,
+            storage_uri=storage_uri,
+            # Looked up once time is frozen; the default was bound at import
+            clock=time.time,
+        )
+
+    def now(self) -> float:
+        return self.clock().timestamp()
+
+    def test_acquires_when_budget_is_unknown(self):
+        self.assertTrue(self.scheduler.acquire("test1"))
+
+    def test_defers_when_primary_budget_is_exhausted(self):
+        self.scheduler.record_response("test1", response(headers={
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(self.now() + 60),
+        }))
+
+        self.assertFalse(self.scheduler.acquire("test1"))
+
+    def test_primary_budget_is_restored_after_reset(self):
+        self.scheduler.record_response("test1", response(headers={
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(self.now() + 60),
+        }))
+
+        self.clock.tick(61)
+
+        self.assertTrue(self.scheduler.acquire("test1"))
+
+    def test_defers_while_retry_after_is_in_effect(self):
+        self.scheduler.record_response("test1", response(403, {"Retry-After": "30"}))
+
+        self.assertFalse(self.scheduler.acquire("test2"))
+        self.clock.tick(31)
+        self.assertTrue(self.scheduler.acquire("test2"))
+
+    def test_paces_bursts_of_calls(self):
+        scheduler = self.create_scheduler(requests_per_minute=12)
+
+        self.assertEqual([scheduler.acquire("test1") for _ in range(3)], [True, True, False])
+
+    def test_defers_once_daily_invitation_limit_is_used(self):
+        self.scheduler.record_response("test1", response())
+        self.scheduler.record_response("test1", response())
+
+        self.assertFalse(self.scheduler.acquire("test1"))
+        self.assertTrue(self.scheduler.acquire("test2"))
+
+        self.clock.tick(2 * INVITATION_WINDOW_SECONDS)
+        self.assertTrue(self.scheduler.acquire("test1"))
+
+    def test_blocks_organisation_when_github_reports_invitation_limit(self):
+        self.scheduler.record_response("test1", response(422, text="Over invitation rate limit"))
+
+        self.assertFalse(self.scheduler.acquire("test1"))
+
+    def test_quota_is_low_when_invitations_run_out(self):
+        self.assertFalse(self.scheduler.get_quota(["test1"]).is_low)
+
+        self.scheduler.record_response("test1", response())
+
+        quota = self.scheduler.get_quota(["test1"])
+        self.assertTrue(quota.is_low)
+        self.assertEqual(quota.remaining_invitations, {"test1": 1})
+
+    def test_workers_share_the_budget_through_the_storage(self):
+        with tempfile.TemporaryDirectory() as directory:
+            storage_uri = f"sqlite:///{os.path.join(directory, 'rate-limits.db')}"
+            workers = [self.create_scheduler(storage_uri), self.create_scheduler(storage_uri)]
+
+            workers[0].record_response("test1", response())
+            workers[1].record_response("test1", response())
+
+            self.assertFalse(workers[0].acquire("test1"))
+            self.assertEqual(workers[1].get_quota(["test1"]).remaining_invitations, {"test1": 0})
+
+
+if __name__ == "__main__":
+    unittest.main(argv=["first-arg-is-ignored"], exit=False)
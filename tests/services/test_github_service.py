@@ -1,8 +1,22 @@
 import os
 import unittest
-from unittest.mock import call, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, call, patch
 
-from app.main.services.github_service import GithubService
+import requests
+from prometheus_client import REGISTRY
+from sentry_sdk.tracing import Transaction
+
+from app.main.services.github_service import (
+    GithubService,
+    InvitationResult,
+    InvitationStatus,
+)
+from app.main.services.organisation_registry import (
+    Organisation,
+    OrganisationRegistry,
+)
+from benchmarks.fake_github import FakeGithubServer
 
 
 @patch("github.Github.__new__")
@@ -27,6 +41,17 @@ class TestGithubServiceInit(unittest.TestCase):
             ]
         )
 
+    def test_builds_the_pygithub_client_when_first_used(
+        self, mock_github_client_rest_api, mock_github_client_core_api
+    ):
+        github_service = GithubService("")
+        mock_github_client_core_api.assert_not_called()
+
+        github_service.github_client_core_api
+        github_service.github_client_core_api
+
+        mock_github_client_core_api.assert_called_once()
+
 
 @patch("github.Github.__new__")
 class TestGithubServiceInvites(unittest.TestCase):
@@ -40,17 +65,271 @@ class TestGithubServiceInvites(unittest.TestCase):
         github_service = GithubService("test")
         github_service.github_client_rest_api = mock_github_client_rest_api
 
-        self.assertEqual(github_service.send_invites_to_user_email(
-            self.valid_email, self.valid_orgs), None)
+        self.assertEqual(
+            github_service.send_invites_to_user_email(self.valid_email, self.valid_orgs),
+            [
+                InvitationResult("test1", InvitationStatus.SKIPPED_DISABLED),
+                InvitationResult("test2", InvitationStatus.SKIPPED_DISABLED),
+            ],
+        )
 
-    @patch.dict(os.environ, {"SEND_EMAIL_INVITES": "True"}, clear=True)
-    def test_send_email_invites_on(self, mock_github_client_rest_api):
+    @patch("app.main.services.github_service.app_config.github.send_email_invites_is_enabled", True)
+    @patch(
+        "app.main.services.github_service.organisation_registry",
+        new=OrganisationRegistry([Organisation("test1", True, "Test 1"), Organisation("test2", True, "Test 2")]),
+    )
+    def test_send_email_invites_on(self, mock_github_client_core_api):
         github_service = GithubService("test")
-        github_service.github_client_rest_api = mock_github_client_rest_api
+        github_service.github_client_rest_api = MagicMock()
+        github_service.github_client_rest_api.post.return_value = MagicMock(status_code=201, text="{}", headers={})
 
         github_service.send_invites_to_user_email(
             self.valid_email, self.valid_orgs)
-        mock_github_client_rest_api.assert_called()
+        self.assertEqual(github_service.github_client_rest_api.post.call_count, 2)
+
+
+@patch(
+    "app.main.services.github_service.app_config",
+    new=SimpleNamespace(
+        github=SimpleNamespace(
+            api_base_url="https://api.github.com",
+            send_email_invites_is_enabled=True,
+            invite_max_workers=2,
+            rate_limit=SimpleNamespace(
+                requests_per_minute=600,
+                daily_invitation_limit=500,
+                max_wait_seconds=0,
+                low_quota_threshold=10,
+            ),
+        ),
+        http=SimpleNamespace(
+            timeouts=SimpleNamespace(github_invite=(1, 2), readiness_check=(1, 3)),
+        ),
+        rate_limit=SimpleNamespace(storage_uri="memory://"),
+    ),
+)
+@patch(
+    "app.main.services.github_service.organisation_registry",
+    new=OrganisationRegistry([
+        Organisation("test1", True, "Test 1"),
+        Organisation("test2", True, "Test 2"),
+        Organisation("test3", False, "Test 3"),
+    ]),
+)
+class TestGithubServiceInvitationResults(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.github_service = GithubService("test")
+        self.github_service.github_client_rest_api = MagicMock()
+        self.post = self.github_service.github_client_rest_api.post
+        self.post.return_value = MagicMock(status_code=201, text="{}")
+
+    def test_returns_sent_for_each_organisation(self):
+        results = self.github_service.send_invites_to_user_email(
+            "test@test.com", ["test1", "test2"])
+
+        self.assertEqual(results, [
+            InvitationResult("test1", InvitationStatus.SENT),
+            InvitationResult("test2", InvitationStatus.SENT),
+        ])
+        self.assertEqual(self.post.call_count, 2)
+
+    def test_makes_a_single_post_per_organisation(self):
+        self.github_service.send_invites_to_user_email("test@test.com", ["test1"])
+
+        self.post.assert_called_once_with(
+            "https://api.github.com/orgs/test1/invitations",
+            json={"email": "test@test.com", "role": "direct_member"},
+            timeout=(1, 2),
+        )
+
+    def test_skips_disabled_organisation(self):
+        results = self.github_service.send_invites_to_user_email(
+            "test@test.com", ["test3"])
+
+        self.assertEqual(results, [
+            InvitationResult("test3", InvitationStatus.SKIPPED_DISABLED),
+        ])
+        self.post.assert_not_called()
+
+    def test_maps_already_a_member_error(self):
+        self.post.return_value = MagicMock(
+            status_code=422,
+            text='{"message": "Validation Failed", "errors": [{"message": "A user with this email address is already a part of this organization"}]}',
+        )
+
+        results = self.github_service.send_invites_to_user_email(
+            "test@test.com", ["test1"])
+
+        self.assertEqual(results, [
+            InvitationResult("test1", InvitationStatus.ALREADY_MEMBER),
+        ])
+
+    def test_maps_other_errors_to_failed(self):
+        self.post.return_value = MagicMock(status_code=404, text='{"message": "Not Found"}')
+
+        results = self.github_service.send_invites_to_user_email(
+            "test@test.com", ["test1"])
+
+        self.assertEqual(results, [
+            InvitationResult("test1", InvitationStatus.FAILED, '404 {"message": "Not Found"}'),
+        ])
+
+    def test_maps_secondary_rate_limit_to_rate_limited(self):
+        self.post.return_value = MagicMock(
+            status_code=403,
+            headers={"Retry-After": "60"},
+            text='{"message": "You have exceeded a secondary rate limit"}',
+        )
+
+        results = self.github_service.send_invites_to_user_email(
+            "test@test.com", ["test1"])
+
+        self.assertEqual(results[0].status, InvitationStatus.RATE_LIMITED)
+
+    def test_defers_invite_when_scheduler_has_no_budget(self):
+        self.github_service.rate_limit_scheduler = MagicMock()
+        self.github_service.rate_limit_scheduler.acquire.return_value = False
+
+        results = self.github_service.send_invites_to_user_email(
+            "test@test.com", ["test1"])
+
+        self.assertEqual(results[0].status, InvitationStatus.RATE_LIMITED)
+        self.post.assert_not_called()
+
+    def test_one_failure_does_not_abort_other_organisations(self):
+        # Keyed on the organisation, as the invitations may be sent concurrently
+        def post(url, **kwargs):
+            if "/orgs/test1/" in url:
+                raise requests.ConnectionError("Connection reset")
+            return MagicMock(status_code=201, text="{}")
+
+        self.post.side_effect = post
+
+        results = self.github_service.send_invites_to_user_email(
+            "test@test.com", ["test1", "test2"])
+
+        self.assertEqual(
+            [result.status for result in results],
+            [InvitationStatus.FAILED, InvitationStatus.SENT],
+        )
+
+    def test_reads_the_remaining_core_rate_limit(self):
+        get = self.github_service.github_client_rest_api.get
+        get.return_value.json.return_value = {"resources": {"core": {"remaining": 4321}}}
+
+        self.assertEqual(self.github_service.get_rate_limit_remaining(), 4321)
+        get.assert_called_once_with("https://api.github.com/rate_limit", timeout=(1, 3))
+
+    def test_rejected_token_raises(self):
+        get = self.github_service.github_client_rest_api.get
+        get.return_value.raise_for_status.side_effect = requests.HTTPError("401 Bad credentials")
+
+        self.assertRaises(requests.HTTPError, self.github_service.get_rate_limit_remaining)
+
+    def test_rest_session_does_not_store_cookies(self):
+        github_service = GithubService("test")
+
+        policy = github_service.github_client_rest_api.cookies.get_policy()
+
+        self.assertEqual(policy.allowed_domains(), ())
+
+
+class TestGithubServiceAgainstFakeGithub(unittest.TestCase):
+
+    def start_fake_github(self, **faults) -> None:
+        fake_github = FakeGithubServer(seed=0, **faults)
+        fake_github.__enter__()
+        self.addCleanup(fake_github.__exit__)
+
+        config = SimpleNamespace(
+            github=SimpleNamespace(
+                api_base_url=fake_github.url,
+                send_email_invites_is_enabled=True,
+                invite_max_workers=2,
+                rate_limit=SimpleNamespace(
+                    requests_per_minute=600,
+                    daily_invitation_limit=500,
+                    max_wait_seconds=0,
+                    low_quota_threshold=10,
+                ),
+            ),
+            http=SimpleNamespace(
+                timeouts=SimpleNamespace(github_invite=(1, 2), readiness_check=(1, 3)),
+            ),
+            rate_limit=SimpleNamespace(storage_uri="memory://"),
+        )
+        for target, new in (
+            ("app.main.services.github_service.app_config", config),
+            ("app.main.services.github_service.organisation_registry",
+             OrganisationRegistry([Organisation("test1", True, "Test 1")])),
+        ):
+            patcher = patch(target, new)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.github_service = GithubService("test")
+
+    def invitation_status(self) -> InvitationStatus:
+        return self.github_service.send_invites_to_user_email("test@test.com", ["test1"])[0].status
+
+    def test_sends_invitations_to_the_configured_base_url(self):
+        self.start_fake_github()
+
+        self.assertEqual(self.invitation_status(), InvitationStatus.SENT)
+        self.assertEqual(self.github_service.get_rate_limit_remaining(), 4999)
+
+    def test_records_outcomes_and_call_latency(self):
+        self.start_fake_github(already_member_rate=1)
+        invitations = {"outcome": "already_member"}
+        latency = {"service": "github", "operation": "create_invitation"}
+        invitations_before = REGISTRY.get_sample_value("join_github_invitations_total", invitations) or 0
+        latency_before = REGISTRY.get_sample_value("join_github_outbound_request_duration_seconds_count", latency) or 0
+
+        self.invitation_status()
+
+        self.assertEqual(REGISTRY.get_sample_value("join_github_invitations_total", invitations), invitations_before + 1)
+        self.assertEqual(
+            REGISTRY.get_sample_value("join_github_outbound_request_duration_seconds_count", latency),
+            latency_before + 1,
+        )
+
+    def test_traces_each_invitation_under_the_request(self):
+        self.start_fake_github()
+        transaction = Transaction(name="join_route.send_invitation", sampled=True)
+        transaction.init_span_recorder(maxlen=100)
+
+        with patch("app.main.services.github_service.sentry_sdk.get_current_span", return_value=transaction):
+            self.invitation_status()
+
+        invitation, http_call = sorted(transaction._span_recorder.spans, key=lambda span: span.start_timestamp)
+        self.assertEqual((invitation.op, invitation.description), ("github.invitation", "test1"))
+        self.assertEqual(invitation.parent_span_id, transaction.span_id)
+        self.assertEqual(invitation._data["outcome"], "sent")
+        self.assertEqual((http_call.op, http_call.description), ("http.client", "github create_invitation"))
+        self.assertEqual(http_call.parent_span_id, invitation.span_id)
+        self.assertIsNotNone(http_call.timestamp)
+
+    def test_already_a_member(self):
+        self.start_fake_github(already_member_rate=1)
+
+        self.assertEqual(self.invitation_status(), InvitationStatus.ALREADY_MEMBER)
+
+    def test_secondary_rate_limit(self):
+        self.start_fake_github(secondary_rate_limit_rate=1)
+
+        self.assertEqual(self.invitation_status(), InvitationStatus.RATE_LIMITED)
+        self.assertTrue(self.github_service.get_invitation_quota().is_low)
+
+    def test_server_error(self):
+        self.start_fake_github(server_error_rate=1)
+
+        self.assertEqual(self.invitation_status(), InvitationStatus.FAILED)
+
+    def test_primary_rate_limit(self):
+        self.start_fake_github(rate_limit=1)
+
+        self.assertEqual(self.invitation_status(), InvitationStatus.SENT)
+        self.assertEqual(self.invitation_status(), InvitationStatus.RATE_LIMITED)
 
 
 if __name__ == "__main__":
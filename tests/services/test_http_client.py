@@ -0,0 +1,94 @@
+import multiprocessing
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import requests
+
+from app.main.services import http_client
+from app.main.services.http_client import create_http_session, prewarm_connections
+from tests.stubs.http_stub_server import HttpStubServer, StubResponse
+
+TEST_HTTP_CONFIG = SimpleNamespace(
+    http=SimpleNamespace(
+        pool_connections=1,
+        pool_maxsize=2,
+        max_retries=2,
+        backoff_factor=0,
+        backoff_jitter=0,
+        backoff_max=0,
+        timeouts=SimpleNamespace(prewarm=(1, 1)),
+    )
+)
+
+
+@patch("app.main.services.http_client.app_config", new=TEST_HTTP_CONFIG)
+class TestHttpClient(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = patch.object(http_client, "shared_http_adapter", http_client.SharedHTTPAdapter())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.stub = HttpStubServer().__enter__()
+        self.addCleanup(self.stub.__exit__)
+
+    def test_retries_idempotent_requests_on_server_errors(self):
+        self.stub.queue("/resource", StubResponse(503), StubResponse(200))
+
+        response = create_http_session().get(f"{self.stub.url}/resource", timeout=1)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.stub.requests), 2)
+
+    def test_does_not_retry_non_idempotent_requests_on_server_errors(self):
+        self.stub.queue("/resource", StubResponse(503), StubResponse(201))
+
+        response = create_http_session().post(f"{self.stub.url}/resource", json={}, timeout=1)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(self.stub.requests), 1)
+
+    def test_read_timeout_is_enforced(self):
+        self.stub.queue("/slow", StubResponse(200, delay=0.5))
+
+        with self.assertRaises(requests.exceptions.ReadTimeout):
+            create_http_session().post(f"{self.stub.url}/slow", timeout=(1, 0.1))
+
+    def test_connections_are_kept_alive_across_sessions(self):
+        self.stub.queue("/resource", StubResponse(200))
+
+        for _ in range(3):
+            with create_http_session() as session:
+                session.get(f"{self.stub.url}/resource", timeout=1)
+
+        client_ports = {port for _, _, port in self.stub.requests}
+        self.assertEqual(len(self.stub.requests), 3)
+        self.assertEqual(len(client_ports), 1)
+
+    def test_prewarmed_connection_is_reused(self):
+        self.stub.queue("/", StubResponse(200))
+        self.stub.queue("/resource", StubResponse(200))
+
+        prewarm_connections([f"{self.stub.url}/"])
+        create_http_session().get(f"{self.stub.url}/resource", timeout=1)
+
+        self.assertEqual(self.stub.requests[0][0], "HEAD")
+        self.assertEqual(len({port for _, _, port in self.stub.requests}), 1)
+
+    def test_forked_process_does_not_reuse_inherited_connections(self):
+        self.stub.queue("/resource", StubResponse(200))
+        session = create_http_session()
+        session.get(f"{self.stub.url}/resource", timeout=1)
+
+        context = multiprocessing.get_context("fork")
+        process = context.Process(target=session.get, args=(f"{self.stub.url}/resource",), kwargs={"timeout": 1})
+        process.start()
+        process.join()
+        session.get(f"{self.stub.url}/resource", timeout=1)
+
+        parent_port, child_port, parent_port_again = [port for _, _, port in self.stub.requests]
+        self.assertNotEqual(parent_port, child_port)
+        self.assertEqual(parent_port, parent_port_again)
+
+
+if __name__ == "__main__":
+    unittest.main(argv=["first-arg-is-ignored"], exit=False)
@@ -0,0 +1,151 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from app.main.services.github_service import (
+    GithubService,
+    InvitationResult,
+    InvitationStatus,
+)
+from app.main.services.invitation_outbox_service import (
+    InvitationJobStatus,
+    InvitationOutbox,
+    InvitationOutboxWorker,
+)
+
+
+class TestInvitationOutbox(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.database_path = os.path.join(self.directory.name, "outbox.db")
+        self.outbox = InvitationOutbox(self.database_path, max_attempts=2, backoff_seconds=0)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_enqueued_job_is_pending(self):
+        job_id = self.outbox.enqueue("test@justice.gov.uk", ["ministryofjustice"])
+
+        self.assertEqual(self.outbox.get_status(job_id), {
+            "status": "pending",
+            "organisations": {"ministryofjustice": "pending"},
+        })
+
+    def test_unknown_job_has_no_status(self):
+        self.assertIsNone(self.outbox.get_status("unknown"))
+
+    def test_forked_process_uses_its_own_connection(self):
+        context = multiprocessing.get_context("fork")
+        process = context.Process(
+            target=self.outbox.enqueue, args=("test@justice.gov.uk", ["ministryofjustice"])
+        )
+        process.start()
+        process.join()
+
+        self.assertEqual(process.exitcode, 0)
+        self.assertIsNotNone(self.outbox.claim_next())
+
+    def test_job_is_durable_across_outbox_instances(self):
+        job_id = self.outbox.enqueue("test@justice.gov.uk", ["ministryofjustice"])
+
+        job = InvitationOutbox(self.database_path).claim_next()
+
+        self.assertEqual(job["id"], job_id)
+        self.assertEqual(job["email"], "test@justice.gov.uk")
+        self.assertEqual(job["attempts"], 1)
+
+    def test_claimed_job_is_not_claimed_twice(self):
+        self.outbox.enqueue("test@justice.gov.uk", ["ministryofjustice"])
+
+        self.assertIsNotNone(self.outbox.claim_next())
+        self.assertIsNone(self.outbox.claim_next())
+
+    def test_job_with_expired_lease_is_claimed_again(self):
+        outbox = InvitationOutbox(self.database_path, lease_seconds=0)
+        job_id = outbox.enqueue("test@justice.gov.uk", ["ministryofjustice"])
+        outbox.claim_next()
+
+        job = outbox.claim_next()
+
+        self.assertEqual(job["id"], job_id)
+        self.assertEqual(job["attempts"], 2)
+
+    def test_only_failed_organisations_are_retried(self):
+        job_id = self.outbox.enqueue("test@justice.gov.uk", ["ministryofjustice", "moj-analytical-services"])
+        job = self.outbox.claim_next()
+
+        status = self.outbox.record_attempt(job, {
+            "ministryofjustice": InvitationStatus.SENT.value,
+            "moj-analytical-services": InvitationStatus.FAILED.value,
+        }, "moj-analytical-services: Server Error")
+
+        self.assertEqual(status, InvitationJobStatus.PENDING)
+        self.assertEqual(self.outbox.claim_next()["pending_organisations"], ["moj-analytical-services"])
+        self.assertEqual(self.outbox.get_status(job_id)["organisations"]["ministryofjustice"], "sent")
+
+    def test_job_fails_after_max_attempts(self):
+        job_id = self.outbox.enqueue("test@justice.gov.uk", ["ministryofjustice"])
+        failure = {"ministryofjustice": InvitationStatus.FAILED.value}
+
+        self.outbox.record_attempt(self.outbox.claim_next(), failure)
+        status = self.outbox.record_attempt(self.outbox.claim_next(), failure)
+
+        self.assertEqual(status, InvitationJobStatus.FAILED)
+        self.assertEqual(self.outbox.get_status(job_id)["status"], "failed")
+        self.assertIsNone(self.outbox.claim_next())
+
+    def test_rate_limited_attempts_do_not_count_towards_max_attempts(self):
+        job_id = self.outbox.enqueue("test@justice.gov.uk", ["ministryofjustice"])
+        rate_limited = {"ministryofjustice": InvitationStatus.RATE_LIMITED.value}
+
+        self.outbox.record_attempt(self.outbox.claim_next(), rate_limited)
+        status = self.outbox.record_attempt(
+            {**self.outbox.get_status(job_id), "id": job_id, "pending_organisations": ["ministryofjustice"],
+             "results": rate_limited, "attempts": 2},
+            rate_limited,
+        )
+
+        self.assertEqual(status, InvitationJobStatus.PENDING)
+
+
+class TestInvitationOutboxWorker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.outbox = InvitationOutbox(os.path.join(self.directory.name, "outbox.db"), backoff_seconds=0)
+        self.github_service = MagicMock(GithubService)
+        self.worker = InvitationOutboxWorker(self.outbox, self.github_service)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_returns_false_when_queue_is_empty(self):
+        self.assertFalse(self.worker.run_once())
+
+    def test_sends_invites_and_completes_job(self):
+        job_id = self.outbox.enqueue("test@justice.gov.uk", ["ministryofjustice"])
+        self.github_service.send_invites_to_user_email.return_value = [
+            InvitationResult("ministryofjustice", InvitationStatus.SENT)
+        ]
+
+        self.assertTrue(self.worker.run_once())
+
+        self.github_service.send_invites_to_user_email.assert_called_once_with(
+            "test@justice.gov.uk", ["ministryofjustice"])
+        self.assertEqual(self.outbox.get_status(job_id), {
+            "status": "completed",
+            "organisations": {"ministryofjustice": "sent"},
+        })
+
+    def test_reschedules_job_when_service_raises(self):
+        job_id = self.outbox.enqueue("test@justice.gov.uk", ["ministryofjustice"])
+        self.github_service.send_invites_to_user_email.side_effect = Exception("Connection reset")
+
+        self.worker.run_once()
+
+        self.assertEqual(self.outbox.get_status(job_id)["status"], "pending")
+
+
+if __name__ == "__main__":
+    unittest.main(argv=["first-arg-is-ignored"], exit=False)
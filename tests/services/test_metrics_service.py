@@ -0,0 +1,55 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from app.main.services.metrics_service import MULTIPROCESS_DIR_ENV, render_metrics
+
+
+def record_invitations(count: int) -> None:
+    from app.main.services.metrics_service import INVITATIONS, REQUEST_LATENCY
+
+    for _ in range(count):
+        INVITATIONS.labels("sent").inc()
+        REQUEST_LATENCY.labels("join_route.send_invitation", "GET", "302").observe(0.2)
+
+
+class TestMultiprocessMetrics(unittest.TestCase):
+    def test_samples_are_added_up_across_processes(self):
+        with tempfile.TemporaryDirectory() as directory, patch.dict(os.environ, {MULTIPROCESS_DIR_ENV: directory}):
+            # Spawned processes import prometheus_client afresh, with the directory set
+            context = multiprocessing.get_context("spawn")
+            processes = [context.Process(target=record_invitations, args=(count,)) for count in (2, 3)]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+
+            body, content_type = render_metrics()
+
+        self.assertTrue(content_type.startswith("text/plain"))
+        self.assertIn(b'join_github_invitations_total{outcome="sent"} 5.0', body)
+        self.assertIn(
+            b'join_github_request_duration_seconds_count{endpoint="join_route.send_invitation",method="GET",status="302"} 5.0',
+            body,
+        )
+
+    def test_app_is_created_before_the_directory_exists(self):
+        with tempfile.TemporaryDirectory() as directory:
+            environ = os.environ | {MULTIPROCESS_DIR_ENV: os.path.join(directory, "not-created-yet")}
+
+            completed = subprocess.run(
+                [sys.executable, "-c", "import app.run; app.run.app()"],
+                capture_output=True,
+                text=True,
+                env=environ,
+            )
+
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
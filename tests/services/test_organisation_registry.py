@@ -0,0 +1,124 @@
+import json
+import os
+import tempfile
+import unittest
+
+from app.main.services.organisation_registry import (
+    Organisation,
+    OrganisationRegistry,
+)
+
+ORGANISATIONS = [
+    Organisation("ministryofjustice", True, "Ministry of Justice"),
+    Organisation("moj-analytical-services", True, "MoJ Analytical Services"),
+    Organisation("ministryofjustice-test", False, "Ministry of Justice Test Organisation"),
+]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestOrganisationRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.registry = OrganisationRegistry(ORGANISATIONS)
+
+    def test_looks_up_organisations_by_name(self):
+        self.assertEqual(self.registry.get("ministryofjustice"), ORGANISATIONS[0])
+        self.assertIsNone(self.registry.get("unknown"))
+
+    def test_enabled_names_exclude_disabled_organisations(self):
+        self.assertEqual(self.registry.enabled_names, {"ministryofjustice", "moj-analytical-services"})
+        self.assertEqual(
+            self.registry.snapshot.enabled_names_in_order, ("ministryofjustice", "moj-analytical-services")
+        )
+
+    def test_checkbox_items_disable_analytical_services_for_digital_justice_users(self):
+        items = self.registry.checkbox_items(is_digital_justice_user=True)
+
+        self.assertEqual([item["value"] for item in items], ["ministryofjustice", "moj-analytical-services"])
+        self.assertEqual([item["disabled"] for item in items], [False, True])
+        self.assertEqual([item["disabled"] for item in self.registry.checkbox_items(False)], [False, False])
+
+    def test_checkbox_items_are_read_only(self):
+        with self.assertRaises(TypeError):
+            self.registry.checkbox_items(False)[0]["disabled"] = True
+
+    def test_version_changes_with_the_organisations(self):
+        self.assertEqual(self.registry.version, OrganisationRegistry(list(ORGANISATIONS)).version)
+        self.assertNotEqual(self.registry.version, OrganisationRegistry(ORGANISATIONS[:2]).version)
+
+
+class TestOrganisationRegistryReload(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "organisations.json")
+        self.clock = FakeClock()
+
+    def write(self, contents: str) -> None:
+        # Replace the file the way a ConfigMap update swaps it in
+        with open(self.path + ".new", "w") as organisations_file:
+            organisations_file.write(contents)
+        os.replace(self.path + ".new", self.path)
+
+    def write_organisations(self, *organisations: tuple[str, bool]) -> None:
+        self.write(json.dumps({
+            "organisations": [
+                {"name": name, "enabled": enabled, "display_text": name.title()}
+                for name, enabled in organisations
+            ]
+        }))
+
+    def registry(self) -> OrganisationRegistry:
+        return OrganisationRegistry(ORGANISATIONS, self.path, reload_interval_seconds=10, clock=self.clock)
+
+    def test_file_replaces_the_built_in_organisations(self):
+        self.write_organisations(("ministryofjustice", False), ("moj-analytical-services", True))
+
+        registry = self.registry()
+
+        self.assertEqual(registry.enabled_names, {"moj-analytical-services"})
+
+    def test_changed_file_is_reloaded_after_the_interval(self):
+        self.write_organisations(("ministryofjustice", True))
+        registry = self.registry()
+        version = registry.version
+
+        self.write_organisations(("ministryofjustice", False), ("moj-analytical-services", True))
+        self.assertEqual(registry.enabled_names, {"ministryofjustice"})
+
+        self.clock.now = 10
+        self.assertEqual(registry.enabled_names, {"moj-analytical-services"})
+        self.assertNotEqual(registry.version, version)
+
+    def test_invalid_file_keeps_the_last_good_organisations(self):
+        self.write_organisations(("ministryofjustice", True))
+        registry = self.registry()
+
+        self.write("{ not json")
+        self.clock.now = 10
+
+        with self.assertLogs("app.main.services.organisation_registry", level="ERROR"):
+            self.assertEqual(registry.enabled_names, {"ministryofjustice"})
+
+    def test_missing_file_keeps_the_built_in_organisations(self):
+        with self.assertLogs("app.main.services.organisation_registry", level="WARNING"):
+            registry = self.registry()
+            self.assertEqual(registry.enabled_names, {"ministryofjustice", "moj-analytical-services"})
+
+    def test_warns_when_the_organisation_flags_are_also_set(self):
+        self.write_organisations(("ministryofjustice", True))
+
+        with self.assertLogs("app.main.services.organisation_registry", level="WARNING") as logs:
+            OrganisationRegistry(ORGANISATIONS, self.path, organisation_flags_set=True)
+
+        self.assertIn("MOJ_*_ORG_ENABLED", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,260 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+from flask import Flask
+from freezegun import freeze_time
+from limits import parse
+from limits.errors import ConfigurationError
+from limits.storage import storage_from_string
+from limits.strategies import (
+    FixedWindowRateLimiter,
+    MovingWindowRateLimiter,
+    SlidingWindowCounterRateLimiter,
+)
+
+from app.app import create_app
+from app.main.config.limiter_config import configure_limiter
+from app.main.services.github_service import GithubService
+from app.main.services.rate_limit_storage import CountMinSketchStorage, SQLiteStorage
+
+
+def hit_from_another_process(uri: str, limit: str, key: str, queue) -> None:
+    limiter = MovingWindowRateLimiter(storage_from_string(uri))
+    queue.put(limiter.hit(parse(limit), key))
+
+
+class TestSQLiteStorage(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.uri = f"sqlite:///{os.path.join(self.directory.name, 'rate-limits.db')}"
+        self.storage = storage_from_string(self.uri)
+        self.other_storage = storage_from_string(self.uri)
+        self.limit = parse("3 per minute")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_sqlite_scheme_is_registered(self):
+        self.assertIsInstance(self.storage, SQLiteStorage)
+        self.assertTrue(self.storage.check())
+
+    def test_uri_without_a_path_is_rejected(self):
+        self.assertRaises(ConfigurationError, storage_from_string, "sqlite://")
+
+    def test_fixed_window_counters_are_shared(self):
+        limiter = FixedWindowRateLimiter(self.storage)
+        other_limiter = FixedWindowRateLimiter(self.other_storage)
+
+        hits = [limiter.hit(self.limit, "ip"), other_limiter.hit(self.limit, "ip"),
+                limiter.hit(self.limit, "ip"), other_limiter.hit(self.limit, "ip")]
+
+        self.assertEqual(hits, [True, True, True, False])
+
+    def test_moving_window_entries_are_shared(self):
+        limiter = MovingWindowRateLimiter(self.storage)
+        other_limiter = MovingWindowRateLimiter(self.other_storage)
+
+        hits = [limiter.hit(self.limit, "ip"), other_limiter.hit(self.limit, "ip"),
+                limiter.hit(self.limit, "ip"), other_limiter.hit(self.limit, "ip")]
+
+        self.assertEqual(hits, [True, True, True, False])
+        self.assertEqual(other_limiter.get_window_stats(self.limit, "ip").remaining, 0)
+
+    def test_sliding_window_counters_are_shared(self):
+        limiter = SlidingWindowCounterRateLimiter(self.storage)
+        other_limiter = SlidingWindowCounterRateLimiter(self.other_storage)
+
+        hits = [limiter.hit(self.limit, "ip"), other_limiter.hit(self.limit, "ip"),
+                limiter.hit(self.limit, "ip"), other_limiter.hit(self.limit, "ip")]
+
+        self.assertEqual(hits, [True, True, True, False])
+
+    def test_keys_are_limited_independently(self):
+        limiter = MovingWindowRateLimiter(self.storage)
+        for _ in range(3):
+            limiter.hit(self.limit, "ip")
+
+        self.assertTrue(limiter.hit(self.limit, "another-ip"))
+
+    def test_clear_resets_a_key(self):
+        limiter = MovingWindowRateLimiter(self.storage)
+        for _ in range(3):
+            limiter.hit(self.limit, "ip")
+
+        limiter.clear(self.limit, "ip")
+
+        self.assertTrue(limiter.hit(self.limit, "ip"))
+
+    def test_counter_expires(self):
+        with patch("app.main.services.rate_limit_storage.time.time", return_value=1000.0):
+            self.assertEqual(self.storage.incr("key", 10), 1)
+            self.assertEqual(self.storage.incr("key", 10), 2)
+            self.assertEqual(self.storage.get_expiry("key"), 1010.0)
+
+        with patch("app.main.services.rate_limit_storage.time.time", return_value=1011.0):
+            self.assertEqual(self.storage.get("key"), 0)
+            self.assertEqual(self.storage.incr("key", 10), 1)
+
+    def test_reset_clears_everything(self):
+        self.storage.incr("key", 10)
+        MovingWindowRateLimiter(self.storage).hit(self.limit, "ip")
+
+        self.assertEqual(self.storage.reset(), 2)
+        self.assertEqual(self.storage.get("key"), 0)
+
+    def test_counters_are_shared_with_forked_workers(self):
+        limiter = MovingWindowRateLimiter(self.storage)
+        limiter.hit(self.limit, "ip")
+        limiter.hit(self.limit, "ip")
+
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        for _ in range(2):
+            process = context.Process(
+                target=hit_from_another_process, args=(self.uri, "3 per minute", "ip", queue)
+            )
+            process.start()
+            process.join()
+
+        self.assertEqual(sorted([queue.get(), queue.get()]), [False, True])
+
+
+class TestCountMinSketchStorage(unittest.TestCase):
+    def setUp(self) -> None:
+        self.storage = storage_from_string("sketch://?width=1024&depth=4")
+        self.limiter = SlidingWindowCounterRateLimiter(self.storage)
+        self.limit = parse("3 per minute")
+
+    def test_sketch_scheme_is_registered(self):
+        self.assertIsInstance(self.storage, CountMinSketchStorage)
+        self.assertEqual((self.storage.width, self.storage.depth), (1024, 4))
+
+    def test_invalid_size_is_rejected(self):
+        self.assertRaises(ConfigurationError, storage_from_string, "sketch://?depth=0")
+
+    def test_limits_each_key(self):
+        hits = [self.limiter.hit(self.limit, "ip") for _ in range(4)]
+
+        self.assertEqual(hits, [True, True, True, False])
+        self.assertTrue(self.limiter.hit(self.limit, "another-ip"))
+
+    def test_previous_window_is_weighted_by_its_overlap(self):
+        with patch("app.main.services.rate_limit_storage.time.time", return_value=6000.0):
+            for _ in range(3):
+                self.limiter.hit(self.limit, "ip")
+
+        with patch("app.main.services.rate_limit_storage.time.time", return_value=6080.0):
+            # Two thirds of the previous window's 3 hits still count
+            self.assertEqual(
+                [self.limiter.hit(self.limit, "ip"), self.limiter.hit(self.limit, "ip")], [True, False]
+            )
+
+    def test_counts_are_never_underestimated(self):
+        storage = CountMinSketchStorage("sketch://?width=16&depth=2")
+        with patch("app.main.services.rate_limit_storage.time.time", return_value=6000.0):
+            for key in range(200):
+                for _ in range(key % 3 + 1):
+                    storage.acquire_sliding_window_entry(f"ip-{key}", 1000, 60)
+
+            estimates = [storage.get_sliding_window(f"ip-{key}", 60)[2] for key in range(200)]
+
+        self.assertTrue(all(estimate >= key % 3 + 1 for key, estimate in enumerate(estimates)))
+
+    def test_memory_does_not_grow_with_distinct_keys(self):
+        for key in range(5000):
+            self.storage.acquire_sliding_window_entry(f"ip-{key}", 3, 60)
+
+        windows = self.storage.windows[60]
+        self.assertEqual(len(self.storage.windows), 1)
+        self.assertEqual(len(windows.current), 1024 * 4)
+        self.assertEqual(len(windows.previous), 1024 * 4)
+
+    def test_clearing_a_key_logs_a_warning(self):
+        self.limiter.hit(self.limit, "ip")
+
+        with self.assertLogs("app.main.services.rate_limit_storage", "WARNING"):
+            self.limiter.clear(self.limit, "ip")
+
+    def test_other_strategies_are_rejected(self):
+        limiter = FixedWindowRateLimiter(self.storage)
+
+        self.assertRaisesRegex(ConfigurationError, "sliding-window-counter", limiter.hit, self.limit, "ip")
+
+
+class TestRedisStorage(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = fakeredis.FakeServer()
+        self.limit = parse("3 per minute")
+
+    def redis_storage(self):
+        return storage_from_string(
+            "redis://localhost:6379",
+            connection_pool=fakeredis.FakeRedis(server=self.server).connection_pool,
+        )
+
+    def test_moving_window_is_shared_between_replicas(self):
+        limiter = MovingWindowRateLimiter(self.redis_storage())
+        other_limiter = MovingWindowRateLimiter(self.redis_storage())
+
+        hits = [limiter.hit(self.limit, "ip"), other_limiter.hit(self.limit, "ip"),
+                limiter.hit(self.limit, "ip"), other_limiter.hit(self.limit, "ip")]
+
+        self.assertEqual(hits, [True, True, True, False])
+
+
+class TestLimiterStorageConfig(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def create_worker_app(self, storage_uri: str):
+        with patch(
+            "app.main.config.limiter_config.app_config",
+            SimpleNamespace(rate_limit=SimpleNamespace(storage_uri=storage_uri)),
+        ):
+            return create_app(MagicMock(GithubService), True)
+
+    def test_memory_storage_is_the_default(self):
+        limiter = next(iter(create_app(MagicMock(GithubService), True).extensions["limiter"]))
+
+        self.assertEqual(type(limiter.storage).__name__, "MemoryStorage")
+
+    @freeze_time("2024-01-01 12:00:00.5")
+    def test_sketch_storage_can_be_selected(self):
+        app = self.create_worker_app("sketch://")
+        limiter = next(iter(app.extensions["limiter"]))
+
+        status_codes = [app.test_client().get("/").status_code for _ in range(3)]
+
+        self.assertIsInstance(limiter.storage, CountMinSketchStorage)
+        self.assertEqual(status_codes, [200, 200, 429])
+
+    def test_sketch_storage_needs_the_sliding_window_counter_strategy(self):
+        with patch(
+            "app.main.config.limiter_config.app_config",
+            SimpleNamespace(rate_limit=SimpleNamespace(storage_uri="sketch://")),
+        ):
+            self.assertRaises(ConfigurationError, configure_limiter, Flask(__name__), strategy="fixed-window")
+
+    @freeze_time("2024-01-01 12:00:00.5")
+    def test_workers_share_the_rate_limit_through_sqlite(self):
+        storage_uri = f"sqlite:///{os.path.join(self.directory.name, 'rate-limits.db')}"
+        workers = [self.create_worker_app(storage_uri), self.create_worker_app(storage_uri)]
+
+        status_codes = [
+            workers[request % 2].test_client().get("/").status_code for request in range(4)
+        ]
+
+        # "2 per second" applies across both workers rather than to each
+        self.assertEqual(status_codes, [200, 200, 429, 429])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+from unittest.mock import MagicMock
+
+from app.main.services.readiness_service import (
+    DependencyDegraded,
+    DependencyNotReady,
+    ReadinessService,
+)
+
+
+class TestReadinessService(unittest.TestCase):
+    def test_is_not_ready_before_the_first_refresh(self):
+        readiness = ReadinessService({"github": lambda: "ok"})
+
+        self.assertFalse(readiness.is_ready())
+        self.assertEqual(readiness.results, {})
+
+    def test_is_ready_when_every_check_passes(self):
+        readiness = ReadinessService({"github": lambda: "5000 remaining", "oidc_metadata": lambda: "issuer"})
+
+        readiness.refresh()
+
+        self.assertTrue(readiness.is_ready())
+        self.assertEqual(readiness.results["github"].detail, "5000 remaining")
+
+    def test_failing_check_is_recorded(self):
+        def not_ready():
+            raise DependencyNotReady("3 GitHub requests remaining")
+
+        readiness = ReadinessService({"github": not_ready, "oidc_metadata": lambda: "issuer"})
+
+        readiness.refresh()
+
+        self.assertFalse(readiness.is_ready())
+        self.assertFalse(readiness.results["github"].is_ready)
+        self.assertEqual(readiness.results["github"].detail, "3 GitHub requests remaining")
+        self.assertTrue(readiness.results["oidc_metadata"].is_ready)
+
+    def test_degraded_check_stays_ready(self):
+        def degraded():
+            raise DependencyDegraded("3 GitHub requests remaining")
+
+        readiness = ReadinessService({"github": degraded, "oidc_metadata": lambda: "issuer"})
+
+        readiness.refresh()
+
+        self.assertTrue(readiness.is_ready())
+        self.assertTrue(readiness.is_degraded())
+        self.assertTrue(readiness.results["github"].is_degraded)
+        self.assertEqual(readiness.results["github"].detail, "3 GitHub requests remaining")
+
+    def test_unexpected_errors_are_not_ready(self):
+        readiness = ReadinessService({"oidc_metadata": MagicMock(side_effect=ConnectionError("timed out"))})
+
+        readiness.refresh()
+
+        self.assertFalse(readiness.is_ready())
+
+    def test_background_thread_refreshes(self):
+        check = MagicMock(return_value="ok")
+        readiness = ReadinessService({"github": check}, refresh_interval_seconds=60)
+
+        readiness.start()
+        readiness.stop()
+
+        check.assert_called_once()
+        self.assertTrue(readiness.is_ready())
+
+
+if __name__ == "__main__":
+    unittest.main()
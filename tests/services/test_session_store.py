@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+
+import fakeredis
+
+from app.main.services.session_store import (
+    MemorySessionStore,
+    RedisSessionStore,
+    SessionStore,
+    SQLiteSessionStore,
+    session_store_from_uri,
+)
+
+
+class TestSessionStore(unittest.TestCase):
+    def test_stores_must_implement_every_operation(self):
+        class LoadOnlySessionStore(SessionStore):
+            def load(self, sid: str) -> str | None:
+                return None
+
+        self.assertRaises(TypeError, LoadOnlySessionStore)
+
+
+class TestMemorySessionStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = 1000.0
+        self.store = MemorySessionStore(clock=lambda: self.now)
+
+    def test_saved_session_is_loaded(self):
+        self.store.save("sid", '{"a": 1}', 60)
+
+        self.assertEqual(self.store.load("sid"), '{"a": 1}')
+
+    def test_session_expires(self):
+        self.store.save("sid", '{"a": 1}', 60)
+        self.now += 60
+
+        self.assertIsNone(self.store.load("sid"))
+        self.assertEqual(self.store.sessions, {})
+
+    def test_deleted_session_is_not_loaded(self):
+        self.store.save("sid", '{"a": 1}', 60)
+        self.store.delete("sid")
+
+        self.assertIsNone(self.store.load("sid"))
+
+
+class TestSQLiteSessionStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.database_path = os.path.join(self.directory.name, "sessions.db")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_sessions_are_shared_between_workers(self):
+        SQLiteSessionStore(self.database_path).save("sid", '{"a": 1}', 60)
+
+        self.assertEqual(SQLiteSessionStore(self.database_path).load("sid"), '{"a": 1}')
+
+    def test_saving_replaces_the_session(self):
+        store = SQLiteSessionStore(self.database_path)
+        store.save("sid", '{"a": 1}', 60)
+        store.save("sid", '{"a": 2}', 60)
+
+        self.assertEqual(store.load("sid"), '{"a": 2}')
+
+    def test_expired_session_is_not_loaded(self):
+        store = SQLiteSessionStore(self.database_path)
+        store.save("sid", '{"a": 1}', 0)
+
+        self.assertIsNone(store.load("sid"))
+
+    def test_deleted_session_is_not_loaded(self):
+        store = SQLiteSessionStore(self.database_path)
+        store.save("sid", '{"a": 1}', 60)
+        store.delete("sid")
+
+        self.assertIsNone(store.load("sid"))
+
+
+class TestRedisSessionStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = fakeredis.FakeRedis()
+        self.store = RedisSessionStore(self.client)
+
+    def test_saved_session_is_loaded_with_a_ttl(self):
+        self.store.save("sid", '{"a": 1}', 60)
+
+        self.assertEqual(self.store.load("sid"), '{"a": 1}')
+        self.assertEqual(self.client.ttl("join-github:session:sid"), 60)
+
+    def test_deleted_session_is_not_loaded(self):
+        self.store.save("sid", '{"a": 1}', 60)
+        self.store.delete("sid")
+
+        self.assertIsNone(self.store.load("sid"))
+
+
+class TestSessionStoreFromUri(unittest.TestCase):
+    def test_builds_each_store(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertIsInstance(session_store_from_uri("memory://"), MemorySessionStore)
+            self.assertIsInstance(
+                session_store_from_uri(f"sqlite:///{directory}/sessions.db"), SQLiteSessionStore
+            )
+            self.assertIsInstance(session_store_from_uri("redis://localhost:6379/0"), RedisSessionStore)
+
+    def test_rejects_unknown_stores(self):
+        self.assertRaises(ValueError, session_store_from_uri, "memcached://localhost")
+        self.assertRaises(ValueError, session_store_from_uri, "sqlite://")
+
+
+if __name__ == "__main__":
+    unittest.main()
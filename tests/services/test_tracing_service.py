@@ -0,0 +1,37 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.main.services.tracing_service import child_span
+
+
+class TestChildSpan(unittest.TestCase):
+    def test_does_nothing_outside_a_transaction(self):
+        with patch("app.main.services.tracing_service.sentry_sdk.get_current_span", return_value=None):
+            with child_span("http.client", "auth0 token") as span:
+                self.assertIsNone(span)
+
+    def test_adds_a_finished_span_under_the_current_span(self):
+        parent = MagicMock()
+
+        with patch("app.main.services.tracing_service.sentry_sdk.get_current_span", return_value=parent):
+            with child_span("http.client", "auth0 token") as span:
+                pass
+
+        parent.start_child.assert_called_once_with(op="http.client", description="auth0 token")
+        self.assertIs(span, parent.start_child.return_value)
+        span.finish.assert_called_once()
+
+    def test_marks_the_span_as_failed_on_error(self):
+        parent = MagicMock()
+
+        with self.assertRaises(TimeoutError):
+            with child_span("http.client", "github create_invitation", parent):
+                raise TimeoutError()
+
+        span = parent.start_child.return_value
+        span.set_status.assert_called_once_with("internal_error")
+        span.finish.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
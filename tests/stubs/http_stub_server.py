@@ -0,0 +1,70 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubResponse:
+    def __init__(self, status: int = 200, body: bytes = b"{}", headers: dict | None = None, delay: float = 0) -> None:
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+        self.delay = delay
+
+
+class QuietThreadingHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address) -> None:
+        # Clients that time out close the connection mid-response
+        pass
+
+
+class HttpStubServer:
+    """A local HTTP/1.1 server that replays queued responses and records requests.
+
+    Queued responses are served in order per path; once a path's queue is
+    empty the last response is repeated.
+    """
+
+    def __init__(self) -> None:
+        self.responses: dict[str, list[StubResponse]] = {}
+        self.requests: list[tuple[str, str, int]] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def handle_request(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                stub.requests.append((self.command, self.path, self.client_address[1]))
+                queue = stub.responses.get(self.path) or [StubResponse(404)]
+                response = queue.pop(0) if len(queue) > 1 else queue[0]
+                time.sleep(response.delay)
+                self.send_response(response.status)
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(response.body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(response.body)
+
+            do_GET = do_POST = do_HEAD = do_PUT = do_DELETE = handle_request
+
+        self.server = QuietThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def queue(self, path: str, *responses: StubResponse) -> None:
+        self.responses[path] = list(responses)
+
+    def __enter__(self) -> "HttpStubServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.server.shutdown()
+        self.server.server_close()
@@ -2,6 +2,7 @@ import os
 import unittest
 from unittest.mock import patch
 from app.main.config.app_config import __get_env_var_as_boolean as get_env_var_as_boolean
+from app.main.config.app_config import __get_env_var_as_rates as get_env_var_as_rates
 
 
 class TestGetEnvVarAsBoolean(unittest.TestCase):
@@ -22,5 +23,24 @@ class TestGetEnvVarAsBoolean(unittest.TestCase):
         self.assertEqual(response, False)
 
 
+class TestGetEnvVarAsRates(unittest.TestCase):
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_returns_the_defaults_when_unset(self):
+        response = get_env_var_as_rates("SENTRY_ROUTE_TRACES_SAMPLE_RATES", {"join_route.send_invitation": 1.0})
+        self.assertEqual(response, {"join_route.send_invitation": 1.0})
+
+    @patch.dict(os.environ, {"SENTRY_ROUTE_TRACES_SAMPLE_RATES": "join_route.send_invitation=0.5, main.index=0,bad"}, clear=True)
+    def test_overrides_and_adds_to_the_defaults(self):
+        response = get_env_var_as_rates(
+            "SENTRY_ROUTE_TRACES_SAMPLE_RATES",
+            {"join_route.send_invitation": 1.0, "auth_routes.callback": 1.0},
+        )
+        self.assertEqual(
+            response,
+            {"join_route.send_invitation": 0.5, "auth_routes.callback": 1.0, "main.index": 0.0},
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
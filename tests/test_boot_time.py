@@ -0,0 +1,19 @@
+import unittest
+
+from benchmarks.boot_time import DEFERRED_MODULES, boot_gunicorn, boot_once
+
+
+class TestBootTime(unittest.TestCase):
+    def test_slow_optional_modules_are_not_imported_at_boot(self):
+        result, _ = boot_once()
+
+        for module in DEFERRED_MODULES:
+            self.assertNotIn(module, result["modules"])
+        self.assertIn("app.main.services.github_service", result["modules"])
+
+    def test_gunicorn_boots_with_the_image_settings(self):
+        self.assertIsNone(boot_gunicorn())
+
+
+if __name__ == "__main__":
+    unittest.main()
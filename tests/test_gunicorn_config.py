@@ -0,0 +1,89 @@
+import importlib
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, mock_open, patch
+
+from app.main.config import gunicorn_config
+from app.main.config.gunicorn_config import (
+    available_cpus,
+    select_worker_class,
+    size_workers,
+)
+
+
+class TestWorkerSizing(unittest.TestCase):
+    def test_sync_workers_are_sized_from_cpus(self):
+        self.assertEqual(size_workers("sync", 2, 0, 4), (5, 1))
+
+    def test_gthread_workers_have_threads(self):
+        self.assertEqual(size_workers("gthread", 2, 0, 4), (3, 4))
+
+    def test_gevent_workers_have_one_thread(self):
+        self.assertEqual(size_workers("gevent", 2, 0, 4), (3, 1))
+
+    def test_configured_workers_are_used(self):
+        self.assertEqual(size_workers("gthread", 8, 2, 4), (2, 4))
+
+
+class TestWorkerClass(unittest.TestCase):
+    def test_unknown_worker_class_uses_gthread(self):
+        self.assertEqual(select_worker_class("eventlet"), "gthread")
+
+    @patch("app.main.config.gunicorn_config.importlib.util.find_spec", return_value=None)
+    def test_gevent_falls_back_to_gthread_when_not_installed(self, _):
+        self.assertEqual(select_worker_class("gevent"), "gthread")
+
+    @patch("app.main.config.gunicorn_config.importlib.util.find_spec", return_value=MagicMock())
+    def test_gevent_is_used_when_installed(self, _):
+        self.assertEqual(select_worker_class("gevent"), "gevent")
+
+
+class TestAvailableCpus(unittest.TestCase):
+    @patch("builtins.open", mock_open(read_data="150000 100000\n"))
+    def test_cgroup_quota_is_rounded_up(self):
+        self.assertEqual(available_cpus(), 2)
+
+    @patch("app.main.config.gunicorn_config.os.sched_getaffinity", return_value={0, 1, 2})
+    @patch("builtins.open", mock_open(read_data="max 100000\n"))
+    def test_unlimited_quota_uses_cpu_affinity(self, _):
+        self.assertEqual(available_cpus(), 3)
+
+
+class TestServerHooks(unittest.TestCase):
+    @patch("app.main.config.gunicorn_config.gc.freeze")
+    def test_heap_is_frozen_before_forking(self, mock_freeze):
+        gunicorn_config.pre_fork(MagicMock(), MagicMock())
+
+        mock_freeze.assert_called_once()
+
+    @patch("app.main.config.background_tasks_config.configure_background_tasks")
+    def test_background_tasks_start_in_each_worker(self, mock_configure_background_tasks):
+        worker = MagicMock()
+
+        gunicorn_config.post_worker_init(worker)
+
+        mock_configure_background_tasks.assert_called_once_with(worker.wsgi)
+
+    def test_metrics_directory_is_emptied(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "metrics")
+            os.makedirs(path)
+            open(os.path.join(path, "counter_123.db"), "w").close()
+
+            gunicorn_config.prepare_metrics_directory(path)
+
+            self.assertEqual(os.listdir(path), [])
+
+    def test_metrics_directory_is_created_before_the_app_is_imported(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "metrics")
+
+            with patch.dict(os.environ, {"PROMETHEUS_MULTIPROC_DIR": path}):
+                importlib.reload(gunicorn_config)
+
+            self.assertTrue(os.path.isdir(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
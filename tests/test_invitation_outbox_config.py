@@ -0,0 +1,29 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.app import create_app
+from app.main.config.app_config import app_config
+from app.main.services.github_service import GithubService
+from app.main.services.invitation_outbox_service import InvitationOutbox
+
+
+class TestInvitationOutboxConfig(unittest.TestCase):
+    def create_app(self, database_path: str | None):
+        with patch.object(app_config.invitation_outbox, "enabled", True), \
+                patch.object(app_config.invitation_outbox, "database_path", database_path):
+            return create_app(MagicMock(GithubService), False, False)
+
+    def test_needs_a_database_path_when_enabled(self):
+        self.assertRaisesRegex(ValueError, "INVITATION_OUTBOX_DATABASE_PATH", self.create_app, None)
+
+    def test_uses_the_configured_database_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            app = self.create_app(os.path.join(directory, "outbox.db"))
+
+            self.assertIsInstance(app.invitation_outbox, InvitationOutbox)
+
+
+if __name__ == "__main__":
+    unittest.main()
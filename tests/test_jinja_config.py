@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from flask import Flask
+from jinja2 import Environment
+
+from app.app import create_app
+from app.main.config.jinja_config import configure_jinja, warm_up_templates
+from app.main.services.github_service import GithubService
+
+
+class TestJinjaBytecodeCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.config = patch(
+            "app.main.config.jinja_config.app_config",
+            SimpleNamespace(
+                phase_banner_text=None,
+                jinja=SimpleNamespace(bytecode_cache_directory=self.directory.name),
+            ),
+        )
+        self.config.start()
+        self.addCleanup(self.config.stop)
+
+    def create_app(self) -> Flask:
+        app = Flask("app")
+        configure_jinja(app)
+        return app
+
+    def test_compiled_templates_are_written_to_the_cache(self):
+        warm_up_templates(self.create_app())
+
+        self.assertTrue(os.listdir(self.directory.name))
+
+    def test_templates_are_loaded_from_the_cache(self):
+        warm_up_templates(self.create_app())
+
+        with patch.object(Environment, "compile", wraps=Environment.compile, autospec=True) as compile:
+            warm_up_templates(self.create_app())
+
+        compile.assert_not_called()
+
+    def test_templates_are_not_parsed_when_loaded_from_the_cache(self):
+        warm_up_templates(self.create_app())
+
+        with patch.object(Environment, "parse", wraps=Environment.parse, autospec=True) as parse:
+            warm_up_templates(self.create_app())
+
+        parse.assert_not_called()
+
+
+class TestWarmUpTemplates(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = create_app(MagicMock(GithubService), False, False)
+
+    def test_compiles_pages_and_the_templates_they_use(self):
+        with self.assertLogs("app.main.config.jinja_config", level="INFO") as logs:
+            compiled = warm_up_templates(self.app)
+
+        self.assertIn("pages/home.html", compiled)
+        self.assertIn("pages/errors/404.html", compiled)
+        self.assertIn("components/base.html", compiled)
+        self.assertIn("govuk_frontend_jinja/template.html", compiled)
+        self.assertIn(f"Compiled {len(compiled)} templates in", logs.output[0])
+
+    def test_is_opt_in_when_creating_the_app(self):
+        with patch("app.app.warm_up_templates") as mock_warm_up_templates:
+            create_app(MagicMock(GithubService), False, False)
+            with patch("app.app.app_config.jinja", SimpleNamespace(
+                bytecode_cache_directory=None, warm_up_templates=True
+            )):
+                app = create_app(MagicMock(GithubService), False, False)
+
+        mock_warm_up_templates.assert_called_once_with(app)
+
+
+if __name__ == "__main__":
+    unittest.main()
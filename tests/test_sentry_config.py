@@ -0,0 +1,42 @@
+import unittest
+from unittest.mock import MagicMock
+
+from werkzeug.test import EnvironBuilder
+
+from app.app import create_app
+from app.main.config.app_config import app_config
+from app.main.config.sentry_config import traces_sampler
+from app.main.services.github_service import GithubService
+
+
+class TestTracesSampler(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app(MagicMock(GithubService), False, False)
+
+    def sample_rate(self, path: str, method: str = "GET") -> float:
+        environ = EnvironBuilder(path=path, method=method).get_environ()
+        return traces_sampler(
+            {"wsgi_environ": environ},
+            self.app.fast_path,
+            app_config.sentry.traces_sample_rate,
+            app_config.sentry.route_traces_sample_rates,
+        )
+
+    def test_does_not_trace_assets_probes_or_missing_pages(self):
+        for path in ("/assets/images/favicon.ico", "/healthz", "/readyz", "/does-not-exist"):
+            self.assertEqual(self.sample_rate(path), 0, path)
+
+    def test_always_traces_invitations_and_the_auth0_callback(self):
+        self.assertEqual(self.sample_rate("/join/send-invitation"), 1.0)
+        self.assertEqual(self.sample_rate("/auth/callback", "POST"), 1.0)
+
+    def test_samples_other_routes_at_the_default_rate(self):
+        self.assertEqual(self.sample_rate("/"), 0.1)
+        self.assertEqual(self.sample_rate("/join/submit-email"), 0.1)
+
+    def test_samples_transactions_outside_requests_at_the_default_rate(self):
+        self.assertEqual(traces_sampler({}, self.app.fast_path, 0.25, {"main.index": 1.0}), 0.25)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import pytest
+
+from app.main.validators.email_policy import (
+    DIGITAL_JUSTICE_COHORT,
+    EmailPolicy,
+    email_policy,
+)
+
+POLICY = EmailPolicy(
+    ["justice.gov.uk", "digital.justice.gov.uk", "*.judiciary.uk"],
+    {DIGITAL_JUSTICE_COHORT: ["digital.justice.gov.uk"]},
+)
+
+
+class TestEmailPolicy:
+
+    @pytest.mark.parametrize(
+        argnames="email,expected",
+        argvalues=[
+            ("user@justice.gov.uk", True),
+            ("user@JUSTICE.gov.uk", True),
+            ("user@digital.justice.gov.uk", True),
+            ("user@other.justice.gov.uk", False),
+            ("user@notjustice.gov.uk", False),
+            ("user@judiciary.uk", False),
+            ("user@court.judiciary.uk", True),
+            ("user@a.court.judiciary.uk", True),
+            ("user@example.com", False),
+            ("user@justice.gov.uk@example.com", False),
+            ("user", False),
+        ]
+    )
+    def test_is_pre_approved(self, email, expected):
+        assert POLICY.classify(email).is_pre_approved == expected
+
+    @pytest.mark.parametrize(
+        argnames="email,expected",
+        argvalues=[
+            ("user@digital.justice.gov.uk", True),
+            ("user@Digital.Justice.gov.uk", True),
+            ("user@justice.gov.uk", False),
+            ("", False),
+        ]
+    )
+    def test_is_digital_justice(self, email, expected):
+        assert POLICY.classify(email).is_digital_justice == expected
+
+    def test_classification_includes_validity_and_domain(self):
+        classification = POLICY.classify("first.last@Justice.gov.uk")
+
+        assert classification.is_valid
+        assert classification.domain == "justice.gov.uk"
+        assert classification.cohort is None
+
+    def test_invalid_email_is_still_classified_by_domain(self):
+        classification = POLICY.classify("first+last@justice.gov.uk")
+
+        assert not classification.is_valid
+        assert classification.is_pre_approved
+
+    def test_most_specific_wildcard_wins(self):
+        policy = EmailPolicy([], {"wide": ["*.gov.uk"], "narrow": ["*.justice.gov.uk"]})
+
+        assert policy.classify("user@hmcts.justice.gov.uk").cohort == "narrow"
+        assert policy.classify("user@hmrc.gov.uk").cohort == "wide"
+
+    def test_built_from_app_config(self):
+        assert email_policy.classify("user@digital.justice.gov.uk").is_digital_justice
+        assert email_policy.classify("user@yjb.gov.uk").is_pre_approved
@@ -1,5 +1,6 @@
 import unittest
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 from app.app import create_app
 from app.main.services.github_service import GithubService
@@ -51,5 +52,72 @@ class TestCompletedRateLimit(unittest.TestCase):
         self.assertGreaterEqual(request_count, 1)
 
 
+class TestRateLimitPolicies(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app(MagicMock(GithubService), True)
+        self.client = self.app.test_client()
+
+    def status_codes(self, path: str, count: int, **kwargs) -> list[int]:
+        return [self.client.get(path, **kwargs).status_code for _ in range(count)]
+
+    def test_static_assets_are_not_rate_limited(self):
+        self.assertNotIn(429, self.status_codes("/assets/manifest.json", 15))
+
+    def test_robots_txt_is_not_rate_limited(self):
+        self.assertNotIn(429, self.status_codes("/robots.txt", 15))
+
+    def test_invitation_status_is_not_rate_limited(self):
+        self.assertNotIn(429, self.status_codes("/join/invitation-status/job-id", 15))
+
+    def test_send_invitation_has_a_strict_limit(self):
+        self.assertEqual(self.status_codes("/join/send-invitation", 4)[-1], 429)
+
+    def test_auth_callback_has_a_strict_limit(self):
+        self.assertEqual(self.status_codes("/auth/callback", 6)[-1], 429)
+
+    def test_rate_limited_requests_get_the_generic_page(self):
+        for _ in range(4):
+            response = self.client.get("/join/send-invitation")
+
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("You have made a lot of requests in a short time", response.get_data(as_text=True))
+        self.assertNotIn("GitHub invitations", response.get_data(as_text=True))
+
+    def test_forwarded_for_header_is_ignored_without_trusted_proxies(self):
+        self.status_codes("/join/send-invitation", 3, headers={"X-Forwarded-For": "192.0.2.1"})
+
+        status_codes = self.status_codes("/join/send-invitation", 1, headers={"X-Forwarded-For": "192.0.2.2"})
+
+        self.assertEqual(status_codes, [429])
+
+
+class TestRateLimitBehindProxy(unittest.TestCase):
+    def setUp(self):
+        with patch(
+            "app.app.app_config.rate_limit",
+            SimpleNamespace(storage_uri="memory://", trusted_proxy_count=1),
+        ):
+            self.app = create_app(MagicMock(GithubService), True)
+        self.client = self.app.test_client()
+
+    def send_invitation(self, forwarded_for: str) -> int:
+        return self.client.get(
+            "/join/send-invitation", headers={"X-Forwarded-For": forwarded_for}
+        ).status_code
+
+    def test_clients_behind_the_proxy_are_limited_separately(self):
+        for _ in range(3):
+            self.send_invitation("192.0.2.1")
+
+        self.assertEqual(self.send_invitation("192.0.2.1"), 429)
+        self.assertNotEqual(self.send_invitation("192.0.2.2"), 429)
+
+    def test_only_the_address_added_by_the_trusted_proxy_is_used(self):
+        for _ in range(3):
+            self.send_invitation("198.51.100.7, 192.0.2.1")
+
+        self.assertEqual(self.send_invitation("203.0.113.9, 192.0.2.1"), 429)
+
+
 if __name__ == "__main__":
     unittest.main(argv=["first-arg-is-ignored"], exit=False)